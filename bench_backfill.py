@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Before/after report for the updater's backfill of missing weeks:
+
+  sequential:  one week after another (FETCH_WORKERS = 1)
+  pool:        fetch_pool.map_in_order with FETCH_WORKERS weeks at a time
+
+against a local Canvas stand-in (no cookies or network needed). The stand-in
+answers the same three requests per report as Canvas - conversion report form
+POST + spreadsheet GET, marketing ROI GET - after a fixed delay, and like
+Canvas it keeps the last submitted report form per PHPSESSID, so interleaved
+report requests would return the wrong week. The "no report lock" row shows
+what the pool could do if that weren't so (its results don't match). The last
+two rows run the pool through a fresh response cache (response_cache.py) and
+local report CSVs (data_fetcher.cached_report): the first run fills them, the
+second is a re-run of a backfill of closed weeks.
+
+Usage: python3 bench_backfill.py [weeks] [latency_seconds]   (default: 8 0.5)
+"""
+import json
+import sys
+import tempfile
+import threading
+import time
+from contextlib import nullcontext
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from http.cookies import SimpleCookie
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+# Add the updater directory to the path (fetchers + backfill helpers)
+sys.path.insert(0, str(Path(__file__).parent / "updater"))
+
+import data_fetcher
+import fetch_pool
+from response_cache import ResponseCache
+from updater_utils import fetch_week_reports, week_strings
+
+REPORTS = ["calls_inbound", "calls_outbound", "roi"]
+
+
+class CanvasStandIn(BaseHTTPRequestHandler):
+    """Conversion report + marketing ROI pages, each answered after `latency` seconds."""
+    latency = 0.5
+    forms = {}  # PHPSESSID -> last submitted report form
+
+    def log_message(self, *args):
+        pass
+
+    def _session(self):
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        return cookie["PHPSESSID"].value if "PHPSESSID" in cookie else None
+
+    def _reply(self, body: str, content_type: str):
+        time.sleep(self.latency)
+        data = body.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        form = parse_qs(self.rfile.read(int(self.headers["Content-Length"])).decode())
+        self.forms[self._session()] = form
+        self._reply("<html>report ready</html>", "text/html")
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path.endswith("report_as_spreadsheet.html"):
+            form = self.forms.get(self._session(), {})
+            week = form.get("start_date", ["?"])[0]
+            outbound = "include_homeshow" in form
+            seed = sum(map(ord, week)) + (7 if outbound else 0)
+            rows = [
+                f"Rep {i},{seed % 50 + i},{(seed + i) % 100}%,{seed % 30 + i},{(seed * i) % 100}%,{week}"
+                for i in range(1, 6)
+            ]
+            header = "Call Center Rep,Inbound Lead Count,Inbound Help Rate,Outbound Communication Count,Outbound Help Rate,Week"
+            self._reply("\n".join([header] + rows), "text/csv")
+        else:
+            params = parse_qs(url.query)
+            week = params.get("sd", ["?"])[0]
+            amount = sum(map(ord, week)) * 10
+            self._reply(
+                "<table><tr><th rowspan='2'>Grand Totals</th><th>Amount Invested</th><th>Revenue</th></tr>"
+                f"<tr><td>${amount:,}.00</td><td>${amount * 3:,}.00</td></tr></table>",
+                "text/html",
+            )
+
+
+def start_stand_in(latency: float) -> str:
+    CanvasStandIn.latency = latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CanvasStandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def point_fetchers_at(base: str, tmp_dir: Path):
+    """Send the Canvas fetchers to the stand-in (cookie file + URLs)."""
+    cookie_path = tmp_dir / "canvas_cookies.json"
+    cookie_path.write_text(json.dumps([{"name": "PHPSESSID", "value": "bench"}, {"name": "username", "value": "bench"}]))
+    data_fetcher.COOKIE_PATH = cookie_path
+    data_fetcher.FORM_URL = base + "/scripts/lead-to-appointment-conversion/index.html"
+    data_fetcher.CSV_URL = base + "/scripts/report_as_spreadsheet.html?report=report_lead_to_appointment_conversion"
+    data_fetcher.ROI_URL = base + "/scripts/marketing_roi.html"
+
+
+def backfill(weeks: list, workers: int, data_dir: Path, cache: ResponseCache = None) -> list:
+    """The updater's fetch step for `weeks` (every report missing), quietly."""
+    tasks = [(*week_strings(week), REPORTS) for week in weeks]
+    session = data_fetcher.get_canvas_client()
+    session.cache = cache
+    data_fetcher.REPORT_DATA_DIR = data_dir
+    out = sys.stdout
+    sys.stdout = open("/dev/null", "w")  # fetch_roi prints a page of debug output per week
+    try:
+        return fetch_pool.map_in_order(lambda task: fetch_week_reports(*task, session), tasks, workers)
+    finally:
+        sys.stdout.close()
+        sys.stdout = out
+
+
+def same_results(a: list, b: list) -> bool:
+    return all(
+        x.keys() == y.keys() and all(x[k].equals(y[k]) for k in x)
+        for x, y in zip(a, b)
+    )
+
+
+def main():
+    n_weeks = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.5
+    last = date.today() - timedelta(days=(date.today().weekday() + 1) % 7 + 7)
+    weeks = [last - timedelta(weeks=i) for i in range(n_weeks)][::-1]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        point_fetchers_at(start_stand_in(latency), tmp_dir)
+
+        requests_per_week = 2 * 2 + 1
+        print("=" * 84)
+        print(f"BACKFILL OF {n_weeks} WEEKS: {n_weeks * requests_per_week} Canvas requests, {latency:.2f}s each (local stand-in)")
+        print(f"pool: {fetch_pool.FETCH_WORKERS} workers, {fetch_pool.CANVAS_REQUESTS_PER_SECOND:g} request starts/s per host")
+        print("=" * 84)
+        print(f"{'':<34}{'wall s':>10}{'speedup':>10}{'same':>8}")
+
+        start = time.perf_counter()
+        baseline = backfill(weeks, workers=1, data_dir=tmp_dir / "Data-sequential")
+        sequential_s = time.perf_counter() - start
+        print(f"{'sequential':<34}{sequential_s:>10.1f}{'1.00x':>10}{'-':>8}")
+
+        runs = [("pool (report POST+GET locked)", data_fetcher._report_lock), ("pool, no report lock", nullcontext())]
+        report_lock = data_fetcher._report_lock
+        for i, (label, lock) in enumerate(runs):
+            CanvasStandIn.forms.clear()
+            data_fetcher._report_lock = lock
+            start = time.perf_counter()
+            results = backfill(weeks, workers=fetch_pool.FETCH_WORKERS, data_dir=tmp_dir / f"Data-pool-{i}")
+            elapsed = time.perf_counter() - start
+            same = "yes" if same_results(baseline, results) else "NO"
+            print(f"{label:<34}{elapsed:>10.1f}{f'{sequential_s / elapsed:.2f}x':>10}{same:>8}")
+        data_fetcher._report_lock = report_lock
+
+        cache = ResponseCache(tmp_dir / "canvas_cache")
+        for label in ("pool, caches cold", "pool, caches warm (re-run)"):
+            CanvasStandIn.forms.clear()
+            run_mark = data_fetcher.get_canvas_client().mark()
+            start = time.perf_counter()
+            results = backfill(weeks, workers=fetch_pool.FETCH_WORKERS, data_dir=tmp_dir / "Data-cached", cache=cache)
+            elapsed = time.perf_counter() - start
+            same = "yes" if same_results(baseline, results) else "NO"
+            print(f"{label:<34}{elapsed:>10.1f}{f'{sequential_s / elapsed:.2f}x':>10}{same:>8}")
+            print(f"{'':<4}🌐 {data_fetcher.get_canvas_client().timing_summary(run_mark)}")
+
+    print("\nThe report lock is what ships: Canvas keeps the submitted report form in the PHP session,")
+    print("so only the ROI requests (and all parsing) overlap with the reports.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Before/after report for category (dictionary) encoding of the repetitive
+Master_Data columns: memory per dataset and week/mode filter latency.
+
+Usage: python3 bench_category_encoding.py [scale]
+  scale: repeat each dataset N times to simulate a longer history (default 1)
+"""
+import sys
+import timeit
+from pathlib import Path
+
+import pandas as pd
+
+# Add the dashboard directory to the path (shared Master_Data storage helpers)
+sys.path.insert(0, str(Path(__file__).parent / "dashboard"))
+
+from master_data import (
+    CATEGORY_DATASETS, MASTER_DATA_DIR, normalize, normalize_numeric_columns, normalize_week_columns,
+)
+
+
+def load_plain(path):
+    """Dataset as it was loaded before category encoding (plain str / date objects)"""
+    df = pd.read_parquet(path)
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype(object)
+    df = normalize_week_columns(df)
+    return normalize_numeric_columns(df, path.stem)
+
+
+def scaled(df, scale):
+    return pd.concat([df] * scale, ignore_index=True) if scale > 1 else df
+
+
+def filter_week(df, week_start, week_end, mode=None):
+    mask = (df["week_start"] == week_start) & (df["week_end"] == week_end)
+    if mode is not None:
+        mask &= df["mode"] == mode
+    return df[mask]
+
+
+def time_filters(df, weeks, has_mode, repeat=5):
+    """Best-of-N seconds to filter every week once (per week average, in µs)"""
+    def run():
+        for week_start, week_end in weeks:
+            filter_week(df, week_start, week_end, "outbound" if has_mode else None)
+
+    best = min(timeit.repeat(run, number=1, repeat=repeat))
+    return best / max(len(weeks), 1) * 1e6
+
+
+def main():
+    scale = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+
+    print("=" * 78)
+    print(f"CATEGORY ENCODING REPORT (scale x{scale})")
+    print("=" * 78)
+    print(f"{'dataset':<32}{'rows':>8}{'before MB':>11}{'after MB':>10}{'before µs':>10}{'after µs':>10}")
+
+    for dataset in CATEGORY_DATASETS:
+        path = MASTER_DATA_DIR / f"{dataset}.parquet"
+        if not path.exists():
+            continue
+
+        plain = scaled(load_plain(path), scale)
+        encoded = normalize(plain, dataset)
+
+        weeks = list(plain[["week_start", "week_end"]].drop_duplicates().itertuples(index=False))
+        has_mode = "mode" in plain.columns
+
+        before_mb = plain.memory_usage(deep=True).sum() / 1e6
+        after_mb = encoded.memory_usage(deep=True).sum() / 1e6
+        before_us = time_filters(plain, weeks, has_mode)
+        after_us = time_filters(encoded, weeks, has_mode)
+
+        print(
+            f"{dataset:<32}{len(plain):>8}{before_mb:>11.3f}{after_mb:>10.3f}"
+            f"{before_us:>10.0f}{after_us:>10.0f}"
+        )
+
+    print("\nµs = average time to filter one week (week_start + week_end [+ mode]) with boolean masks")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Before/after report for column-projected, lazily loaded datasets in the dashboard:
+time to read the data and the memory it holds.
+
+  before: every dataset file, every column (what each reload used to read)
+  after:  only the datasets/columns declared in DASHBOARD_VIEWS (jobs is never read)
+  mmap:   the same, from the memory-mapped Arrow snapshots (built on the first read)
+
+plus the per-render call center read, all weeks vs. a week-range read of the
+latest week (only that week's parquet row group).
+
+Usage: python3 bench_dataset_loading.py [repeat]
+"""
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+# Add the dashboard directory to the path (dashboard loaders + Master_Data helpers)
+sys.path.insert(0, str(Path(__file__).parent / "dashboard"))
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from master_data import DATASET_FILES, WEEK_COLUMNS, dataset_files, partition_week, week_row_groups
+import dashboard_utils
+from dashboard_utils import DASHBOARD_VIEWS, _frame_bytes, _load_datasets, current_data_version
+
+
+def merge_views(views):
+    """Union of the columns every view asks for, per dataset (None = all columns)."""
+    wanted = {}
+    for view in views.values():
+        for name, columns in view.items():
+            if name in wanted and (wanted[name] is None or columns is None):
+                wanted[name] = None
+            else:
+                wanted[name] = tuple(dict.fromkeys((wanted.get(name) or ()) + tuple(columns or ()))) or None
+    return wanted
+
+
+def row_groups_read(path, weeks):
+    """Row groups of one file a week-range read decodes (partitions outside the range aren't opened)"""
+    week = partition_week(path)
+    if week is not None:
+        return 0 if not weeks[0] <= week <= weeks[1] else pq.ParquetFile(path).metadata.num_row_groups
+    parquet_file = pq.ParquetFile(path)
+    if not pa.types.is_date32(parquet_file.schema_arrow.field("week_start").type):
+        return parquet_file.metadata.num_row_groups
+    return len(week_row_groups(parquet_file, weeks))
+
+
+def measure(version, wanted, repeat, weeks=None):
+    """(best seconds, held MB, peak traced MB) for reading `wanted` once"""
+    weeks = {name: weeks for name in wanted} if weeks else None
+    seconds = min(timeit.repeat(lambda: _load_datasets(version, wanted, weeks), number=1, repeat=repeat))
+
+    tracemalloc.start()
+    frames = _load_datasets(version, wanted, weeks)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    held = sum(_frame_bytes(df) for df in frames.values())
+    return seconds, held / 1e6, peak / 1e6, frames
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    version = current_data_version()
+
+    before = {name: None for name in DATASET_FILES}
+    after = merge_views(DASHBOARD_VIEWS)
+
+    print("=" * 72)
+    print(f"DATASET LOADING REPORT (data version {version}, best of {repeat})")
+    print("=" * 72)
+    print(f"{'':<10}{'datasets':>10}{'columns':>10}{'load ms':>10}{'held MB':>10}{'peak MB':>10}")
+
+    for label, wanted, snapshots in (("before", before, False), ("after", after, False), ("mmap", after, True)):
+        dashboard_utils.USE_SNAPSHOTS = snapshots
+        seconds, held_mb, peak_mb, frames = measure(version, wanted, repeat)
+        columns = sum(len(df.columns) for df in frames.values())
+        print(f"{label:<10}{len(frames):>10}{columns:>10}{seconds * 1e3:>10.1f}{held_mb:>10.3f}{peak_mb:>10.3f}")
+
+    dashboard_utils.USE_SNAPSHOTS = False
+    calls_files = dataset_files("calls")
+    latest = _load_datasets(version, {"calls": WEEK_COLUMNS})["calls"]["week_start"].max()
+    row_groups = sum(pq.ParquetFile(path).metadata.num_row_groups for path in calls_files)
+    touched = sum(row_groups_read(path, (latest, latest)) for path in calls_files)
+
+    print(
+        f"\nCall center read per render (week_calls view, "
+        f"{len(calls_files)} file(s), {row_groups} row group(s))"
+    )
+    for label, weeks, groups in (("all weeks", None, row_groups), (f"{latest}", (latest, latest), touched)):
+        seconds, held_mb, peak_mb, frames = measure(version, DASHBOARD_VIEWS["week_calls"], repeat, weeks)
+        print(
+            f"{label:<12}{len(frames['calls']):>8} rows{groups:>5} rg"
+            f"{seconds * 1e3:>10.1f} ms{held_mb:>10.3f} MB{peak_mb:>10.3f} MB peak"
+        )
+
+    skipped = sorted(set(before) - set(after))
+    print(f"\nNot loaded into the dashboard cache: {', '.join(skipped) or '-'}")
+    print("held MB = DataFrame.memory_usage(deep=True), peak MB = tracemalloc peak while reading")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Before/after report for the per-week call center tables in update_dashboard:
+
+  pandas: WeekStore slice + drop + "nan%" filter + to_dict("records")
+  arrow:  ArrowWeekStore zero-copy Table.slice + Table.to_pylist
+
+at 1x, 10x and 100x today's call center rows (the history is repeated further
+back in time, so every copy is its own set of weeks).
+
+Usage: python3 bench_week_slicing.py [scale ...]   (default: 1 10 100)
+"""
+import math
+import sys
+import timeit
+from datetime import timedelta
+from pathlib import Path
+
+import pandas as pd
+
+# Add the dashboard directory to the path (dashboard loaders + Master_Data helpers)
+sys.path.insert(0, str(Path(__file__).parent / "dashboard"))
+
+from master_data import WEEK_COLUMNS, normalize, read_dataset, to_arrow
+from dashboard_utils import (
+    CALLS_KEY_COLUMNS, CALLS_TABLE_COLUMNS, ArrowWeekStore, WeekStore, _frame_bytes,
+)
+
+# Weeks rendered per measurement (the most recent ones)
+RENDER_WEEKS = 20
+HELP_RATE_COLUMNS = {"inbound": "Inbound Help Rate (%)", "outbound": "Outbound Help Rate (%)"}
+
+
+def scaled(df, scale):
+    """df plus scale-1 copies of it, each shifted back by the length of the history"""
+    if scale == 1:
+        return df
+    df = df.assign(**{col: df[col].astype(object) for col in WEEK_COLUMNS})
+    span = timedelta(weeks=(df["week_start"].max() - df["week_start"].min()).days // 7 + 1)
+    copies = [
+        df.assign(**{col: df[col].map(lambda d, k=k: d - span * k) for col in WEEK_COLUMNS})
+        for k in range(scale)
+    ]
+    return normalize(pd.concat(copies, ignore_index=True), "all_call_center_data")
+
+
+def pandas_rows(store, start, end, mode):
+    """update_dashboard's call center table before: a pandas slice per render"""
+    df = store.week("calls", start, end, mode=mode).drop(columns=list(CALLS_KEY_COLUMNS))
+    df = df[df[HELP_RATE_COLUMNS[mode]] != "nan%"]
+    return df.to_dict("records")
+
+
+def arrow_rows(store, start, end, mode):
+    """update_dashboard's call center table now: records straight from an Arrow slice"""
+    rows = store.records("calls", start, end, mode=mode, drop=CALLS_KEY_COLUMNS)
+    return [row for row in rows if row[HELP_RATE_COLUMNS[mode]] != "nan%"]
+
+
+def same_records(a, b):
+    """Equal once NaN (pandas) and None (Arrow null) are treated alike - both are JSON null"""
+    def clean(rows):
+        return [
+            {k: None if isinstance(v, float) and math.isnan(v) else v for k, v in row.items()}
+            for row in rows
+        ]
+    return clean(a) == clean(b)
+
+
+def best_ms(fn, repeat=5, number=1):
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number * 1e3
+
+
+def main():
+    scales = [int(arg) for arg in sys.argv[1:]] or [1, 10, 100]
+    calls_df = read_dataset("calls", columns=CALLS_TABLE_COLUMNS)
+
+    print("=" * 84)
+    print("PER-WEEK CALL CENTER TABLES: pandas vs. Arrow")
+    print("=" * 84)
+    print(
+        f"{'scale':<7}{'rows':>9}{'weeks':>7}"
+        f"{'build ms':>18}{'held MB':>18}{'per render µs':>20}{'same':>6}"
+    )
+    print(f"{'':<23}{'pandas':>9}{'arrow':>9}{'pandas':>9}{'arrow':>9}{'pandas':>10}{'arrow':>10}")
+
+    for scale in scales:
+        df = scaled(calls_df, scale)
+        table = to_arrow(df)
+
+        pandas_build = best_ms(lambda: WeekStore({"calls": df}), repeat=3)
+        arrow_build = best_ms(lambda: ArrowWeekStore({"calls": table}), repeat=3)
+        pandas_store = WeekStore({"calls": df})
+        arrow_store = ArrowWeekStore({"calls": table})
+
+        weeks = pandas_store.weeks("calls")[-RENDER_WEEKS:]
+
+        def render(rows, store):
+            return lambda: [rows(store, start, end, mode) for start, end in weeks for mode in HELP_RATE_COLUMNS]
+
+        pandas_us = best_ms(render(pandas_rows, pandas_store)) * 1e3 / len(weeks)
+        arrow_us = best_ms(render(arrow_rows, arrow_store)) * 1e3 / len(weeks)
+        same = all(
+            same_records(pandas_rows(pandas_store, start, end, mode), arrow_rows(arrow_store, start, end, mode))
+            for start, end in weeks
+            for mode in HELP_RATE_COLUMNS
+        )
+
+        print(
+            f"{f'{scale}x':<7}{len(df):>9}{len(pandas_store.weeks('calls')):>7}"
+            f"{pandas_build:>9.1f}{arrow_build:>9.1f}"
+            f"{_frame_bytes(pandas_store) / 1e6:>9.2f}{_frame_bytes(arrow_store) / 1e6:>9.2f}"
+            f"{pandas_us:>10.0f}{arrow_us:>10.0f}{'yes' if same else 'NO':>6}"
+        )
+
+    print(f"\nper render = inbound + outbound table records for one week (average over the last {RENDER_WEEKS} weeks)")
+    print("build = sort + week index, once per data version; held MB = pandas deep memory / Arrow buffers")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Compact the week-partitioned Master_Data datasets.
+
+Every week is its own file (Master_Data/<dataset>/week_start=YYYY-MM-DD/),
+which keeps weekly updates cheap but means a long history is hundreds of
+small files. This folds all but the most recent weeks of each dataset into
+<dataset>/compacted.parquet (one row group per week, so reading a single week
+still skips the rest). Recent weeks stay as partitions so re-fetching or
+removing them is still a single-file change.
+
+Usage: python3 compact_master_data.py [keep_weeks] [master_data_dir]
+  keep_weeks: recent weeks to leave as partitions (default 13)
+"""
+import sys
+from pathlib import Path
+
+# Add the dashboard directory to the path (shared Master_Data storage helpers)
+sys.path.insert(0, str(Path(__file__).parent / "dashboard"))
+
+from master_data import (
+    COMPACT_KEEP_WEEKS, MASTER_DATA_DIR, PARTITIONED_DATASETS, compact_dataset, dataset_dir,
+    dataset_files, write_manifest,
+)
+
+
+def main():
+    keep_weeks = int(sys.argv[1]) if len(sys.argv) > 1 else COMPACT_KEEP_WEEKS
+    master_data_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else MASTER_DATA_DIR
+
+    if not master_data_dir.exists():
+        print(f"❌ Master_Data directory not found at: {master_data_dir}")
+        sys.exit(1)
+
+    print("=" * 60)
+    print(f"COMPACT MASTER_DATA (keeping the last {keep_weeks} week(s) as partitions)")
+    print("=" * 60)
+    print(f"📁 {master_data_dir}")
+
+    compacted = 0
+    for name in PARTITIONED_DATASETS:
+        before = len(dataset_files(name, master_data_dir))
+        if not before:
+            continue
+        weeks = compact_dataset(name, master_data_dir, keep_weeks)
+        after = len(dataset_files(name, master_data_dir))
+        label = dataset_dir(name, master_data_dir).name
+        if weeks:
+            print(f"   🗜️  {label}/: {weeks} week(s) compacted ({before} → {after} files)")
+            compacted += weeks
+        else:
+            print(f"   ✅ {label}/: nothing to compact ({before} file(s))")
+
+    manifest = write_manifest(master_data_dir)
+    print(f"   📋 manifest.json: data version {manifest['version']}")
+
+    print(f"\n🎉 Done! {compacted} week partition(s) compacted.")
+
+
+if __name__ == "__main__":
+    main()
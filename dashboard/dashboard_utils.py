@@ -1,13 +1,32 @@
 # import data_fetcher
+import hashlib
+import io
+import json
 import math
+import os
 import re
+import shutil
+import tempfile
+import threading
+import time
 from datetime import datetime, date, timedelta
 from pathlib import Path
 
 import pandas as pd
 import plotly.graph_objects as go
+from plotly.utils import PlotlyJSONEncoder
+import pyarrow as pa
+import pyarrow.compute as pc
 from dash import dash_table, dcc, html
-from functools import lru_cache
+from functools import lru_cache, reduce
+
+from master_data import (
+    DATASET_FILES, MASTER_DATA_DIR, WEEK_COLUMNS, build_weekly_summary, dataset_files,
+    dataset_mtime, file_sha256, filter_week_range, prior_column, read_dataset_files, read_manifest,
+    read_snapshot, read_table, select_table, snapshot_source, snapshot_table, summary_source_columns,
+    to_arrow, to_week_date, value_column, write_snapshot,
+)
+from master_appointments import APPOINTMENT_KEY, CHANGE_COLUMN, appointment_versions, appointments_as_of
 
 # from data_fetcher import load_jobs_data, download_conversion_report, fetch_roi
 
@@ -18,68 +37,743 @@ def get_file_mtime(path):
     return path.stat().st_mtime if path.exists() else 0
 
 
-@lru_cache(maxsize=10)
-def _load_master_data_cached(calls_mtime, roi_mtime, jobs_mtime):
-    """Internal cached loader that uses file mtimes as cache key."""
-    master_data_dir = Path(__file__).resolve().parent / "Master_Data"
+# How often (seconds) the dashboard looks at Master_Data/manifest.json for a new data version
+MANIFEST_CHECK_SECONDS = 30
+
+# Datasets the dashboard can't run without when they are asked for (the projections files are optional)
+REQUIRED_DATASETS = ("jobs", "calls", "roi")
+
+# Keep the previous data version around for requests that started before a reload
+KEEP_PREVIOUS_VERSION = True
+
+# Read datasets from the memory-mapped Arrow snapshots in Master_Data/snapshots/ (rebuilt
+# from parquet when missing or stale); False = always decode the parquet files
+USE_SNAPSHOTS = True
+
+# Built trend chart figures (JSON), shared by every server worker process on the
+# machine; the least recently used files go past FIGURE_CACHE_MAX_FILES
+FIGURE_CACHE_DIR = Path(os.environ.get("FIGURE_CACHE_DIR", Path(tempfile.gettempdir()) / "aod_dashboard_figures"))
+FIGURE_CACHE_MAX_FILES = 200
+
+# Rendered dashboard-content per (week, data version), shared the same way
+RESPONSE_CACHE_DIR = Path(os.environ.get("RESPONSE_CACHE_DIR", Path(tempfile.gettempdir()) / "aod_dashboard_responses"))
+RESPONSE_CACHE_MAX_FILES = 100
+
+# Every week's dashboard and every trend chart, pre-rendered at deploy time
+# (render_static_dashboard.py) into Master_Data/rendered/ (not in git) and served
+# from there while they match the data version - no pandas or Plotly per request.
+# False = always render
+USE_STATIC_PAYLOADS = True
+STATIC_PAYLOAD_DIR = MASTER_DATA_DIR / "rendered"
+STATIC_INDEX_FILE = "index.json"
+
+# Columns of each dataset the dashboard views read: {view: {dataset: columns}}, None = every column.
+# Only these columns are decoded from the parquet files, and a dataset no view
+# asks for (jobs - removed from the dashboard) is never read at all.
+CALLS_TABLE_COLUMNS = (
+    "Call Center Rep",
+    "Inbound Lead Count", "Inbound Booked Count", "Inbound Help Rate (%)", "Inbound Rate Value",
+    "Outbound Call Count", "Outbound Communication Count", "Outbound Booked Count",
+    "Outbound Help Rate (%)", "Outbound Proxy Value", "Total Booked",
+    "week_start", "week_end", "mode",
+)
+# Week/mode keys of the call center rows (not shown in the tables)
+CALLS_KEY_COLUMNS = ("week_start", "week_end", "mode")
+# Appointments are a change log keyed by ID (see master_appointments.py)
+APPOINTMENT_COLUMNS = ("Location", "Start Date and Time", "week_start", "week_end", APPOINTMENT_KEY, CHANGE_COLUMN)
+
+DASHBOARD_VIEWS = {
+    # Week dropdown
+    "week_options": {"calls": WEEK_COLUMNS},
+    # update_dashboard: call center tables + cards, read for the selected week only (week-range read)
+    "week_calls": {"calls": CALLS_TABLE_COLUMNS},
+    # update_dashboard: rankings, pipeline and summary cards. Read in full - the
+    # trend/projection charts need the whole history of these anyway
+    "week_store": {
+        "rpa": None,
+        "sales": None,
+        # (appointments: the pipeline as of the week comes from load_appointment_versions)
+        "summary": None,
+    },
+    # Appointment forecast / revenue projection charts + pipeline card
+    "projections": {"rpa": None, "sales": None, "appts": APPOINTMENT_COLUMNS},
+    # Call center / marketing / finance line charts
+    "summary": {"summary": None},
+}
+
+_data_version_state = {"version": None, "checked_at": 0.0}
+
+
+class StaleManifestError(Exception):
+    """The parquet files on disk don't match manifest.json (an update is mid-write)."""
+
+
+def _legacy_data_version():
+    """Data version for Master_Data written before manifests existed: file counts + mtimes per dataset."""
+    parts = [
+        f"{len(dataset_files(name, MASTER_DATA_DIR))}@{dataset_mtime(name, MASTER_DATA_DIR)}"
+        for name in DATASET_FILES
+    ]
+    return "mtimes:" + ",".join(parts)
+
 
-    jobs_path  = master_data_dir / "all_jobs_data.parquet"
-    calls_path = master_data_dir / "all_call_center_data.parquet"
-    roi_path   = master_data_dir / "all_roi_data.parquet"
+def current_data_version() -> str:
+    """
+    Version id of the data on disk. manifest.json is read at most once every
+    MANIFEST_CHECK_SECONDS, so callbacks don't stat() the parquet files per request.
+    """
+    now = time.monotonic()
+    if (
+        _data_version_state["version"] is not None
+        and now - _data_version_state["checked_at"] < MANIFEST_CHECK_SECONDS
+    ):
+        return _data_version_state["version"]
 
-    jobs_df  = pd.read_parquet(jobs_path)
-    calls_df = pd.read_parquet(calls_path)
-    roi_df   = pd.read_parquet(roi_path)
+    manifest = read_manifest(MASTER_DATA_DIR)
+    version = manifest["version"] if manifest else _legacy_data_version()
+    _data_version_state.update(version=version, checked_at=now)
+    return version
 
-    return jobs_df, calls_df, roi_df
 
+def _read_table(path, expected_sha256=None, columns=None, weeks=None):
+    """
+    Read one parquet file as an Arrow table (only `columns`, None = all; only the
+    row groups for `weeks`, None = all), checking the bytes against the manifest
+    hash when there is one.
+    """
+    data = path.read_bytes()
+    if expected_sha256 is not None and file_sha256(data) != expected_sha256:
+        raise StaleManifestError(f"{path.name} does not match manifest.json")
+    return read_table(io.BytesIO(data), columns, weeks)
 
-def load_master_data():
-    """Read and cache the master parquet files. Cache invalidates when files change."""
-    master_data_dir = Path(__file__).resolve().parent / "Master_Data"
 
-    jobs_path  = master_data_dir / "all_jobs_data.parquet"
-    calls_path = master_data_dir / "all_call_center_data.parquet"
-    roi_path   = master_data_dir / "all_roi_data.parquet"
+def _read_snapshot(name, paths, source, columns=None, weeks=None, read_file=None, arrow=False):
+    """
+    Read a dataset from its memory-mapped snapshot. A missing or stale snapshot is
+    rebuilt from the dataset's parquet `paths` first (once per data version; the
+    other workers then map the same file). If it can't be written, the parquet
+    read is used as-is. With `arrow` the (mapped) Arrow table is returned instead
+    of a DataFrame.
+    """
+    def read():
+        if not arrow:
+            return read_snapshot(name, source, MASTER_DATA_DIR, columns, weeks)
+        table = snapshot_table(name, source, MASTER_DATA_DIR)
+        return None if table is None else select_table(table, columns, weeks)
+
+    df = read()
+    if df is not None:
+        return df
+
+    full_df = read_dataset_files(paths, read_file=read_file)
+    try:
+        path = write_snapshot(full_df, name, source, MASTER_DATA_DIR)
+    except OSError as exc:
+        print(f"⚠️  Could not write the {name} snapshot ({exc}) - reading parquet instead")
+        return _project(full_df, columns, weeks)
+    print(f"🗺️  Rebuilt {path.relative_to(MASTER_DATA_DIR)} ({len(full_df)} rows)")
+
+    df = read()
+    # None only if another worker swapped in a snapshot for a newer version meanwhile
+    return df if df is not None else _project(full_df, columns, weeks)
+
+
+def _frame_bytes(obj) -> int:
+    """Deep memory footprint of a DataFrame or Arrow table (or of the ones inside a WeekStore)."""
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(index=True, deep=True).sum())
+    if isinstance(obj, pa.Table):
+        return obj.nbytes
+    # (a plotly Figure's .frames are animation frames, not data - figures count as 0)
+    if isinstance(getattr(obj, "frames", None), dict):
+        return sum(_frame_bytes(df) for df in obj.frames.values())
+    if hasattr(obj, "tables"):
+        return sum(_frame_bytes(table) for table in obj.tables.values())
+    return 0
+
+
+def _covers(loaded, columns) -> bool:
+    """True if a frame read with `loaded` columns has everything `columns` asks for (None = all)."""
+    if loaded is None:
+        return True
+    return columns is not None and set(columns) <= loaded
+
+
+def _covers_weeks(loaded, weeks) -> bool:
+    """True if a frame read for the `loaded` week range has every week in `weeks` (None = all)."""
+    if loaded is None:
+        return True
+    return weeks is not None and loaded[0] <= weeks[0] and weeks[1] <= loaded[1]
+
+
+def _project(df, columns, weeks=None):
+    """Just the requested columns (file order, missing ones skipped) and weeks of a cached frame."""
+    if columns is not None:
+        df = df[[col for col in df.columns if col in columns]]
+    return filter_week_range(df, weeks)
+
+
+class DatasetCache:
+    """
+    Loaded data, keyed by data version.
+
+    Holds exactly the current version (plus the previous one when
+    KEEP_PREVIOUS_VERSION is on, for requests already using it). Older
+    versions are dropped as soon as a new one is stored, instead of waiting
+    to fall out of an LRU. A version only holds the datasets and columns
+    something has asked for; asking for more columns later re-reads that
+    dataset with both sets. Week-range reads are kept next to the all-weeks
+    copy (not merged into it), so reading one week never pulls in the rest
+    of the file. Objects built from a version's frames (e.g. the WeekStore)
+    live and die with that version.
+    """
+
+    def __init__(self, keep_previous: bool = True):
+        self.keep_previous = keep_previous
+        # version -> {"frames": {slot: {"df", "columns", "weeks"}}, "derived": {...}}, oldest first.
+        # slot is the dataset name (every week) or (name, "weeks") for a week-range read.
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _slots(name, weeks):
+        return [name] if weeks is None else [name, (name, "weeks")]
+
+    def get(self, version, wanted: dict, weeks=None):
+        """
+        {name: DataFrame} for `wanted` ({name: columns}) and `weeks` if this
+        version already has it loaded, else None.
+        """
+        entry = self._versions.get(version)
+        if entry is None:
+            return None
+        frames = {}
+        for name, columns in wanted.items():
+            for slot in self._slots(name, weeks):
+                loaded = entry["frames"].get(slot)
+                if loaded and _covers(loaded["columns"], columns) and _covers_weeks(loaded["weeks"], weeks):
+                    frames[name] = _project(loaded["df"], columns, None if weeks == loaded["weeks"] else weeks)
+                    break
+            else:
+                return None
+        return frames
 
-    # Use file modification times as cache key
-    calls_mtime = get_file_mtime(calls_path)
-    roi_mtime = get_file_mtime(roi_path)
-    jobs_mtime = get_file_mtime(jobs_path)
+    def missing(self, version, wanted: dict, weeks=None):
+        """
+        The part of `wanted` this version doesn't have yet, widened to keep the
+        columns (and week range) already loaded: ({name: columns}, {name: week range}).
+        """
+        entry = self._versions.get(version) or {"frames": {}}
+        columns_needed, weeks_needed = {}, {}
+        for name, columns in wanted.items():
+            slots = self._slots(name, weeks)
+            if any(
+                slot in entry["frames"]
+                and _covers(entry["frames"][slot]["columns"], columns)
+                and _covers_weeks(entry["frames"][slot]["weeks"], weeks)
+                for slot in slots
+            ):
+                continue
+
+            read_weeks = weeks
+            loaded = entry["frames"].get(slots[-1])
+            if loaded is not None:
+                if columns is not None and loaded["columns"] is not None:
+                    columns = tuple(loaded["columns"] | set(columns))
+                else:
+                    columns = None
+                if weeks is not None:
+                    read_weeks = (min(loaded["weeks"][0], weeks[0]), max(loaded["weeks"][1], weeks[1]))
+            columns_needed[name] = columns
+            weeks_needed[name] = read_weeks
+        return columns_needed, weeks_needed
+
+    def latest(self):
+        """The most recently stored version, or None."""
+        if not self._versions:
+            return None
+        return next(reversed(self._versions))
+
+    def put(self, version, frames: dict, columns: dict, weeks: dict):
+        """Add datasets read for `version` ({name: DataFrame}, read with {name: columns} and {name: weeks})."""
+        with self._lock:
+            entry = self._versions.get(version)
+            if entry is None:
+                entry = self._versions[version] = {"frames": {}, "derived": {}}
+
+                keep = 2 if self.keep_previous else 1
+                for stale in list(self._versions)[:-keep]:
+                    del self._versions[stale]
+
+            for name, df in frames.items():
+                entry["frames"][self._slots(name, weeks[name])[-1]] = {
+                    "df": df,
+                    "columns": None if columns[name] is None else set(columns[name]),
+                    "weeks": weeks[name],
+                }
+
+        stats = self.memory_usage()
+        print(
+            f"📦 Loaded {', '.join(frames)} for data version {version}: "
+            f"{stats['versions'].get(version, 0) / 1e6:.1f} MB "
+            f"({len(self._versions)} version(s) cached, {stats['total_bytes'] / 1e6:.1f} MB total)"
+        )
 
-    return _load_master_data_cached(calls_mtime, roi_mtime, jobs_mtime)
+    def derived(self, version, frames: dict, key: str, build):
+        """Return build(frames) for this version, building it once."""
+        entry = self._versions.get(version)
+        if entry is None:
+            # Version was already evicted (a newer one was loaded meanwhile) - don't cache it
+            return build(frames)
+        with self._lock:
+            if key not in entry["derived"]:
+                entry["derived"][key] = build(frames)
+            return entry["derived"][key]
+
+    def store(self, version, key: str, value):
+        """Keep an already built value for this version and key (first one wins); returns the kept one."""
+        entry = self._versions.get(version)
+        if entry is None:
+            # Version was already evicted (a newer one was loaded meanwhile) - don't cache it
+            return value
+        with self._lock:
+            return entry["derived"].setdefault(key, value)
+
+    def cached(self, version, key: str):
+        """What derived() built (or store() kept) for this version and key, or None."""
+        entry = self._versions.get(version)
+        return None if entry is None else entry["derived"].get(key)
+
+    def memory_usage(self) -> dict:
+        """Bytes held per version (DataFrame.memory_usage(deep=True)) and in total."""
+        versions = {}
+        for version, entry in list(self._versions.items()):
+            objects = [loaded["df"] for loaded in entry["frames"].values()] + list(entry["derived"].values())
+            versions[version] = sum(_frame_bytes(obj) for obj in objects)
+        return {"versions": versions, "total_bytes": sum(versions.values())}
+
+
+_dataset_cache = DatasetCache(keep_previous=KEEP_PREVIOUS_VERSION)
+
+
+class SharedJsonCache:
+    """
+    JSON texts on disk, one file per key (a tuple that includes the data version),
+    so what one server worker process built is reused by the others (and after
+    a restart). A new data version means new keys, so every entry of the old one
+    stops being used at once. Reading a file marks it as used; past max_files
+    the least recently used files are deleted. Hit / miss counts are for this process.
+    """
 
+    def __init__(self, directory: Path, max_files: int):
+        self.directory = Path(directory)
+        self.max_files = max_files
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+        self._lock = threading.Lock()
 
-@lru_cache(maxsize=10)
-def _load_projections_data_cached(rpa_mtime, sales_mtime, appts_mtime):
-    """Internal cached loader that uses file mtimes as cache key."""
-    master_data_dir = Path(__file__).resolve().parent / "Master_Data"
+    def _path(self, key: tuple) -> Path:
+        name = hashlib.sha256(json.dumps([str(part) for part in key]).encode()).hexdigest()[:32]
+        return self.directory / f"{name}.json"
 
-    rpa_path = master_data_dir / "projections_rpa_data.parquet"
-    sales_path = master_data_dir / "projections_sales_data.parquet"
-    appts_path = master_data_dir / "projections_appointments_data.parquet"
+    def count(self, stat: str):
+        with self._lock:
+            self.stats[stat] += 1
 
-    rpa_df = pd.read_parquet(rpa_path) if rpa_path.exists() else pd.DataFrame()
-    sales_df = pd.read_parquet(sales_path) if sales_path.exists() else pd.DataFrame()
-    appts_df = pd.read_parquet(appts_path) if appts_path.exists() else pd.DataFrame()
+    def get(self, key: tuple):
+        """The JSON text saved under key, or None."""
+        path = self._path(key)
+        try:
+            text = path.read_text()
+            os.utime(path)  # most recently used
+        except OSError:
+            self.count("misses")
+            return None
+        self.count("disk_hits")
+        return text
 
-    return rpa_df, sales_df, appts_df
+    def put(self, key: tuple, text: str):
+        """Save text under key (atomically - other processes may be reading), then evict."""
+        path = self._path(key)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(text)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            # The cache is only a shortcut - serve the result anyway
+            print(f"⚠️  Could not save {key[:2]} to {self.directory}: {exc}")
+            return
+        files = []
+        for file in self.directory.glob("*.json"):
+            try:
+                files.append((file.stat().st_mtime, file))
+            except OSError:
+                pass  # another process evicted it
+        for _, stale in sorted(files)[:max(len(files) - self.max_files, 0)]:
+            stale.unlink(missing_ok=True)
+
+
+def dataset_cache_stats() -> dict:
+    """Memory footprint of the loaded data (for logging / debugging on Render)."""
+    return _dataset_cache.memory_usage()
+
+
+def _load_datasets(version, wanted: dict, weeks: dict = None, arrow: bool = False) -> dict:
+    """
+    Read the `wanted` datasets ({name: columns}, None = all) for the given data version,
+    only the week range in `weeks` ({name: (first, last) week_start}, missing/None = all).
+    Everything one caller asks for is read together, so callbacks never mix a new
+    calls file with an old ROI file. With `arrow` the datasets are Arrow tables
+    (straight from the snapshots when they are on) instead of DataFrames.
+    """
+    weeks = weeks or {}
+    manifest = read_manifest(MASTER_DATA_DIR)
+    if manifest is not None and manifest["version"] != version:
+        raise StaleManifestError("manifest.json changed while loading")
+    manifest_files = manifest["files"] if manifest else {}
+
+    def read_listed(path, columns, week_range):
+        filename = path.relative_to(MASTER_DATA_DIR).as_posix()
+        if not path.exists():
+            raise StaleManifestError(f"{filename} is listed in manifest.json but missing")
+        return _read_table(path, manifest_files[filename]["sha256"], columns, week_range)
+
+    def read_unlisted(path, columns, week_range):
+        return _read_table(path, columns=columns, weeks=week_range)
+
+    def read(name, columns, week_range=None, arrow=False):
+        # A dataset is one file or a directory of week partitions (see master_data.dataset_files)
+        filename = DATASET_FILES[name]
+
+        if manifest is not None:
+            paths = [MASTER_DATA_DIR / f for f, info in manifest_files.items() if info.get("dataset") == name]
+            read_file = read_listed
+        else:
+            paths = dataset_files(name, MASTER_DATA_DIR)
+            read_file = read_unlisted
+        if paths:
+            if USE_SNAPSHOTS:
+                source = snapshot_source(name, MASTER_DATA_DIR, manifest)
+                return _read_snapshot(name, paths, source, columns, week_range, read_file, arrow)
+            return read_dataset_files(paths, columns, week_range, read_file)
+        if manifest is None and name in REQUIRED_DATASETS:
+            return read_dataset_files([MASTER_DATA_DIR / filename], columns, week_range, read_unlisted)
+        if name in REQUIRED_DATASETS:
+            raise StaleManifestError(f"{filename} is missing from manifest.json")
+        return pd.DataFrame()
+
+    frames = {}
+    for name, columns in wanted.items():
+        # Without a manifest we can't tell whether weekly_summary.parquet matches the
+        # calls/ROI files, so build it (it's small) rather than risk a stale one
+        if name == "summary" and manifest is None:
+            frames[name] = pd.DataFrame()
+        else:
+            frames[name] = read(name, columns, weeks.get(name), arrow)
+
+    if "summary" in frames and len(frames["summary"]) == 0:
+        # Priors need the whole history, so build from every week and then trim
+        sources = summary_source_columns()
+        summary_df = build_weekly_summary(read("calls", sources["calls"]), read("roi", sources["roi"]))
+        frames["summary"] = filter_week_range(summary_df, weeks.get("summary"))
+
+    if arrow:
+        # Parquet reads (snapshots off) and the built summary are still DataFrames
+        frames = {name: to_arrow(df) if isinstance(df, pd.DataFrame) else df for name, df in frames.items()}
+    return frames
+
+
+def load_datasets(wanted: dict, weeks=None, version=None):
+    """
+    Return (version, {name: DataFrame}) for the current data version (or the given
+    `version`, which must still be the one on disk), holding
+    just the datasets and columns in `wanted` ({name: columns}, None = all).
+    With `weeks` ((first, last) week_start dates) only those weeks are returned,
+    and only their parquet row groups are read.
+    Datasets are read on first use and then cached with their version.
+    If the files are mid-update, keeps serving the last complete version and
+    looks at the manifest again on the next call.
+    """
+    pinned = version
+    for _ in range(3):
+        version = pinned or current_data_version()
+        frames = _dataset_cache.get(version, wanted, weeks)
+        if frames is not None:
+            return version, frames
+
+        columns_needed, weeks_needed = _dataset_cache.missing(version, wanted, weeks)
+        try:
+            loaded = _load_datasets(version, columns_needed, weeks_needed)
+        except StaleManifestError as exc:
+            if pinned:
+                raise
+            _data_version_state["checked_at"] = 0.0
+            last_version = _dataset_cache.latest()
+            last_frames = _dataset_cache.get(last_version, wanted, weeks) if last_version else None
+            if last_frames is not None:
+                print(f"⚠️  {exc} - still serving data version {last_version}")
+                return last_version, last_frames
+            time.sleep(0.5)
+            continue
+
+        _dataset_cache.put(version, loaded, columns_needed, weeks_needed)
+        frames = _dataset_cache.get(version, wanted, weeks)
+        if frames is not None:
+            return version, frames
+
+    raise StaleManifestError("Master_Data kept changing while loading")
+
+
+def load_dataset(name: str, columns=None, weeks=None) -> pd.DataFrame:
+    """
+    One dataset for the current data version, with only `columns` (None = all)
+    and the `weeks` range ((first, last) week_start, None = all) read from disk.
+    """
+    _, frames = load_datasets({name: columns}, weeks)
+    return frames[name]
+
+
+def load_view(view: str, weeks=None, version=None) -> dict:
+    """{name: DataFrame} with the datasets/columns a dashboard view declares in DASHBOARD_VIEWS."""
+    _, frames = load_datasets(DASHBOARD_VIEWS[view], weeks, version)
+    return frames
+
+
+def load_master_data():
+    """
+    Full jobs/calls/ROI files (every column). The dashboard itself no longer needs
+    these - use load_view / load_dataset so jobs isn't read.
+    """
+    _, frames = load_datasets({"jobs": None, "calls": None, "roi": None})
+    return frames["jobs"], frames["calls"], frames["roi"]
 
 
 def load_projections_data():
-    """Read and cache the projections parquet files. Cache invalidates when files change."""
-    master_data_dir = Path(__file__).resolve().parent / "Master_Data"
+    """Read and cache the projections parquet files. Cache invalidates when the data version changes."""
+    frames = load_view("projections")
+    return frames["rpa"], frames["sales"], frames["appts"]
+
+
+def load_appointment_versions(version=None) -> pd.DataFrame:
+    """
+    One row per appointment version with its valid_from / valid_to snapshot weeks
+    (see master_appointments.appointments_as_of). Built once per data version.
+    """
+    version, frames = load_datasets(DASHBOARD_VIEWS["projections"], version=version)
+    return _dataset_cache.derived(version, frames, "appointment_versions", lambda f: appointment_versions(f["appts"]))
 
-    rpa_path = master_data_dir / "projections_rpa_data.parquet"
-    sales_path = master_data_dir / "projections_sales_data.parquet"
-    appts_path = master_data_dir / "projections_appointments_data.parquet"
 
-    # Use file modification times as cache key
-    rpa_mtime = get_file_mtime(rpa_path)
-    sales_mtime = get_file_mtime(sales_path)
-    appts_mtime = get_file_mtime(appts_path)
+def load_weekly_summary():
+    """One row per week of headline metrics (+ 1/4/13/52-week priors). Cache invalidates when the data version changes."""
+    return load_view("summary")["summary"]
+
+
+# How far back each reference week sits from the selected week
+REFERENCE_WEEKS_BACK = {
+    "1 week ago": 1,
+    "1 month ago": 4,
+    "3 months ago": 13,
+    "6 months ago": 26,
+    "1 year ago": 52,
+}
+
+
+class WeekStore:
+    """
+    Week-keyed view over the dashboard datasets, built once per data version.
+
+    Every frame is sorted by its real week date (and by mode where it has one),
+    and the row offsets of each week are computed up front, so pulling out a
+    week is a dict lookup plus a positional slice instead of string comparisons
+    over the whole frame.
+    """
 
-    return _load_projections_data_cached(rpa_mtime, sales_mtime, appts_mtime)
+    def __init__(self, frames: dict):
+        self.frames = {}
+        self.week_offsets = {}
+        self.mode_offsets = {}
+
+        for name, df in frames.items():
+            self._index(name, df)
+
+    def _index(self, name, df):
+        if df.empty or "week_start" not in df.columns:
+            self.frames[name] = df
+            self.week_offsets[name] = {}
+            self.mode_offsets[name] = {}
+            return
+
+        has_mode = "mode" in df.columns
+        week_cols = ["week_start", "week_end"]
+        sort_cols = week_cols + ["mode"] if has_mode else week_cols
+
+        df = df.sort_values(sort_cols, kind="stable").reset_index(drop=True)
+
+        # Rows are contiguous per week (and per week+mode) after the sort,
+        # so the first/last position of each group is the slice.
+        week_offsets = {
+            key: (positions[0], positions[-1] + 1)
+            for key, positions in df.groupby(week_cols, sort=False, observed=True).indices.items()
+        }
+        mode_offsets = {}
+        if has_mode:
+            mode_offsets = {
+                key: (positions[0], positions[-1] + 1)
+                for key, positions in df.groupby(sort_cols, sort=False, observed=True).indices.items()
+            }
+
+        self.frames[name] = df
+        self.week_offsets[name] = week_offsets
+        self.mode_offsets[name] = mode_offsets
+
+    def week(self, name: str, start: date, end: date, mode: str = None) -> pd.DataFrame:
+        """Rows of `name` for the given week (and mode), or an empty frame."""
+        df = self.frames[name]
+        if mode is None:
+            offsets = self.week_offsets[name].get((start, end))
+        else:
+            offsets = self.mode_offsets[name].get((start, end, mode))
+
+        if offsets is None:
+            return df.iloc[0:0]
+        return df.iloc[offsets[0]:offsets[1]]
+
+    def has_week(self, name: str, start: date, end: date) -> bool:
+        return (start, end) in self.week_offsets[name]
+
+    def weeks(self, name: str) -> list[tuple[date, date]]:
+        """All (week_start, week_end) pairs present in `name`, oldest first."""
+        return list(self.week_offsets[name])
+
+    def reference_weeks(self, name: str, selected_start: date) -> dict:
+        """
+        Same lookup as generate_reference_weeks, but answered from the week index.
+        Returns {label: (week_start, week_end) or (None, None)} as date objects.
+        """
+        ends_by_start = {ws: we for ws, we in self.week_offsets[name]}
+
+        result = {}
+        for label, weeks_back in REFERENCE_WEEKS_BACK.items():
+            target = selected_start - timedelta(weeks=weeks_back)
+            if target in ends_by_start:
+                result[label] = (target, ends_by_start[target])
+            else:
+                result[label] = (None, None)
+        return result
+
+
+def load_week_store(view: str = "week_store", weeks=None, version=None) -> WeekStore:
+    """
+    Week-indexed store over a DASHBOARD_VIEWS view (only the `weeks` range when given).
+    Built once per data version (and week range), evicted with it.
+    """
+    version, frames = load_datasets(DASHBOARD_VIEWS[view], weeks, version)
+    return _dataset_cache.derived(version, frames, (view, weeks), WeekStore)
+
+
+class ArrowWeekStore:
+    """
+    WeekStore over Arrow tables, for the per-week DataTables.
+
+    Each table is sorted by week (and mode) once per data version; a week is
+    then a zero-copy Table.slice, and its DataTable records come straight from
+    Arrow (Table.to_pylist) without building a pandas frame per render.
+    """
+
+    def __init__(self, tables: dict):
+        self.tables = {}
+        self.week_offsets = {}
+        self.mode_offsets = {}
+
+        for name, table in tables.items():
+            self._index(name, table)
+
+    def _index(self, name, table):
+        self.week_offsets[name] = {}
+        self.mode_offsets[name] = {}
+        if table.num_rows == 0 or "week_start" not in table.column_names:
+            self.tables[name] = table
+            return
+
+        week_cols = ["week_start", "week_end"]
+        sort_cols = week_cols + ["mode"] if "mode" in table.column_names else week_cols
+
+        # Arrow can't sort dictionary columns, so sort on their decoded values
+        # (same order as the pandas categories). The sort is stable.
+        keys = pa.table({
+            col: pc.cast(table[col], table.schema.field(col).type.value_type)
+            if pa.types.is_dictionary(table.schema.field(col).type) else table[col]
+            for col in sort_cols
+        })
+        order = pc.sort_indices(keys, sort_keys=[(col, "ascending") for col in sort_cols])
+        table = table.take(order)
+        keys = keys.take(order)
+
+        # Rows are contiguous per week (and per week+mode) after the sort
+        groups = [(self.week_offsets[name], week_cols)]
+        if sort_cols is not week_cols:
+            groups.append((self.mode_offsets[name], sort_cols))
+        rows = table.num_rows
+        for offsets, cols in groups:
+            # A group starts wherever any key differs from the row before it
+            changed = [
+                pc.fill_null(pc.not_equal(keys[col].slice(1), keys[col].slice(0, rows - 1)), True)
+                for col in cols
+            ]
+            starts = [0] + [i + 1 for i in pc.indices_nonzero(reduce(pc.or_, changed)).to_pylist()]
+            firsts = keys.select(cols).take(starts)
+            for start, stop, key in zip(starts, starts[1:] + [rows], zip(*(firsts[col].to_pylist() for col in cols))):
+                if None not in key:
+                    offsets[key] = (start, stop)
+
+        self.tables[name] = table
+
+    def week(self, name: str, start: date, end: date, mode: str = None) -> pa.Table:
+        """Rows of `name` for the given week (and mode) as a zero-copy slice, or an empty table."""
+        table = self.tables[name]
+        if mode is None:
+            offsets = self.week_offsets[name].get((start, end))
+        else:
+            offsets = self.mode_offsets[name].get((start, end, mode))
+
+        if offsets is None:
+            return table.slice(0, 0)
+        return table.slice(offsets[0], offsets[1] - offsets[0])
+
+    def records(self, name: str, start: date, end: date, mode: str = None, drop=()) -> list[dict]:
+        """The week's rows as DataTable records ({column: value}), without the `drop` columns."""
+        table = self.week(name, start, end, mode)
+        return table.drop_columns([col for col in drop if col in table.column_names]).to_pylist()
+
+    def has_week(self, name: str, start: date, end: date) -> bool:
+        return (start, end) in self.week_offsets[name]
+
+
+def load_arrow_week_store(view: str = "week_calls", weeks=None, version=None) -> ArrowWeekStore:
+    """
+    ArrowWeekStore over a DASHBOARD_VIEWS view (only the `weeks` range when given),
+    read as Arrow tables (memory-mapped from the snapshots) with no pandas frames
+    in between. Built once per data version (and week range), evicted with it.
+    """
+    wanted = DASHBOARD_VIEWS[view]
+    key = ("arrow", view, weeks)
+    pinned = version
+    for _ in range(3):
+        version = pinned or current_data_version()
+        store = _dataset_cache.cached(version, key)
+        if store is not None:
+            return store
+        try:
+            tables = _load_datasets(version, wanted, {name: weeks for name in wanted}, arrow=True)
+        except StaleManifestError:
+            if pinned:
+                raise
+            _data_version_state["checked_at"] = 0.0
+            time.sleep(0.5)
+            continue
+        return _dataset_cache.derived(version, tables, key, ArrowWeekStore)
+
+    raise StaleManifestError("Master_Data kept changing while loading")
 
 
 def get_delta_percent(current, previous):
@@ -105,8 +799,8 @@ def get_last_full_week(for_date: date = None) -> tuple[str, str]:
     return last_sunday.strftime("%m/%d/%Y"), last_saturday.strftime("%m/%d/%Y")
 
 
-def parquet_has_week(df: pd.DataFrame, start: str, end: str) -> bool:
-
+def parquet_has_week(df: pd.DataFrame, start, end) -> bool:
+    start, end = to_week_date(start), to_week_date(end)
     return ((df["week_start"] == start) & (df["week_end"] == end)).any()
 
 
@@ -168,30 +862,19 @@ def generate_reference_weeks(selected_start_date: str, df) -> dict:
 
     Returns a dictionary of {label: (start_date_str, end_date_str) or (None, None)}
     """
-    # Ensure all week_start values are datetime.date objects
+    # week_start/week_end are stored as datetime.date objects
     available_weeks = (
         df[["week_start", "week_end"]]
         .drop_duplicates()
         .dropna()
-        .assign(
-            week_start=lambda d: pd.to_datetime(d["week_start"]).dt.date,
-            week_end=lambda d: pd.to_datetime(d["week_end"]).dt.date,
-        )
         .sort_values("week_start")
         .reset_index(drop=True)
     )
 
     base_date = datetime.strptime(selected_start_date, "%m/%d/%Y").date()
-    reference_map = {
-        "1 week ago": 1,
-        "1 month ago": 4,
-        "3 months ago": 13,
-        "6 months ago": 26,
-        "1 year ago": 52,
-    }
 
     result = {}
-    for label, weeks_back in reference_map.items():
+    for label, weeks_back in REFERENCE_WEEKS_BACK.items():
         target_date = base_date - timedelta(weeks=weeks_back)
 
         # Find the closest matching week_start
@@ -247,16 +930,16 @@ def percent_to_color(delta: float | None) -> str:
 
 def generate_week_options_from_parquet(df):
     """Generate week options from any DataFrame with week_start/week_end columns"""
-    weeks = df[["week_start", "week_end"]].drop_duplicates().copy()
-
-    # Convert to datetime for proper sorting (not alphabetical)
-    weeks["week_start_dt"] = pd.to_datetime(weeks["week_start"])
-    weeks = weeks.sort_values("week_start_dt", ascending=False)
+    # week_start/week_end are dates, so this sorts chronologically (not alphabetically)
+    weeks = (
+        df[["week_start", "week_end"]]
+        .drop_duplicates()
+        .dropna()
+        .sort_values("week_start", ascending=False)
+    )
 
     options = []
-    for _, row in weeks.iterrows():
-        ws = pd.to_datetime(row["week_start"]).date()
-        we = pd.to_datetime(row["week_end"]).date()
+    for ws, we in zip(weeks["week_start"], weeks["week_end"]):
         label = f"{ws.strftime('%B')} {ws.day} – {we.day}, {we.year}"
         value = f"{ws.strftime('%m/%d/%Y')}|{we.strftime('%m/%d/%Y')}"
         options.append({"label": label, "value": value})
@@ -451,30 +1134,16 @@ def generate_week_options_from_parquet(df):
 #     return fig
 
 
-def build_call_center_line_chart(calls_all_df, selected_metric="touches"):
+def build_call_center_line_chart(weekly_summary_df, selected_metric="touches"):
     """
     Build a line chart showing Call Center metrics over all available weeks.
     selected_metric: "touches" or "design_appts"
     """
-    # Get data for outbound (for both metrics)
-    outbound_data = calls_all_df[calls_all_df["mode"] == "outbound"].copy()
-
-    # Group by week and sum the Totals row values
-    weekly_data = []
-    for (week_start, week_end), group in outbound_data.groupby(["week_start", "week_end"]):
-        totals_row = group[group["Call Center Rep"] == "Totals"]
-        if not totals_row.empty:
-            touches = int(totals_row["Outbound Communication Count"].iloc[0])
-            design_appts = int(totals_row["Total Booked"].iloc[0])
-            weekly_data.append({
-                "week_start": week_start,
-                "week_end": week_end,
-                "touches": touches,
-                "design_appts": design_appts
-            })
-
-    # Convert to DataFrame and sort by date
-    df = pd.DataFrame(weekly_data)
+    # The weekly summary already holds the outbound Totals row values, one row per week
+    df = weekly_summary_df[
+        weekly_summary_df["touches"].notna() & weekly_summary_df["design_appts"].notna()
+    ][["week_start", "week_end", "touches", "design_appts"]].astype({"touches": int, "design_appts": int})
+
     if df.empty:
         # Return empty figure if no data
         return go.Figure().update_layout(
@@ -482,14 +1151,12 @@ def build_call_center_line_chart(calls_all_df, selected_metric="touches"):
             font=dict(family="Segoe UI, sans-serif", color="#2C3E70")
         )
 
-    df["week_start_dt"] = pd.to_datetime(df["week_start"])
-    df = df.sort_values("week_start_dt")
+    df = df.sort_values("week_start")
 
     # Create week labels
-    df["week_label"] = df.apply(
-        lambda row: f"{pd.to_datetime(row['week_start']).strftime('%m/%d')} – {pd.to_datetime(row['week_end']).strftime('%m/%d')}",
-        axis=1
-    )
+    df["week_label"] = [
+        f"{ws:%m/%d} – {we:%m/%d}" for ws, we in zip(df["week_start"], df["week_end"])
+    ]
 
     # Select metric
     if selected_metric == "touches":
@@ -587,13 +1254,13 @@ def build_call_center_line_chart(calls_all_df, selected_metric="touches"):
     return fig
 
 
-def build_marketing_line_chart(roi_all_df, selected_metric="cost_per_appt"):
+def build_marketing_line_chart(weekly_summary_df, selected_metric="cost_per_appt"):
     """
     Build a line chart showing Marketing metrics over all available weeks.
     selected_metric: "cost_per_appt", "amount_invested", or "leads_generated"
     """
-    # Get all ROI data
-    roi_data = roi_all_df.copy()
+    # ROI numbers per week come from the weekly summary (one row per week, float64)
+    roi_data = weekly_summary_df.copy()
 
     if roi_data.empty:
         return go.Figure().update_layout(
@@ -602,41 +1269,26 @@ def build_marketing_line_chart(roi_all_df, selected_metric="cost_per_appt"):
         )
 
     # Sort by week_start
-    roi_data["week_start_dt"] = pd.to_datetime(roi_data["week_start"])
-    roi_data = roi_data.sort_values("week_start_dt")
+    roi_data = roi_data.sort_values("week_start")
 
     # Create week labels
-    roi_data["week_label"] = roi_data.apply(
-        lambda row: f"{pd.to_datetime(row['week_start']).strftime('%m/%d')} – {pd.to_datetime(row['week_end']).strftime('%m/%d')}",
-        axis=1
-    )
-
-    # Helper to extract numeric value
-    import re
-    def extract_numeric(val):
-        if pd.isna(val):
-            return None
-        if isinstance(val, (int, float)):
-            return float(val)
-        cleaned = re.sub(r"[^\d\.\-]", "", str(val))
-        try:
-            return float(cleaned)
-        except ValueError:
-            return None
+    roi_data["week_label"] = [
+        f"{ws:%m/%d} – {we:%m/%d}" for ws, we in zip(roi_data["week_start"], roi_data["week_end"])
+    ]
 
     # Select metric and prepare data
     if selected_metric == "cost_per_appt":
-        roi_data["value"] = roi_data["Cost Per Appt"].apply(extract_numeric)
+        roi_data["value"] = roi_data["cost_per_appt"]
         title = "Cost Per Appointment Over Time"
         y_title = "Cost ($)"
         hover_format = "$%{y:,.2f}"
     elif selected_metric == "amount_invested":
-        roi_data["value"] = roi_data["Amount Invested"].apply(extract_numeric)
+        roi_data["value"] = roi_data["amount_invested"]
         title = "Amount Invested Over Time"
         y_title = "Amount ($)"
         hover_format = "$%{y:,.2f}"
     else:  # leads_generated
-        roi_data["value"] = roi_data["# of Leads"].apply(extract_numeric)
+        roi_data["value"] = roi_data["leads_generated"]
         title = "Leads Generated Over Time"
         y_title = "Number of Leads"
         hover_format = "%{y}"
@@ -733,13 +1385,13 @@ def build_marketing_line_chart(roi_all_df, selected_metric="cost_per_appt"):
     return fig
 
 
-def build_finance_line_chart(roi_all_df, selected_metric="revenue"):
+def build_finance_line_chart(weekly_summary_df, selected_metric="revenue"):
     """
     Build a line chart showing Finance metrics over all available weeks.
     selected_metric: "revenue", "revenue_per_appt", or "num_appts"
     """
-    # Get all ROI data
-    roi_data = roi_all_df.copy()
+    # ROI numbers per week come from the weekly summary (one row per week, float64)
+    roi_data = weekly_summary_df.copy()
 
     if roi_data.empty:
         return go.Figure().update_layout(
@@ -748,41 +1400,26 @@ def build_finance_line_chart(roi_all_df, selected_metric="revenue"):
         )
 
     # Sort by week_start
-    roi_data["week_start_dt"] = pd.to_datetime(roi_data["week_start"])
-    roi_data = roi_data.sort_values("week_start_dt")
+    roi_data = roi_data.sort_values("week_start")
 
     # Create week labels
-    roi_data["week_label"] = roi_data.apply(
-        lambda row: f"{pd.to_datetime(row['week_start']).strftime('%m/%d')} – {pd.to_datetime(row['week_end']).strftime('%m/%d')}",
-        axis=1
-    )
-
-    # Helper to extract numeric value
-    import re
-    def extract_numeric(val):
-        if pd.isna(val):
-            return None
-        if isinstance(val, (int, float)):
-            return float(val)
-        cleaned = re.sub(r"[^\d\.\-]", "", str(val))
-        try:
-            return float(cleaned)
-        except ValueError:
-            return None
+    roi_data["week_label"] = [
+        f"{ws:%m/%d} – {we:%m/%d}" for ws, we in zip(roi_data["week_start"], roi_data["week_end"])
+    ]
 
     # Select metric and prepare data
     if selected_metric == "revenue":
-        roi_data["value"] = roi_data["Revenue"].apply(extract_numeric)
+        roi_data["value"] = roi_data["revenue"]
         title = "Revenue Over Time"
         y_title = "Revenue ($)"
         hover_format = "$%{y:,.2f}"
     elif selected_metric == "revenue_per_appt":
-        roi_data["value"] = roi_data["Revenue Per Appt"].apply(extract_numeric)
+        roi_data["value"] = roi_data["revenue_per_appt"]
         title = "Revenue Per Appointment Over Time"
         y_title = "Revenue ($)"
         hover_format = "$%{y:,.2f}"
     else:  # num_appts
-        roi_data["value"] = roi_data["# of Appts"].apply(extract_numeric)
+        roi_data["value"] = roi_data["num_appts"]
         title = "# of Appointments Over Time"
         y_title = "Number of Appointments"
         hover_format = "%{y}"
@@ -1072,28 +1709,15 @@ def build_revenue_projection_chart(appts_all_df, rpa_all_df):
             font=dict(family="Segoe UI, sans-serif", color="#2C3E70")
         )
 
-    # Helper to extract numeric value from RPA
-    import re
-    def extract_numeric(val):
-        if pd.isna(val):
-            return None
-        if isinstance(val, (int, float)):
-            return float(val)
-        cleaned = re.sub(r"[^\d\.\-]", "", str(val))
-        try:
-            return float(cleaned)
-        except ValueError:
-            return None
-
     # Get latest RPA value for each location
     if "week_start" in rpa_data.columns:
-        rpa_data["week_start_dt"] = pd.to_datetime(rpa_data["week_start"])
-        rpa_data = rpa_data.sort_values("week_start_dt", ascending=False)
-        latest_rpa = rpa_data.groupby("Location").first().reset_index()
+        rpa_data = rpa_data.sort_values("week_start", ascending=False)
+        latest_rpa = rpa_data.groupby("Location", observed=True).first().reset_index()
     else:
         latest_rpa = rpa_data.copy()
 
-    latest_rpa["rpa_value"] = latest_rpa[rpa_column].apply(extract_numeric)
+    # Numeric companion of the Canvas display column (e.g. "Revenue perAppointment Value")
+    latest_rpa["rpa_value"] = latest_rpa[value_column(rpa_column)]
     latest_rpa = latest_rpa[latest_rpa["rpa_value"].notna()]
 
     # Create location -> RPA lookup
@@ -1106,7 +1730,8 @@ def build_revenue_projection_chart(appts_all_df, rpa_all_df):
             font=dict(family="Segoe UI, sans-serif", color="#2C3E70")
         )
 
-    appts_data["rpa"] = appts_data["Location"].map(location_rpa)
+    # Location is a category; mapping it can return a category too, so force numbers
+    appts_data["rpa"] = appts_data["Location"].map(location_rpa).astype("float64")
     appts_data = appts_data[appts_data["rpa"].notna()]
 
     if appts_data.empty:
@@ -1242,9 +1867,78 @@ def build_revenue_projection_chart(appts_all_df, rpa_all_df):
     return fig
 
 
-def build_call_center_metrics(outbound_df, proxy_last_week=None, booked_last_week=None):
+# The trend / forecast charts are hidden behind a toggle each, so they're built
+# the first time one is opened (render_app.py), not with every dashboard render.
+# chart id -> (DASHBOARD_VIEWS view it's built from, build(frames, metric))
+TREND_CHARTS = {
+    "cc": ("summary", lambda frames, metric: build_call_center_line_chart(frames["summary"], metric)),
+    "mkt": ("summary", lambda frames, metric: build_marketing_line_chart(frames["summary"], metric)),
+    "fin": ("summary", lambda frames, metric: build_finance_line_chart(frames["summary"], metric)),
+    # "pipeline": the appointments as of the latest fetch (each appointment once)
+    "appts-forecast": ("projections", lambda frames, metric: build_appointments_forecast_chart(frames["pipeline"])),
+    "revenue-projection": ("projections", lambda frames, metric: build_revenue_projection_chart(
+        frames["pipeline"], frames["rpa"]
+    )),
+}
+
+
+# Metric choices of the line charts (their RadioItems in update_dashboard)
+TREND_CHART_METRICS = {
+    "cc": ["touches", "design_appts"],
+    "mkt": ["cost_per_appt", "amount_invested", "leads_generated"],
+    "fin": ["revenue", "revenue_per_appt", "num_appts"],
+}
+
+
+_figure_cache = SharedJsonCache(FIGURE_CACHE_DIR, FIGURE_CACHE_MAX_FILES)
+
+
+def figure_cache_stats() -> dict:
+    """Trend figure cache hits (in this process / from disk) and misses (for logging / debugging on Render)."""
+    return dict(_figure_cache.stats)
+
+
+def load_trend_chart(chart: str, selected_metric=None) -> dict:
+    """
+    A TREND_CHARTS figure (as plotly JSON) for the current data version: the
+    pre-rendered payload if there is one, else kept in memory with the
+    version, else read from the figure cache other processes share, else built
+    once and saved there.
+    """
+    figure = read_static_payload("chart", chart, selected_metric)
+    if figure is not None:
+        return figure
+    return _render_trend_chart(chart, selected_metric)
+
+
+def _render_trend_chart(chart: str, selected_metric=None, version=None) -> dict:
+    view, build = TREND_CHARTS[chart]
+    version, frames = load_datasets(DASHBOARD_VIEWS[view], version=version)
+    key = ("chart", chart, selected_metric)
+    figure = _dataset_cache.cached(version, key)
+    if figure is not None:
+        _figure_cache.count("memory_hits")
+        return figure
+
+    text = _figure_cache.get((chart, selected_metric, version))
+    if text is None:
+        if view == "projections":
+            # Looked up here, not inside build - derived() doesn't nest
+            frames = {**frames, "pipeline": appointments_as_of(load_appointment_versions(version))}
+        text = build(frames, selected_metric).to_json()
+        _figure_cache.put((chart, selected_metric, version), text)
+        print(f"🖼️  Built {chart} chart ({selected_metric or 'default'}) - figure cache {figure_cache_stats()}")
+    return _dataset_cache.store(version, key, json.loads(text))
+
+
+def load_trend_figures(chart: str) -> dict:
+    """{metric: figure JSON} for every TREND_CHART_METRICS choice of a line chart (for its dcc.Store)."""
+    return {metric: load_trend_chart(chart, metric) for metric in TREND_CHART_METRICS[chart]}
+
+
+def build_call_center_metrics(outbound_rows, proxy_last_week=None, booked_last_week=None):
     """
-    Reads the Totals row in outbound_df and returns
+    Reads the Totals row in outbound_rows (DataTable records) and returns
     [touches_box, design_box] for use as metrics_children,
     with five‐step coloring and border for touches.
     """
@@ -1381,7 +2075,7 @@ def build_call_center_metrics(outbound_df, proxy_last_week=None, booked_last_wee
     
     # Main function logic
     # Pull the Totals row once
-    totals = outbound_df.loc[outbound_df["Call Center Rep"] == "Totals"].iloc[0]
+    totals = [row for row in outbound_rows if row["Call Center Rep"] == "Totals"][0]
 
     # Build touches box
     touches_box = _build_touches_box(totals, proxy_last_week)
@@ -1493,7 +2187,7 @@ def build_appointment_pipeline_summary(appts_df):
 
     # Group by location
     if "Location" in appts_df.columns:
-        location_counts = appts_df.groupby("Location").size().sort_values(ascending=False).head(10)
+        location_counts = appts_df.groupby("Location", observed=True).size().sort_values(ascending=False).head(10)
 
         location_cards = []
         for location, count in location_counts.items():
@@ -1545,8 +2239,13 @@ def build_location_rankings_table(df, ranking_type="sales"):
     if df.empty:
         return html.Div("No data available", style={"color": "gray", "textAlign": "center"})
 
-    # Prepare columns for display
-    columns = [{"name": col, "id": col} for col in df.columns if col not in ["week_start", "week_end", "fetched_at"]]
+    # Prepare columns for display (week/fetch columns and numeric "<col> Value"
+    # companions are hidden, so don't ship them either)
+    columns = [
+        {"name": col, "id": col}
+        for col in df.columns
+        if col not in ["week_start", "week_end", "fetched_at"] and not col.endswith(" Value")
+    ]
 
     # Conditional formatting
     style_data_conditional = [
@@ -1571,7 +2270,7 @@ def build_location_rankings_table(df, ranking_type="sales"):
         ])
 
     return dash_table.DataTable(
-        data=df.to_dict("records"),
+        data=df[[col["id"] for col in columns]].to_dict("records"),
         columns=columns,
         style_cell={
             "padding": "8px",
@@ -1591,7 +2290,7 @@ def build_location_rankings_table(df, ranking_type="sales"):
 
 
 # Updaters
-def update_dashboard(selected_week, selected_franchisee="All"):
+def update_dashboard(selected_week, selected_franchisee="All", version=None):
     if not selected_week:
         return html.Div(
             "Please select a week above to load the report.",
@@ -1610,21 +2309,27 @@ def update_dashboard(selected_week, selected_franchisee="All"):
     # jobs_all_df = pd.read_parquet(MASTER_JOBS_PARQUET)
     # calls_all_df = pd.read_parquet(MASTER_CALLS_PARQUET)
 
-    # Read full data into memory (cached)
-    jobs_all_df, calls_all_df, roi_df = load_master_data()
+    # Calls/ROI numbers come from the weekly summary in the week store below
 
     # Load projections data (location rankings and appointments) - cached
-    rpa_all_df, sales_all_df, appts_all_df = load_projections_data()
-
-    # Historical period: 1 week ago
-    # JOBS REMOVED - using calls_all_df for reference weeks instead
-    reference_weeks = generate_reference_weeks(start_csv, calls_all_df)
-    one_week_ago_start, one_week_ago_end = reference_weeks["1 week ago"]
+    # The stored appointments are changes between weekly fetches
+    appts_versions = load_appointment_versions(version)
 
     # convert to date objects
     start_dt = datetime.strptime(start_csv, "%m/%d/%Y").date()
     end_dt = datetime.strptime(end_csv, "%m/%d/%Y").date()
 
+    # Week-indexed view of the same data (built once per data version)
+    store = load_week_store(version=version)
+
+    # Call center rows for the selected week only (week-range read) - the 1-week-ago
+    # numbers come from the weekly summary. Kept as Arrow tables sorted by week, so the
+    # DataTable records come straight from Arrow
+    calls_store = load_arrow_week_store("week_calls", weeks=(start_dt, start_dt), version=version)
+
+    # Historical period: 1 week ago
+    # JOBS REMOVED - the weekly summary carries the 1-week-ago values for calls/ROI
+
     # build the human-readable labels
     lw_sun_str = start_dt.strftime("%B %-d")  # e.g. "June 8"
     lw_sat_str = end_dt.strftime("%B %-d")  # e.g. "June 14"
@@ -1637,35 +2342,21 @@ def update_dashboard(selected_week, selected_franchisee="All"):
     #     jobs_df = jobs_df[jobs_df["Franchisee"] == selected_franchisee]
 
     # Filter calls
-    inbound_df = calls_all_df[
-        (calls_all_df["week_start"] == start_csv)
-        & (calls_all_df["week_end"] == end_csv)
-        & (calls_all_df["mode"] == "inbound")
-    ].drop(columns=["week_start", "week_end", "mode"])
+    inbound_rows = calls_store.records("calls", start_dt, end_dt, mode="inbound", drop=CALLS_KEY_COLUMNS)
 
     # Filter out rows where Inbound Help Rate is "nan%"
-    inbound_df = inbound_df[inbound_df["Inbound Help Rate (%)"] != "nan%"]
+    inbound_rows = [row for row in inbound_rows if row["Inbound Help Rate (%)"] != "nan%"]
 
-    outbound_df = calls_all_df[
-        (calls_all_df["week_start"] == start_csv)
-        & (calls_all_df["week_end"] == end_csv)
-        & (calls_all_df["mode"] == "outbound")
-    ].drop(columns=["week_start", "week_end", "mode"])
+    outbound_rows = calls_store.records("calls", start_dt, end_dt, mode="outbound", drop=CALLS_KEY_COLUMNS)
 
     # Filter out rows where Outbound Help Rate is "nan%"
-    outbound_df = outbound_df[outbound_df["Outbound Help Rate (%)"] != "nan%"]
+    outbound_rows = [row for row in outbound_rows if row["Outbound Help Rate (%)"] != "nan%"]
 
-    # Defensive: skip if 1-wk-ago not available
-    if "1 week ago" not in reference_weeks:
-        # previous_jobs_df = pd.DataFrame()
-        one_week_ago_start, one_week_ago_end = None, None
-    else:
-        one_week_ago_start, one_week_ago_end = reference_weeks["1 week ago"]
-        # JOBS PREVIOUS WEEK LOOKUP COMMENTED OUT - REMOVED FROM DASHBOARD
-        # previous_jobs_df = jobs_all_df[
-        #     (jobs_all_df["week_start"] == one_week_ago_start)
-        #     & (jobs_all_df["week_end"] == one_week_ago_end)
-        # ]
+    # JOBS PREVIOUS WEEK LOOKUP COMMENTED OUT - REMOVED FROM DASHBOARD
+    # previous_jobs_df = jobs_all_df[
+    #     (jobs_all_df["week_start"] == one_week_ago_start)
+    #     & (jobs_all_df["week_end"] == one_week_ago_end)
+    # ]
 
     # JOBS FRANCHISEE FILTER COMMENTED OUT - REMOVED FROM DASHBOARD
     # if selected_franchisee != "All":
@@ -1682,51 +2373,31 @@ def update_dashboard(selected_week, selected_franchisee="All"):
     #         previous_jobs_df.groupby("Status", observed=False)["ID"].nunique().to_dict()
     #     )
 
-    if one_week_ago_start and one_week_ago_end:
-        previous_outbound_df = calls_all_df[
-            (calls_all_df["week_start"] == one_week_ago_start)
-            & (calls_all_df["week_end"] == one_week_ago_end)
-            & (calls_all_df["mode"] == "outbound")
-        ]
-    else:
-        previous_outbound_df = pd.DataFrame()
+    # Headline numbers for this week and the weeks before it (weekly_summary.parquet)
+    summary_df = store.week("summary", start_dt, end_dt)
 
-    if previous_outbound_df.empty:
-        proxy_last_week = None
-        booked_last_week = None
-    else:
-        try:
-            previous_outbound_totals = previous_outbound_df[
-                previous_outbound_df["Call Center Rep"] == "Totals"
-            ].iloc[0]
-            proxy_last_week = int(
-                previous_outbound_totals["Outbound Communication Count"]
-            )
-            booked_last_week = int(previous_outbound_totals["Total Booked"])
-        except (IndexError, KeyError, ValueError):
-            proxy_last_week = None
-            booked_last_week = None
+    def _summary_val(col):
+        """Numeric value from this week's summary row, or None if missing."""
+        if summary_df.empty or col not in summary_df.columns:
+            return None
+        raw = summary_df.iloc[0][col]
+        return None if pd.isna(raw) else raw
+
+    # Defensive: summary values are None if 1-wk-ago is not available
+    proxy_last_week = _summary_val(prior_column("touches"))
+    booked_last_week = _summary_val(prior_column("design_appts"))
+    proxy_last_week = int(proxy_last_week) if proxy_last_week is not None else None
+    booked_last_week = int(booked_last_week) if booked_last_week is not None else None
 
     # Continue as usual
-    metrics_children = build_call_center_metrics(outbound_df, proxy_last_week, booked_last_week)
+    metrics_children = build_call_center_metrics(outbound_rows, proxy_last_week, booked_last_week)
 
     # JOBS STATUS FIGURE COMMENTED OUT - REMOVED FROM DASHBOARD
     # fig = make_status_figure(jobs_df, selected_franchisee, historical_lookup)
 
-    # Grab last week's "Totals" row
-    previous_df = calls_all_df[
-        (calls_all_df["week_start"] == one_week_ago_start)
-        & (calls_all_df["week_end"] == one_week_ago_end)
-        & (calls_all_df["mode"] == "inbound")
-    ]
-
-    try:
-        previous_totals_row = previous_df[
-            previous_df["Call Center Rep"] == "Totals"
-        ].iloc[0]
-        prev_inbound_rate = float(previous_totals_row["Inbound Rate Value"])
-    except (IndexError, KeyError):
-        prev_inbound_rate = None  # fallback
+    # Last week's "Totals" inbound rate
+    prev_inbound_rate = _summary_val(prior_column("inbound_rate"))
+    prev_inbound_rate = float(prev_inbound_rate) if prev_inbound_rate is not None else None
 
     def build_inbound_tooltip(row, prev_rate):
         if row["Call Center Rep"] != "Totals" or prev_rate is None:
@@ -1741,83 +2412,43 @@ def update_dashboard(selected_week, selected_franchisee="All"):
             f"<span style='color:{color}; font-weight:bold'>{change}</span>"
         )
 
-    inbound_df["Inbound Help Rate Tooltip"] = inbound_df.apply(
-        lambda row: build_inbound_tooltip(row, prev_inbound_rate), axis=1
-    )
-
-    # filter current week and 1-week-ago
-    roi_curr = roi_df[
-        (roi_df["week_start"] == start_csv) &
-        (roi_df["week_end"]   == end_csv)
-    ]
-    roi_prev = roi_df[
-        (roi_df["week_start"] == one_week_ago_start) &
-        (roi_df["week_end"]   == one_week_ago_end)
-    ]
+    for row in inbound_rows:
+        row["Inbound Help Rate Tooltip"] = build_inbound_tooltip(row, prev_inbound_rate)
 
     # Filter projections data for current week
-    rpa_curr = rpa_all_df[
-        (rpa_all_df["week_start"] == start_csv) &
-        (rpa_all_df["week_end"] == end_csv)
-    ] if not rpa_all_df.empty else pd.DataFrame()
-
-    sales_curr = sales_all_df[
-        (sales_all_df["week_start"] == start_csv) &
-        (sales_all_df["week_end"] == end_csv)
-    ] if not sales_all_df.empty else pd.DataFrame()
-
-    appts_curr = appts_all_df[
-        (appts_all_df["week_start"] == start_csv) &
-        (appts_all_df["week_end"] == end_csv)
-    ] if not appts_all_df.empty else pd.DataFrame()
+    rpa_curr = store.week("rpa", start_dt, end_dt)
+    sales_curr = store.week("sales", start_dt, end_dt)
+    appts_curr = appointments_as_of(appts_versions, start_dt)
 
     # helper to safely pull a numeric value
-    import re
-
-    def _get_val(df, col):
-        """
-        Pull a numeric column out of a one‐row ROI DataFrame.
-        Strips out dollar signs, commas, etc., before converting to float.
-        Returns None if the column is missing or the DataFrame is empty.
-        """
-        if df.empty or col not in df.columns:
-            return None
-    
-        raw = df.iloc[0][col]
-        # If it’s already numeric, just return it
-        if isinstance(raw, (int, float)):
-            return float(raw)
-    
-        # Otherwise, strip out anything that’s not a digit, dot or minus
-        cleaned = re.sub(r"[^\d\.\-]", "", str(raw))
-        try:
-            return float(cleaned)
-        except ValueError:
-            return None
+    def _get_val(col):
+        """ROI number from the weekly summary as a float, or None if missing/blank."""
+        val = _summary_val(col)
+        return float(val) if val is not None else None
 
 
     # Marketing Metrics: Cost Per Appt, Amount Invested, Leads Generated
     marketing_curr = {
-        "Cost Per Appointment": _get_val(roi_curr, "Cost Per Appt"),
-        "Amount Invested":  _get_val(roi_curr, "Amount Invested"),
-        "Leads Generated":  _get_val(roi_curr, "# of Leads"),
+        "Cost Per Appointment": _get_val("cost_per_appt"),
+        "Amount Invested":  _get_val("amount_invested"),
+        "Leads Generated":  _get_val("leads_generated"),
     }
     marketing_prev = {
-        "Cost Per Appointment": _get_val(roi_prev, "Cost Per Appt"),
-        "Amount Invested": _get_val(roi_prev, "Amount Invested"),
-        "Leads Generated": _get_val(roi_prev, "# of Leads"),
+        "Cost Per Appointment": _get_val(prior_column("cost_per_appt")),
+        "Amount Invested": _get_val(prior_column("amount_invested")),
+        "Leads Generated": _get_val(prior_column("leads_generated")),
     }
 
     # Finance Metrics: Revenue, Revenue Per Appt, # of Appointments
     finance_curr = {
-        "Revenue": _get_val(roi_curr, "Revenue"),
-        "Revenue Per Appointment": _get_val(roi_curr, "Revenue Per Appt"),
-        "# of Appointments": _get_val(roi_curr, "# of Appts"),
+        "Revenue": _get_val("revenue"),
+        "Revenue Per Appointment": _get_val("revenue_per_appt"),
+        "# of Appointments": _get_val("num_appts"),
     }
     finance_prev = {
-        "Revenue": _get_val(roi_prev, "Revenue"),
-        "Revenue Per Appointment": _get_val(roi_prev, "Revenue Per Appt"),
-        "# of Appointments": _get_val(roi_prev, "# of Appts"),
+        "Revenue": _get_val(prior_column("revenue")),
+        "Revenue Per Appointment": _get_val(prior_column("revenue_per_appt")),
+        "# of Appointments": _get_val(prior_column("num_appts")),
     }
 
     def build_metric_cards(curr_dict, prev_dict):
@@ -1997,10 +2628,17 @@ def update_dashboard(selected_week, selected_franchisee="All"):
                                 )
                             ]
                         ),
-                        dcc.Graph(
-                            id="cc-line-chart",
-                            figure=build_call_center_line_chart(calls_all_df, "touches"),
-                            config={"displayModeBar": False}
+                        # Every metric's figure, sent once when the toggle is first opened;
+                        # switching metrics then happens in the browser (render_app.py)
+                        dcc.Loading(
+                            type="circle",
+                            children=[
+                                dcc.Store(id="cc-chart-store"),
+                                dcc.Graph(
+                                    id="cc-line-chart",
+                                    config={"displayModeBar": False}
+                                ),
+                            ],
                         )
                     ]
                 ),
@@ -2051,7 +2689,7 @@ def update_dashboard(selected_week, selected_franchisee="All"):
                                             "id": "Inbound Help Rate (%)",
                                         },
                                     ],
-                                    data=inbound_df.to_dict("records"),
+                                    data=inbound_rows,
                                     style_cell={
                                         "padding": "8px",
                                         "fontFamily": "Segoe UI, sans-serif",
@@ -2174,7 +2812,7 @@ def update_dashboard(selected_week, selected_franchisee="All"):
                                             "id": "Outbound Help Rate (%)",
                                         },
                                     ],
-                                    data=outbound_df.to_dict("records"),
+                                    data=outbound_rows,
                                     style_cell={
                                         "padding": "8px",
                                         "fontFamily": "Segoe UI, sans-serif",
@@ -2287,10 +2925,17 @@ def update_dashboard(selected_week, selected_franchisee="All"):
                                 )
                             ]
                         ),
-                        dcc.Graph(
-                            id="fin-line-chart",
-                            figure=build_finance_line_chart(roi_df, "revenue"),
-                            config={"displayModeBar": False}
+                        # Every metric's figure, sent once when the toggle is first opened;
+                        # switching metrics then happens in the browser (render_app.py)
+                        dcc.Loading(
+                            type="circle",
+                            children=[
+                                dcc.Store(id="fin-chart-store"),
+                                dcc.Graph(
+                                    id="fin-line-chart",
+                                    config={"displayModeBar": False}
+                                ),
+                            ],
                         )
                     ]
                 ),
@@ -2386,10 +3031,17 @@ def update_dashboard(selected_week, selected_franchisee="All"):
                                 )
                             ]
                         ),
-                        dcc.Graph(
-                            id="mkt-line-chart",
-                            figure=build_marketing_line_chart(roi_df, "cost_per_appt"),
-                            config={"displayModeBar": False}
+                        # Every metric's figure, sent once when the toggle is first opened;
+                        # switching metrics then happens in the browser (render_app.py)
+                        dcc.Loading(
+                            type="circle",
+                            children=[
+                                dcc.Store(id="mkt-chart-store"),
+                                dcc.Graph(
+                                    id="mkt-line-chart",
+                                    config={"displayModeBar": False}
+                                ),
+                            ],
                         )
                     ]
                 ),
@@ -2453,10 +3105,13 @@ def update_dashboard(selected_week, selected_franchisee="All"):
                     id="appts-forecast-container",
                     style={"display": "none", "marginBottom": "30px"},
                     children=[
-                        dcc.Graph(
-                            id="appts-forecast-chart",
-                            figure=build_appointments_forecast_chart(appts_all_df),
-                            config={"displayModeBar": False}
+                        # Empty until the toggle is first opened (render_app.py fills it in)
+                        dcc.Loading(
+                            type="circle",
+                            children=dcc.Graph(
+                                id="appts-forecast-chart",
+                                config={"displayModeBar": False}
+                            ),
                         )
                     ]
                 ),
@@ -2486,10 +3141,13 @@ def update_dashboard(selected_week, selected_franchisee="All"):
                     id="revenue-projection-container",
                     style={"display": "none", "marginBottom": "30px"},
                     children=[
-                        dcc.Graph(
-                            id="revenue-projection-chart",
-                            figure=build_revenue_projection_chart(appts_all_df, rpa_all_df),
-                            config={"displayModeBar": False}
+                        # Empty until the toggle is first opened (render_app.py fills it in)
+                        dcc.Loading(
+                            type="circle",
+                            children=dcc.Graph(
+                                id="revenue-projection-chart",
+                                config={"displayModeBar": False}
+                            ),
                         )
                     ]
                 ),
@@ -2536,3 +3194,186 @@ def update_dashboard(selected_week, selected_franchisee="All"):
 
     return dashboard_sections
 
+
+_response_cache = SharedJsonCache(RESPONSE_CACHE_DIR, RESPONSE_CACHE_MAX_FILES)
+# Data version the last render was for, and the week the page opens on (see prewarm_dashboard)
+_response_state = {"version": None, "default_week": None}
+
+
+def render_dashboard(selected_week):
+    """
+    update_dashboard(selected_week) as component JSON: the pre-rendered payload
+    if there is one, else rendered once per week and data version and shared by
+    every server process (RESPONSE_CACHE_DIR) - it's the same for every visitor
+    until the data changes. The first render for a new data version also
+    pre-renders the default week in the background.
+    """
+    children = read_static_payload("dashboard", selected_week)
+    if children is not None:
+        return children
+
+    version = current_data_version()
+    if _response_state["version"] != version:
+        first_render = _response_state["version"] is not None
+        _response_state["version"] = version
+        if first_render and _response_state["default_week"] not in (None, selected_week):
+            prewarm_dashboard(_response_state["default_week"])
+
+    key = ("dashboard", selected_week, version)
+    children = _dataset_cache.cached(version, key)
+    if children is not None:
+        _response_cache.count("memory_hits")
+        return children
+
+    text = _response_cache.get(key)
+    if text is None:
+        text = json.dumps(update_dashboard(selected_week), cls=PlotlyJSONEncoder)
+        # Only share it if the data didn't change while it was being rendered
+        if current_data_version() == version:
+            _response_cache.put(key, text)
+    return _dataset_cache.store(version, key, json.loads(text))
+
+
+def prewarm_dashboard(selected_week):
+    """
+    Render selected_week into the response cache in a background thread (the
+    week the page opens on: at startup, and again after a data reload).
+    """
+    _response_state["default_week"] = selected_week
+
+    def warm():
+        start = time.perf_counter()
+        try:
+            render_dashboard(selected_week)
+        except Exception as exc:
+            print(f"⚠️  Could not pre-render the dashboard for {selected_week}: {exc}")
+            return
+        print(f"🔥 Pre-rendered the dashboard for {selected_week} in {time.perf_counter() - start:.2f}s")
+
+    threading.Thread(target=warm, daemon=True).start()
+
+
+# Static payloads: every week's dashboard and every trend chart variant, rendered
+# at deploy time (render.yaml runs render_static_dashboard.py) next to the parquet
+# files, one folder per data version. index.json (written last) says which version
+# they were rendered from; anything else is rendered live as before.
+_static_state = {"checked_at": 0.0, "mtime": None, "index": None}
+
+
+def static_payload_name(kind: str, *parts) -> str:
+    """File name of one payload: ("dashboard", week) or ("chart", chart, metric)."""
+    name = "-".join("default" if part is None else str(part) for part in (kind, *parts))
+    return re.sub(r"[^0-9A-Za-z_-]+", "_", name) + ".json"
+
+
+def load_static_index():
+    """
+    The static payload index if it was rendered from the current data version,
+    else None. Like the manifest, index.json is looked at most once every
+    MANIFEST_CHECK_SECONDS.
+    """
+    if not USE_STATIC_PAYLOADS:
+        return None
+    now = time.monotonic()
+    if now - _static_state["checked_at"] >= MANIFEST_CHECK_SECONDS:
+        path = STATIC_PAYLOAD_DIR / STATIC_INDEX_FILE
+        mtime = get_file_mtime(path)
+        if mtime != _static_state["mtime"]:
+            try:
+                index = json.loads(path.read_text())
+            except (OSError, ValueError):
+                index = None
+            _static_state.update(mtime=mtime, index=index)
+        _static_state["checked_at"] = now
+
+    index = _static_state["index"]
+    if index is None or index["version"] != current_data_version():
+        return None
+    return index
+
+
+def read_static_payload(kind: str, *parts):
+    """A pre-rendered payload (parsed JSON) for the current data version, or None."""
+    index = load_static_index()
+    if index is None:
+        return None
+    # Parsed per request rather than kept: every week's dashboard would not fit in memory on Render
+    path = STATIC_PAYLOAD_DIR / index["directory"] / static_payload_name(kind, *parts)
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def static_week_options():
+    """The week dropdown options the payloads were rendered for, or None."""
+    index = load_static_index()
+    return None if index is None else index["week_options"]
+
+
+def write_static_payloads() -> dict:
+    """
+    Render every week's dashboard and every TREND_CHARTS variant of the data in
+    Master_Data into STATIC_PAYLOAD_DIR/<data version>/, then point index.json at
+    them and delete the folders of older versions. Returns the index, or None if
+    there is no manifest (or the data changed while rendering).
+    """
+    manifest = read_manifest(MASTER_DATA_DIR)
+    if manifest is None:
+        print("⚠️  No manifest.json - dashboard payloads not pre-rendered")
+        return None
+    version = manifest["version"]
+    # Every read below is pinned to this version (not the one this process saw up to
+    # MANIFEST_CHECK_SECONDS ago) and fails if the files change underneath it
+
+    start = time.perf_counter()
+    tmp_dir = STATIC_PAYLOAD_DIR / f".{version}.tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+
+    week_options = generate_week_options_from_parquet(load_view("week_options", version=version)["calls"])
+    for option in week_options:
+        children = update_dashboard(option["value"], version=version)
+        path = tmp_dir / static_payload_name("dashboard", option["value"])
+        path.write_text(json.dumps(children, cls=PlotlyJSONEncoder))
+
+    charts = 0
+    for chart in TREND_CHARTS:
+        for metric in TREND_CHART_METRICS.get(chart, [None]):
+            path = tmp_dir / static_payload_name("chart", chart, metric)
+            path.write_text(json.dumps(_render_trend_chart(chart, metric, version)))
+            charts += 1
+
+    current = read_manifest(MASTER_DATA_DIR)
+    if current is None or current["version"] != version:
+        print(f"⚠️  Data changed while pre-rendering version {version} - payloads discarded")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return None
+
+    out_dir = STATIC_PAYLOAD_DIR / version
+    shutil.rmtree(out_dir, ignore_errors=True)
+    tmp_dir.rename(out_dir)
+
+    index = {
+        "version": version,
+        "directory": out_dir.name,
+        "rendered_at": datetime.now().isoformat(timespec="seconds"),
+        "week_options": week_options,
+        "dashboards": len(week_options),
+        "charts": charts,
+    }
+    index_path = STATIC_PAYLOAD_DIR / STATIC_INDEX_FILE
+    tmp_path = index_path.with_name(f".{STATIC_INDEX_FILE}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(index, indent=2))
+    os.replace(tmp_path, index_path)
+
+    for old in STATIC_PAYLOAD_DIR.iterdir():
+        if old.is_dir() and old.name != out_dir.name:
+            shutil.rmtree(old, ignore_errors=True)
+
+    size = sum(path.stat().st_size for path in out_dir.iterdir())
+    print(
+        f"🖼️  Pre-rendered {len(week_options)} week(s) + {charts} chart(s) for data version {version}: "
+        f"{size / 1e6:.1f} MB in {time.perf_counter() - start:.1f}s"
+    )
+    return index
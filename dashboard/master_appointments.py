@@ -0,0 +1,213 @@
+# master_appointments.py
+"""
+Future appointments stored as changes between weekly snapshots.
+
+The updater fetches the whole future-appointment pipeline every week. Saving
+every fetch in full stores each appointment once per week it is pending, so the
+appts dataset is a change log instead. Each week partition (same layout as the
+other datasets) holds:
+  • one "snapshot" row for the fetch itself (week_start / week_end / fetched_at)
+  • "added" / "changed" rows: the full row of an appointment that is new, or that
+    differs from its previous version (any column except the fetch columns)
+  • "removed" rows: just the ID of an appointment that is no longer pending
+Appointments that didn't change aren't written again.
+
+appointment_versions() turns the log into one row per appointment version with
+the snapshot weeks it was valid for (valid_from <= week < valid_to, valid_to
+empty = still pending), and appointments_as_of() is the pipeline as a snapshot
+saw it:
+
+    versions = appointment_versions(read_dataset("appts"))
+    appointments_as_of(versions, week_start)   # None = the latest snapshot
+
+Files from before the change log (a full copy of the pipeline per week, no
+change_type column) are read the same way; the next write_appointments() or
+migrate_master_data.py converts them.
+"""
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from master_data import (
+    DATASET_FILES, MASTER_DATA_DIR, WEEK_COLUMNS, normalize, read_dataset, to_week_date, write_week,
+)
+
+APPOINTMENT_KEY = "ID"
+CHANGE_COLUMN = "change_type"
+SNAPSHOT, ADDED, CHANGED, REMOVED = "snapshot", "added", "changed", "removed"
+VALID_FROM, VALID_TO = "valid_from", "valid_to"
+
+# Columns describing the fetch rather than the appointment (not compared between snapshots)
+FETCH_COLUMNS = WEEK_COLUMNS + ("fetched_at",)
+NOT_COMPARED = FETCH_COLUMNS + (CHANGE_COLUMN, VALID_FROM, VALID_TO)
+
+
+def is_change_log(df: pd.DataFrame) -> bool:
+    """True if df (the appts dataset) is stored as changes, False for full weekly copies."""
+    return CHANGE_COLUMN in df.columns and df[CHANGE_COLUMN].notna().any()
+
+
+def _ids(df: pd.DataFrame) -> pd.Series:
+    # Compared as text, so an ID read back from parquet matches a freshly fetched one
+    return df[APPOINTMENT_KEY].astype(str)
+
+
+def _row_hashes(df: pd.DataFrame, columns: list) -> pd.Series:
+    """One hash per row over the appointment's values (as text; missing and "" are the same)."""
+    values = df.reindex(columns=columns).astype("string").fillna("")
+    return pd.util.hash_pandas_object(values, index=False)
+
+
+def fetch_info(df: pd.DataFrame) -> dict:
+    """week_start / week_end / fetched_at of a one-week fetch (from its first row)."""
+    first = df.iloc[0]
+    return {col: first[col] if col in df.columns else None for col in FETCH_COLUMNS}
+
+
+def snapshot_changes(previous: pd.DataFrame, snapshot: pd.DataFrame, fetch: dict) -> pd.DataFrame:
+    """
+    Change rows for one week's fetch of the pipeline (`snapshot`, with `fetch`:
+    week_start / week_end / fetched_at) against `previous`, the pipeline as of the
+    snapshot before it (empty for the first one). Always includes the snapshot row.
+    """
+    missing_id = snapshot[APPOINTMENT_KEY].isna()
+    if missing_id.any():
+        print(f"⚠️  {missing_id.sum()} appointment(s) have no {APPOINTMENT_KEY} - not saved")
+    snapshot = snapshot[~missing_id]
+    snapshot = snapshot[~_ids(snapshot).duplicated()]
+
+    columns = [
+        col for col in dict.fromkeys([*previous.columns, *snapshot.columns])
+        if col not in NOT_COMPARED and col != APPOINTMENT_KEY
+    ]
+    new_ids, old_ids = _ids(snapshot), _ids(previous)
+    unchanged = pd.MultiIndex.from_arrays([new_ids, _row_hashes(snapshot, columns)]).isin(
+        pd.MultiIndex.from_arrays([old_ids, _row_hashes(previous, columns)])
+    )
+    added = ~new_ids.isin(old_ids)
+
+    changed = snapshot[~unchanged].assign(**fetch, **{
+        CHANGE_COLUMN: np.where(added[~unchanged], ADDED, CHANGED),
+    })
+    removed = pd.DataFrame({APPOINTMENT_KEY: previous.loc[~old_ids.isin(new_ids), APPOINTMENT_KEY].to_numpy()})
+    removed = removed.assign(**fetch, **{CHANGE_COLUMN: REMOVED})
+    marker = pd.DataFrame([{**fetch, CHANGE_COLUMN: SNAPSHOT}])
+
+    order = list(dict.fromkeys([*snapshot.columns, *FETCH_COLUMNS, CHANGE_COLUMN]))
+    frames = [frame for frame in (marker, changed, removed) if len(frame)]
+    return pd.concat(frames, ignore_index=True).reindex(columns=order)
+
+
+def appointment_changes(snapshots: list) -> pd.DataFrame:
+    """Change log for full weekly fetches [(fetch info, pipeline DataFrame), ...], oldest first."""
+    changes = []
+    previous = pd.DataFrame(columns=[APPOINTMENT_KEY])
+    for fetch, snapshot in sorted(snapshots, key=lambda item: item[0]["week_start"]):
+        changes.append(snapshot_changes(previous, snapshot, fetch))
+        previous = snapshot
+    return pd.concat(changes, ignore_index=True) if changes else pd.DataFrame()
+
+
+def full_snapshots(df: pd.DataFrame) -> list:
+    """[(fetch info, pipeline), ...] per week of an appts dataset in the old full-copy format."""
+    if df.empty:
+        return []
+    return [(fetch_info(week_df), week_df) for _, week_df in df.groupby("week_start", sort=True, observed=True)]
+
+
+def appointment_versions(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    One row per appointment version: its columns plus valid_from (the snapshot week
+    it was first fetched like this) and valid_to (the first snapshot week it had
+    changed or was gone in; None while it is still pending). week_start / week_end /
+    fetched_at are those of the valid_from snapshot.
+    df is the appts dataset as stored (either format, any subset of columns that
+    includes ID and the week columns).
+    """
+    if df.empty:
+        return df.assign(**{VALID_FROM: [], VALID_TO: []})
+    if not is_change_log(df):
+        df = normalize(appointment_changes(full_snapshots(df)), Path(DATASET_FILES["appts"]).stem)
+
+    rows = df[df[CHANGE_COLUMN] != SNAPSHOT]
+    rows = rows.assign(**{VALID_FROM: rows["week_start"].astype(object)})
+    rows = rows.sort_values([APPOINTMENT_KEY, VALID_FROM], kind="stable")
+    valid_to = rows.groupby(APPOINTMENT_KEY, sort=False)[VALID_FROM].shift(-1)
+
+    versions = rows.assign(**{VALID_TO: valid_to.astype(object).where(valid_to.notna(), None)})
+    versions = versions[versions[CHANGE_COLUMN] != REMOVED]
+    return versions.drop(columns=[CHANGE_COLUMN]).reset_index(drop=True)
+
+
+def appointments_as_of(versions: pd.DataFrame, week_start=None) -> pd.DataFrame:
+    """
+    The future-appointment pipeline as of the snapshot fetched in (or last before)
+    `week_start`, one row per pending appointment; None = the latest snapshot.
+    Empty before the first snapshot.
+    """
+    if versions.empty:
+        return versions
+    if week_start is None:
+        pending = versions[VALID_TO].isna()
+    else:
+        week_start = to_week_date(week_start)
+        pending = (versions[VALID_FROM] <= week_start) & (versions[VALID_TO].fillna(date.max) > week_start)
+    return versions[pending].reset_index(drop=True)
+
+
+def stored_snapshots(df: pd.DataFrame) -> list:
+    """[(fetch info, full pipeline), ...] for every snapshot in an appts dataset (either format)."""
+    if not is_change_log(df):
+        return full_snapshots(df)
+    versions = appointment_versions(df)
+    markers = df[df[CHANGE_COLUMN] == SNAPSHOT]
+    snapshots = []
+    for _, marker in markers.iterrows():
+        fetch = {col: marker[col] for col in FETCH_COLUMNS}
+        pipeline = appointments_as_of(versions, fetch["week_start"]).drop(columns=[VALID_FROM, VALID_TO])
+        snapshots.append((fetch, pipeline.assign(**fetch)))
+    return snapshots
+
+
+def write_appointments(snapshot: pd.DataFrame, master_data_dir: Path = MASTER_DATA_DIR) -> list:
+    """
+    Save one week's fetch of the pipeline (with week_start / week_end / fetched_at)
+    as changes against the snapshot before it - only that week's partition is
+    written. Re-fetching a week replaces its changes; fetching an older week than
+    the newest saved one (or saving over files in the old full-copy format)
+    rewrites the weeks from there on. Returns the partition files written.
+    """
+    dataset = Path(DATASET_FILES["appts"]).stem
+    snapshot = normalize(snapshot, dataset)
+    fetch = fetch_info(snapshot)
+    week = to_week_date(fetch["week_start"])
+    stored = read_dataset("appts", master_data_dir)
+
+    if is_change_log(stored):
+        snapshot_weeks = stored.loc[stored[CHANGE_COLUMN] == SNAPSHOT, "week_start"].astype(object)
+        if not (snapshot_weeks > week).any():
+            # The usual case: a new week only needs the pipeline as of the week before it
+            previous = appointments_as_of(appointment_versions(stored), week - timedelta(days=1))
+            return write_week(snapshot_changes(previous, snapshot, fetch), "appts", master_data_dir)
+
+    # Rebuild the log from every snapshot (this one replacing a re-fetched week)
+    snapshots = [(f, s) for f, s in stored_snapshots(stored) if to_week_date(f["week_start"]) != week]
+    changes = appointment_changes(snapshots + [(fetch, snapshot)])
+    if is_change_log(stored):
+        changes = changes[changes["week_start"].map(to_week_date) >= week]
+    return write_week(changes, "appts", master_data_dir)
+
+
+def migrate_appointments(master_data_dir: Path = MASTER_DATA_DIR) -> int:
+    """
+    Convert an appts dataset saved as full weekly copies into the change log.
+    Returns the number of snapshots converted (0 if it already is one, or is empty).
+    """
+    stored = read_dataset("appts", master_data_dir)
+    if stored.empty or is_change_log(stored):
+        return 0
+    snapshots = full_snapshots(stored)
+    write_week(appointment_changes(snapshots), "appts", master_data_dir)
+    return len(snapshots)
@@ -0,0 +1,865 @@
+# master_data.py
+"""
+Storage format helpers for the Master_Data parquet files.
+
+Shared by the dashboard (reads) and the updater (writes), so both sides agree
+on column types. The updater imports this module by adding dashboard/ to
+sys.path.
+"""
+import hashlib
+import json
+import os
+import shutil
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+MASTER_DATA_DIR = Path(__file__).resolve().parent / "Master_Data"
+
+# The live dataset files (backups and other copies are not part of a data version)
+DATASET_FILES = {
+    "jobs": "all_jobs_data.parquet",
+    "calls": "all_call_center_data.parquet",
+    "roi": "all_roi_data.parquet",
+    "rpa": "projections_rpa_data.parquet",
+    "sales": "projections_sales_data.parquet",
+    "appts": "projections_appointments_data.parquet",
+    "summary": "weekly_summary.parquet",
+}
+MANIFEST_FILE = "manifest.json"
+
+# Week columns are stored as native date32 (python `date` objects in pandas)
+WEEK_COLUMNS = ("week_start", "week_end")
+WEEK_FORMAT = "%m/%d/%Y"
+
+# Canvas returns money/counts as display text ("$1,234.56", "79%").
+# ROI values are only ever used as numbers, so they are stored as float64 in place.
+# Rankings tables show the Canvas text, so they keep it and get a float64
+# "<col> Value" companion (same idea as "Inbound Rate Value" in the call center data).
+NUMERIC_COLUMNS = {
+    "all_roi_data": (
+        "Amount Invested", "# of Leads", "Cost Per Lead", "# of Appts", "Cost Per Appt",
+        "Cost Per Appt (Inc Designer Cancelled)", "Revenue Per Appt", "# of Sales",
+        "Avg Sale", "Revenue", "ROI",
+    ),
+}
+VALUE_COLUMNS = {
+    "projections_rpa_data": (
+        "# Sales", "RollingHelp Rate", "Average Sale", "Revenue perAppointment",
+        "Revenue per Appointment", "Revenue Per Appointment", "RPA",
+        "Previous Period", "Difference",
+    ),
+    "projections_sales_data": (
+        "Sales", "Prior Period", "% Diff", "Previous Year", "% Diff (vs Prior Period)",
+        "Months Open",
+    ),
+}
+# Rankings are sorted/filtered on, so Rank is stored as an integer
+RANK_DATASETS = ("projections_rpa_data", "projections_sales_data")
+
+# Low-cardinality columns repeated on every row: kept as pandas `category` (integer
+# codes + one copy of each value). String columns are written as Arrow dictionary
+# columns so they come back as categories; date32 week columns can't be stored as
+# Arrow dictionaries in parquet (they are still dictionary-encoded on disk), so
+# they are turned into ordered categories on load.
+CATEGORY_COLUMNS = ("mode", "Call Center Rep", "Location", "week_start", "week_end", "fetched_at", "change_type")
+CATEGORY_DATASETS = (
+    "all_call_center_data",
+    "projections_rpa_data",
+    "projections_sales_data",
+    "projections_appointments_data",
+)
+
+# Files that are always read whole, so they aren't split into one row group per week
+WHOLE_FILE_DATASETS = ("weekly_summary",)
+
+
+def to_week_date(value) -> date:
+    """Convert a "MM/DD/YYYY" string, datetime or date into a `date`."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value), WEEK_FORMAT).date()
+
+
+def format_week_date(value) -> str:
+    """Format a week date back into the "MM/DD/YYYY" form Canvas and the UI use."""
+    return to_week_date(value).strftime(WEEK_FORMAT)
+
+
+def is_date_column(values: pd.Series) -> bool:
+    """True if the column already holds `date` objects (date32 in parquet)."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.cat.categories
+    return pd.api.types.infer_dtype(values, skipna=True) in ("date", "empty")
+
+
+def normalize_week_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return df with week_start/week_end as `date` objects.
+    Files written before the date32 migration still hold "MM/DD/YYYY" strings,
+    so this is a no-op for migrated files and a one-time parse for old ones.
+    """
+    converted = {}
+    for col in WEEK_COLUMNS:
+        if col not in df.columns or is_date_column(df[col]):
+            continue
+        values = df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            values = values.astype(object)
+        if pd.api.types.is_datetime64_any_dtype(values):
+            converted[col] = values.dt.date
+        else:
+            converted[col] = pd.to_datetime(values, format=WEEK_FORMAT, errors="coerce").dt.date
+
+    return df.assign(**converted) if converted else df
+
+
+def value_column(col: str) -> str:
+    """Name of the float64 companion column for a display column."""
+    return f"{col} Value"
+
+
+def parse_numeric(values: pd.Series) -> pd.Series:
+    """
+    Vectorized "$1,234.56" / "79%" / "185" → float64.
+    Blank or non-numeric cells ("", "-") become NaN.
+    """
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        return values.astype("float64")
+    cleaned = values.astype("string").str.replace(r"[^\d\.\-]", "", regex=True)
+    return pd.to_numeric(cleaned, errors="coerce").astype("float64")
+
+
+def dataset_for(path) -> str:
+    """Map a parquet path (including *_backup_* copies and week partitions) to its dataset key."""
+    path = Path(path)
+    if partition_week(path) is not None:
+        stem = path.parent.parent.name
+    elif path.name == COMPACTED_FILE:
+        stem = path.parent.name
+    else:
+        stem = path.stem
+    return stem.split("_backup")[0]
+
+
+def normalize_numeric_columns(df: pd.DataFrame, dataset: str) -> pd.DataFrame:
+    """
+    Return df with the dataset's numeric columns parsed once, at ingest.
+    Columns that are already float64 are left alone, so this is cheap on migrated files.
+    """
+    converted = {}
+
+    for col in NUMERIC_COLUMNS.get(dataset, ()):
+        if col in df.columns and df[col].dtype != "float64":
+            converted[col] = parse_numeric(df[col])
+
+    for col in VALUE_COLUMNS.get(dataset, ()):
+        value_col = value_column(col)
+        if col in df.columns and (value_col not in df.columns or df[value_col].isna().any()):
+            converted[value_col] = parse_numeric(df[col])
+
+    if dataset in RANK_DATASETS and "Rank" in df.columns and df["Rank"].dtype != "Int64":
+        converted["Rank"] = parse_numeric(df["Rank"]).round().astype("Int64")
+
+    return df.assign(**converted) if converted else df
+
+
+def normalize_category_columns(df: pd.DataFrame, dataset: str) -> pd.DataFrame:
+    """
+    Return df with the dataset's repetitive columns as `category`.
+    Week columns become *ordered* categories (sorted by date) so min/max/sort keep working.
+    """
+    if dataset not in CATEGORY_DATASETS:
+        return df
+
+    converted = {}
+    for col in CATEGORY_COLUMNS:
+        if col not in df.columns:
+            continue
+        values = df[col]
+        ordered = col in WEEK_COLUMNS
+
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            categories = values.cat.categories
+            if values.cat.ordered == ordered and (not ordered or categories.is_monotonic_increasing):
+                continue
+            values = values.astype(object)
+
+        converted[col] = pd.Categorical(values, ordered=ordered)
+
+    return df.assign(**converted) if converted else df
+
+
+def normalize(df: pd.DataFrame, dataset: str = None) -> pd.DataFrame:
+    """Apply every storage normalization (week dates, numeric and category columns)."""
+    df = normalize_week_columns(df)
+    if dataset:
+        df = normalize_numeric_columns(df, dataset)
+        df = normalize_category_columns(df, dataset)
+    return df
+
+
+def week_row_groups(parquet_file: pq.ParquetFile, weeks: tuple) -> list:
+    """
+    Row groups whose week_start min/max statistics overlap `weeks`
+    ((first, last) week_start dates, inclusive). Row groups without statistics are kept.
+    """
+    metadata = parquet_file.metadata
+    column = metadata.schema.names.index("week_start")
+    first, last = weeks
+
+    row_groups = []
+    for i in range(metadata.num_row_groups):
+        stats = metadata.row_group(i).column(column).statistics
+        if stats is not None and stats.has_min_max and (stats.max < first or stats.min > last):
+            continue
+        row_groups.append(i)
+    return row_groups
+
+
+def filter_week_range(df: pd.DataFrame, weeks: tuple) -> pd.DataFrame:
+    """Rows of df whose week_start falls in `weeks` ((first, last), inclusive). None = every row."""
+    if weeks is None or df.empty or "week_start" not in df.columns:
+        return df
+    first, last = weeks
+    starts = df["week_start"]
+
+    if isinstance(starts.dtype, pd.CategoricalDtype):
+        # Compare the (few) categories once, then pick rows by code; code -1 (missing) maps to False
+        categories = pd.Series(starts.cat.categories)
+        keep = np.append(((categories >= first) & (categories <= last)).to_numpy(), False)
+        return df[keep[starts.cat.codes.to_numpy()]]
+
+    return df[(starts >= first) & (starts <= last)]
+
+
+def read_table(source, columns=None, weeks=None) -> pa.Table:
+    """
+    Read a parquet file (path or file-like) as an Arrow table, decoding only `columns` (None = all).
+    Columns the file doesn't have are skipped, so files from before a column existed still load.
+
+    With `weeks` ((first, last) week_start dates) only the row groups whose statistics
+    overlap that range are read. Rows are not filtered here - see filter_week_range.
+    Files with "MM/DD/YYYY" string weeks have no usable statistics and are read in full.
+    """
+    parquet_file = pq.ParquetFile(source)
+    schema = parquet_file.schema_arrow
+    names = None if columns is None else [col for col in schema.names if col in columns]
+
+    if (
+        weeks is not None
+        and "week_start" in schema.names
+        and pa.types.is_date32(schema.field("week_start").type)
+    ):
+        table = parquet_file.read_row_groups(week_row_groups(parquet_file, weeks), columns=names)
+    else:
+        table = parquet_file.read(columns=names)
+    return table
+
+
+def read_columns(source, columns=None, weeks=None) -> pd.DataFrame:
+    """read_table() as a DataFrame (not normalized - see read_parquet)."""
+    return read_table(source, columns, weeks).to_pandas()
+
+
+def read_parquet(path: Path, columns=None, weeks=None) -> pd.DataFrame:
+    """
+    Read a Master_Data parquet file with typed week and numeric columns
+    (optionally only `columns`, and only the weeks in `weeks`).
+    """
+    df = normalize(read_columns(path, columns, weeks), dataset_for(path))
+    return filter_week_range(df, weeks)
+
+
+def _replace_atomically(path: Path, write):
+    """Write to a temp file next to `path`, then swap it in, so readers never see a half-written file."""
+    path = Path(path)
+    # Per-process temp name: several dashboard workers may rebuild the same snapshot at once
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def week_bounds(df: pd.DataFrame) -> list:
+    """(start, stop) row positions of each week in a frame sorted by week_start."""
+    positions = df.groupby("week_start", sort=False, observed=True, dropna=False).indices.values()
+    return sorted((rows[0], rows[-1] + 1) for rows in positions)
+
+
+def has_week_row_groups(path: Path) -> bool:
+    """True if the file is sorted by week_start with one row group per week (see write_parquet)."""
+    parquet_file = pq.ParquetFile(path)
+    if "week_start" not in parquet_file.schema_arrow.names:
+        return True
+    if not pa.types.is_date32(parquet_file.schema_arrow.field("week_start").type):
+        return False
+
+    metadata = parquet_file.metadata
+    column = metadata.schema.names.index("week_start")
+    previous = None
+    for i in range(metadata.num_row_groups):
+        stats = metadata.row_group(i).column(column).statistics
+        if stats is None or not stats.has_min_max or stats.min != stats.max:
+            return False
+        if previous is not None and stats.min <= previous:
+            return False
+        previous = stats.min
+    return True
+
+
+def write_parquet(df: pd.DataFrame, path: Path):
+    """
+    Write a Master_Data parquet file in the current storage format.
+
+    Rows are sorted by week (stable, so the order inside a week is kept) and each
+    week is written as its own row group. The row-group min/max statistics then
+    let week-range reads (read_columns(..., weeks=...)) skip every other week.
+    """
+    dataset = dataset_for(path)
+    df = normalize(df, dataset)
+
+    # Filtering (e.g. remove_bad_week) leaves unused categories behind - don't persist them
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].cat.remove_unused_categories()
+
+    # The weekly summary is always read whole (trend charts), so it stays one row group
+    if "week_start" not in df.columns or dataset in WHOLE_FILE_DATASETS or df.empty:
+        _replace_atomically(path, lambda tmp_path: df.to_parquet(tmp_path, index=False))
+        return
+
+    df = df.sort_values("week_start", kind="stable").reset_index(drop=True)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    def write(tmp_path):
+        with pq.ParquetWriter(tmp_path, table.schema) as writer:
+            for start, stop in week_bounds(df):
+                writer.write_table(table.slice(start, stop - start))
+
+    _replace_atomically(path, write)
+
+
+# --- Partitioned layout ---------------------------------------------------
+# Each week-based dataset lives in its own directory, one file per week:
+#   Master_Data/all_call_center_data/week_start=2026-02-01/part-0.parquet
+# Appending a week writes only that week's file and replacing a week is one
+# partition overwrite. compact_dataset() folds old weeks into a single
+# compacted.parquet (still one row group per week); a week partition always
+# wins over the same week inside compacted.parquet.
+# Datasets that haven't been split yet are still read from the single
+# <dataset>.parquet file; the first write_week() splits them.
+PARTITIONED_DATASETS = ("jobs", "calls", "roi", "rpa", "sales", "appts")
+PARTITION_PREFIX = "week_start="
+PART_FILE = "part-0.parquet"
+COMPACTED_FILE = "compacted.parquet"
+
+# compact_dataset() leaves this many recent weeks as their own partitions
+COMPACT_KEEP_WEEKS = 13
+
+
+def dataset_dir(name: str, master_data_dir: Path = MASTER_DATA_DIR) -> Path:
+    """Directory of a partitioned dataset (Master_Data/<file stem>/)."""
+    return Path(master_data_dir) / Path(DATASET_FILES[name]).stem
+
+
+def partition_path(name: str, week_start, master_data_dir: Path = MASTER_DATA_DIR) -> Path:
+    """File holding one week of a partitioned dataset."""
+    week_dir = f"{PARTITION_PREFIX}{to_week_date(week_start).isoformat()}"
+    return dataset_dir(name, master_data_dir) / week_dir / PART_FILE
+
+
+def partition_week(path) -> date:
+    """The week_start a partition file holds (from its directory name), or None for other files."""
+    parent = Path(path).parent.name
+    if not parent.startswith(PARTITION_PREFIX):
+        return None
+    return date.fromisoformat(parent[len(PARTITION_PREFIX):])
+
+
+def _file_order(path):
+    # compacted.parquet / the single legacy file first, then partitions by week
+    return (partition_week(path) is not None, Path(path).as_posix())
+
+
+def dataset_files(name: str, master_data_dir: Path = MASTER_DATA_DIR) -> list:
+    """
+    The files a dataset is stored in: compacted.parquet + week partitions (oldest first)
+    for a partitioned dataset, else the single <dataset>.parquet file (if it exists).
+    """
+    directory = dataset_dir(name, master_data_dir)
+    if directory.is_dir():
+        files = list(directory.glob(f"{PARTITION_PREFIX}*/{PART_FILE}"))
+        if (directory / COMPACTED_FILE).exists():
+            files.append(directory / COMPACTED_FILE)
+        return sorted(files, key=_file_order)
+
+    path = Path(master_data_dir) / DATASET_FILES[name]
+    return [path] if path.exists() else []
+
+
+def dataset_mtime(name: str, master_data_dir: Path = MASTER_DATA_DIR) -> float:
+    """Latest modification time across a dataset's files, or 0 if it has none."""
+    return max((path.stat().st_mtime for path in dataset_files(name, master_data_dir)), default=0)
+
+
+def read_dataset_files(files: list, columns=None, weeks=None, read_file=None) -> pd.DataFrame:
+    """
+    Combine a dataset's files (see dataset_files) into one normalized frame, sorted by week.
+
+    Partitions outside `weeks` are skipped without being opened, and rows of
+    compacted.parquet for a week that also has a partition are dropped.
+    read_file(path, columns, weeks) reads one file as an Arrow table (default:
+    read_table); the tables are joined in Arrow and converted to pandas once.
+    """
+    read_file = read_file or read_table
+    files = sorted(files, key=_file_order)
+    partition_weeks = sorted({partition_week(path) for path in files} - {None})
+
+    tables = []
+    for path in files:
+        week = partition_week(path)
+        if week is not None and weeks is not None and not weeks[0] <= week <= weeks[1]:
+            continue
+        table = read_file(path, columns, weeks)
+        if week is None and partition_weeks and pa.types.is_date32(table.schema.field("week_start").type):
+            replaced = pc.is_in(table["week_start"], value_set=pa.array(partition_weeks, pa.date32()))
+            table = table.filter(pc.invert(replaced))
+        tables.append(table)
+
+    if not tables and files:
+        # No week in range - still return the columns (read_file prunes every row group)
+        tables = [read_file(files[-1], columns, weeks)]
+    if not tables:
+        return pd.DataFrame()
+
+    table = tables[0] if len(tables) == 1 else pa.concat_tables(tables, promote_options="permissive")
+    df = filter_week_range(normalize(table.to_pandas(), dataset_for(files[0])), weeks)
+    if len(tables) > 1:
+        df = df.sort_values("week_start", kind="stable").reset_index(drop=True)
+    return df
+
+
+def read_dataset(name: str, master_data_dir: Path = MASTER_DATA_DIR, columns=None, weeks=None) -> pd.DataFrame:
+    """Read a whole dataset (optionally only `columns` / the `weeks` range), whatever its layout."""
+    return read_dataset_files(dataset_files(name, master_data_dir), columns, weeks)
+
+
+def dataset_weeks(name: str, master_data_dir: Path = MASTER_DATA_DIR, by: str = None):
+    """
+    The week_start dates a dataset has rows for. Week partitions are known from
+    their directory names, so only compacted.parquet / a single-file dataset is
+    read (week_start column only). With `by` (e.g. "mode") every file's
+    week_start + `by` columns are read and the result is {value: set of weeks}.
+    """
+    files = dataset_files(name, master_data_dir)
+    if by is None:
+        weeks = {partition_week(path) for path in files} - {None}
+        files = [path for path in files if partition_week(path) is None]
+        if files:
+            weeks |= set(read_dataset_files(files, columns=["week_start"])["week_start"].dropna())
+        return weeks
+
+    df = read_dataset_files(files, columns=["week_start", by])
+    if df.empty or by not in df.columns:
+        return {}
+    return {
+        value: set(week_df["week_start"].dropna())
+        for value, week_df in df.groupby(by, observed=True)
+    }
+
+
+def _write_partitions(df: pd.DataFrame, name: str, master_data_dir: Path) -> list:
+    """Write each week of df to its partition file (replacing it). Returns the paths written."""
+    if df.empty:
+        return []
+    df = normalize(df, Path(DATASET_FILES[name]).stem)
+    missing_week = df["week_start"].isna()
+    if missing_week.any():
+        print(f"⚠️  {missing_week.sum()} {name} row(s) have no week_start - not saved")
+
+    paths = []
+    for week_start, week_df in df[~missing_week].groupby("week_start", sort=True, observed=True):
+        path = partition_path(name, week_start, master_data_dir)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_parquet(week_df, path)
+        paths.append(path)
+    return paths
+
+
+def partition_dataset(name: str, master_data_dir: Path = MASTER_DATA_DIR) -> int:
+    """
+    Split a single-file dataset into week partitions. The data as it was is
+    saved as a history version first (master_history.py - restore it to undo
+    this); the directory is built under Master_Data/.partitioning/ and moved
+    into place in one rename, and the old file is removed.
+    Returns the number of weeks written (0 if there was nothing to split).
+    """
+    # master_history imports this module
+    from master_history import save_version
+
+    master_data_dir = Path(master_data_dir)
+    directory = dataset_dir(name, master_data_dir)
+    legacy_path = master_data_dir / DATASET_FILES[name]
+    if directory.is_dir() or not legacy_path.exists():
+        return 0
+
+    # Manifest of the files as they are right now (an update may be mid-way), so the version can be saved
+    write_manifest(master_data_dir)
+    saved = save_version(master_data_dir, note=f"before partitioning {legacy_path.name}")
+    print(f"🕓 Saved version {saved['id']} before partitioning {legacy_path.name}")
+
+    staging_dir = master_data_dir / ".partitioning"
+    shutil.rmtree(dataset_dir(name, staging_dir), ignore_errors=True)
+    paths = _write_partitions(read_parquet(legacy_path), name, staging_dir)
+
+    dataset_dir(name, staging_dir).mkdir(parents=True, exist_ok=True)
+    os.replace(dataset_dir(name, staging_dir), directory)
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    legacy_path.unlink()
+    return len(paths)
+
+
+def write_week(df: pd.DataFrame, name: str, master_data_dir: Path = MASTER_DATA_DIR) -> list:
+    """
+    Save the weeks in df to a dataset: each week's partition file is replaced,
+    nothing else is read or rewritten. Splits a single-file dataset first.
+    Returns the partition files written.
+    """
+    partition_dataset(name, master_data_dir)
+    dataset_dir(name, master_data_dir).mkdir(parents=True, exist_ok=True)
+    return _write_partitions(df, name, master_data_dir)
+
+
+def delete_week(name: str, week_start, master_data_dir: Path = MASTER_DATA_DIR) -> bool:
+    """
+    Remove one week from a dataset: drop its partition, and its rows in
+    compacted.parquet if it was compacted. Returns True if anything was removed.
+    """
+    partition_dataset(name, master_data_dir)
+    week_start = to_week_date(week_start)
+    removed = False
+
+    path = partition_path(name, week_start, master_data_dir)
+    if path.exists():
+        shutil.rmtree(path.parent)
+        removed = True
+
+    compacted_path = dataset_dir(name, master_data_dir) / COMPACTED_FILE
+    if compacted_path.exists():
+        compacted = read_parquet(compacted_path)
+        in_week = compacted["week_start"] == week_start
+        if in_week.any():
+            write_parquet(compacted[~in_week], compacted_path)
+            removed = True
+
+    return removed
+
+
+def compact_dataset(name: str, master_data_dir: Path = MASTER_DATA_DIR, keep_weeks: int = COMPACT_KEEP_WEEKS) -> int:
+    """
+    Fold every week partition except the newest `keep_weeks` into compacted.parquet
+    (sorted, one row group per week, so week-range reads still skip weeks).
+    Returns the number of partitions folded in.
+    """
+    partition_dataset(name, master_data_dir)
+    files = dataset_files(name, master_data_dir)
+    partitions = [path for path in files if partition_week(path) is not None]
+    old = partitions[:-keep_weeks] if keep_weeks > 0 else partitions
+    if not old:
+        return 0
+
+    compacted_path = dataset_dir(name, master_data_dir) / COMPACTED_FILE
+    base = [compacted_path] if compacted_path.exists() else []
+
+    # Write the merged file first: until the partitions are removed they win over
+    # their (identical) copies in compacted.parquet, so readers never see a gap
+    write_parquet(read_dataset_files(base + old), compacted_path)
+    for path in old:
+        shutil.rmtree(path.parent)
+    return len(old)
+
+
+# --- Manifest -------------------------------------------------------------
+# manifest.json describes one consistent data version: a hash, row count and
+# week range per dataset file. The updater writes it (atomically) after the
+# parquet files, and the dashboard only watches this one file.
+
+def file_sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _week_range(path: Path) -> tuple:
+    """(first week_start, last week_end) of a parquet file as ISO strings, or (None, None)."""
+    columns = [col for col in WEEK_COLUMNS if col in pq.read_schema(path).names]
+    if len(columns) < len(WEEK_COLUMNS):
+        return None, None
+    weeks = normalize_week_columns(pd.read_parquet(path, columns=columns)).dropna()
+    if weeks.empty:
+        return None, None
+    return weeks["week_start"].min().isoformat(), weeks["week_end"].max().isoformat()
+
+
+def build_manifest(master_data_dir: Path = MASTER_DATA_DIR) -> dict:
+    """Describe the dataset files currently in master_data_dir."""
+    master_data_dir = Path(master_data_dir)
+    files = {}
+
+    paths = [(name, path) for name in DATASET_FILES for path in dataset_files(name, master_data_dir)]
+    for name, path in paths:
+        filename = path.relative_to(master_data_dir).as_posix()
+        first_week, last_week = _week_range(path)
+        files[filename] = {
+            "dataset": name,
+            "sha256": file_sha256(path.read_bytes()),
+            "rows": pq.read_metadata(path).num_rows,
+            "week_start_min": first_week,
+            "week_end_max": last_week,
+        }
+
+    # Same bytes -> same version, so re-running the updater without new data is a no-op
+    version = file_sha256(
+        "\n".join(f"{filename}:{info['sha256']}" for filename, info in sorted(files.items())).encode()
+    )[:16]
+
+    return {
+        "version": version,
+        "written_at": datetime.now().isoformat(timespec="seconds"),
+        "files": files,
+    }
+
+
+def write_manifest(master_data_dir: Path = MASTER_DATA_DIR) -> dict:
+    """Write manifest.json for the files in master_data_dir. Call after all parquet writes."""
+    manifest = build_manifest(master_data_dir)
+    path = Path(master_data_dir) / MANIFEST_FILE
+    _replace_atomically(path, lambda tmp_path: tmp_path.write_text(json.dumps(manifest, indent=2)))
+    return manifest
+
+
+def read_manifest(master_data_dir: Path = MASTER_DATA_DIR) -> dict:
+    """The current manifest, or None if there isn't one (data from before manifests)."""
+    path = Path(master_data_dir) / MANIFEST_FILE
+    try:
+        return json.loads(path.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+# --- Arrow IPC snapshots ---------------------------------------------------
+# Uncompressed Arrow IPC (Feather v2) copies of each dataset, derived from the
+# parquet files (which stay the durable format):
+#   Master_Data/snapshots/<dataset>.arrow
+# The dashboard memory-maps them, so a reload is a few page faults instead of
+# decompress + decode, and every worker process on the machine shares the same
+# pages. Each snapshot records the files it was built from (snapshot_source);
+# a missing or stale one is simply rebuilt from parquet. Not committed to git.
+SNAPSHOT_DIR = "snapshots"
+SNAPSHOT_SUFFIX = ".arrow"
+SNAPSHOT_SOURCE_KEY = b"master_data_source"
+
+
+def snapshot_path(name: str, master_data_dir: Path = MASTER_DATA_DIR) -> Path:
+    return Path(master_data_dir) / SNAPSHOT_DIR / f"{name}{SNAPSHOT_SUFFIX}"
+
+
+def snapshot_source(name: str, master_data_dir: Path = MASTER_DATA_DIR, manifest: dict = None) -> str:
+    """
+    Fingerprint of the parquet files behind a dataset: their manifest sha256s, or
+    size + mtime when there is no manifest. None if the dataset has no files.
+    """
+    master_data_dir = Path(master_data_dir)
+    if manifest is not None:
+        parts = [
+            f"{filename}:{info['sha256']}"
+            for filename, info in sorted(manifest["files"].items())
+            if info.get("dataset") == name
+        ]
+    else:
+        parts = []
+        for path in dataset_files(name, master_data_dir):
+            stat = path.stat()
+            parts.append(f"{path.relative_to(master_data_dir).as_posix()}:{stat.st_size}:{stat.st_mtime_ns}")
+    return file_sha256("\n".join(parts).encode()) if parts else None
+
+
+def to_arrow(df: pd.DataFrame) -> pa.Table:
+    """A loaded dataset as an Arrow table, with plain date32 week columns (not dictionaries)."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for col in WEEK_COLUMNS:
+        if col in table.column_names and pa.types.is_dictionary(table.schema.field(col).type):
+            i = table.column_names.index(col)
+            table = table.set_column(i, col, pc.cast(table[col], pa.date32()))
+    return table
+
+
+def write_snapshot(df: pd.DataFrame, name: str, source: str, master_data_dir: Path = MASTER_DATA_DIR) -> Path:
+    """Write a dataset (every column and week) as an uncompressed Arrow IPC file tagged with `source`."""
+    # Plain date32 weeks, so week ranges can be filtered in Arrow
+    table = to_arrow(df)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), SNAPSHOT_SOURCE_KEY: source.encode()})
+
+    path = snapshot_path(name, master_data_dir)
+    path.parent.mkdir(exist_ok=True)
+
+    def write(tmp_path):
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    _replace_atomically(path, write)
+    return path
+
+
+def snapshot_table(name: str, source: str, master_data_dir: Path = MASTER_DATA_DIR) -> pa.Table:
+    """
+    The memory-mapped snapshot of a dataset as an Arrow table (nothing is read until
+    a column is used), or None if there is no snapshot built from `source`.
+    """
+    try:
+        reader = pa.ipc.open_file(pa.memory_map(str(snapshot_path(name, master_data_dir))))
+    except (FileNotFoundError, pa.ArrowInvalid):
+        return None
+    if source is None or (reader.schema.metadata or {}).get(SNAPSHOT_SOURCE_KEY) != source.encode():
+        return None
+    return reader.read_all()
+
+
+def select_table(table: pa.Table, columns=None, weeks=None) -> pa.Table:
+    """
+    Just `columns` (None = all, table order) and the rows whose date32 week_start
+    falls in `weeks` ((first, last), None = all) of an Arrow table.
+    """
+    if columns is not None:
+        table = table.select([col for col in table.column_names if col in columns])
+    if weeks is not None and "week_start" in table.column_names:
+        starts = table["week_start"]
+        table = table.filter(pc.and_(pc.greater_equal(starts, weeks[0]), pc.less_equal(starts, weeks[1])))
+    return table
+
+
+def read_snapshot(name: str, source: str, master_data_dir: Path = MASTER_DATA_DIR, columns=None, weeks=None) -> pd.DataFrame:
+    """
+    A dataset from its memory-mapped snapshot (only `columns`, None = all; only the
+    `weeks` range, None = all), or None if there is no snapshot built from `source`.
+    Numeric and string columns stay backed by the mapped file rather than being copied.
+    """
+    table = snapshot_table(name, source, master_data_dir)
+    if table is None:
+        return None
+    table = select_table(table, columns, weeks)
+    return normalize(table.to_pandas(split_blocks=True), dataset_for(DATASET_FILES[name]))
+
+
+def write_snapshots(master_data_dir: Path = MASTER_DATA_DIR, manifest: dict = None) -> list:
+    """
+    (Re)build the snapshot of every dataset whose files changed since its snapshot
+    was written; returns the paths rebuilt. Call after write_manifest.
+    """
+    paths = []
+    for name in DATASET_FILES:
+        source = snapshot_source(name, master_data_dir, manifest)
+        if source is not None and snapshot_table(name, source, master_data_dir) is None:
+            paths.append(write_snapshot(read_dataset(name, master_data_dir), name, source, master_data_dir))
+    return paths
+
+
+# --- Weekly summary -------------------------------------------------------
+# One row per week with the headline numbers the dashboard shows, plus the same
+# numbers 1/4/13/52 weeks earlier. Written by the updater, read by the dashboard.
+SUMMARY_FILE = DATASET_FILES["summary"]
+
+# summary column -> (source, source column). Outbound/inbound come from the "Totals" row.
+SUMMARY_METRICS = {
+    "touches": ("outbound", "Outbound Communication Count"),
+    "design_appts": ("outbound", "Total Booked"),
+    "inbound_rate": ("inbound", "Inbound Rate Value"),
+    "cost_per_appt": ("roi", "Cost Per Appt"),
+    "amount_invested": ("roi", "Amount Invested"),
+    "leads_generated": ("roi", "# of Leads"),
+    "revenue": ("roi", "Revenue"),
+    "revenue_per_appt": ("roi", "Revenue Per Appt"),
+    "num_appts": ("roi", "# of Appts"),
+}
+SUMMARY_COUNT_METRICS = ("touches", "design_appts")
+
+# "<metric>_<label>_ago" columns hold the value from that many weeks before
+SUMMARY_LAGS = {"1w": 1, "4w": 4, "13w": 13, "52w": 52}
+
+
+def prior_column(metric: str, lag: str = "1w") -> str:
+    """Name of the summary column holding `metric` from `lag` weeks ago."""
+    return f"{metric}_{lag}_ago"
+
+
+def summary_source_columns() -> dict:
+    """Columns build_weekly_summary reads from each dataset: {"calls": (...), "roi": (...)}."""
+    calls_cols = [src_col for src, src_col in SUMMARY_METRICS.values() if src in ("outbound", "inbound")]
+    roi_cols = [src_col for src, src_col in SUMMARY_METRICS.values() if src == "roi"]
+    return {
+        "calls": ("Call Center Rep", "mode", *WEEK_COLUMNS, *dict.fromkeys(calls_cols)),
+        "roi": (*WEEK_COLUMNS, *dict.fromkeys(roi_cols)),
+    }
+
+
+def build_weekly_summary(calls_df: pd.DataFrame, roi_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Build the weekly summary table from the full call center and ROI history.
+    Vectorized: one filter per source, one join, one reindex per lag.
+    """
+    calls_df = normalize(calls_df, "all_call_center_data")
+    roi_df = normalize(roi_df, "all_roi_data")
+    week_cols = list(WEEK_COLUMNS)
+
+    totals = calls_df[calls_df["Call Center Rep"] == "Totals"] if not calls_df.empty else calls_df
+    sources = {
+        "outbound": totals[totals["mode"] == "outbound"] if not totals.empty else totals,
+        "inbound": totals[totals["mode"] == "inbound"] if not totals.empty else totals,
+        "roi": roi_df,
+    }
+
+    parts = []
+    for source, df in sources.items():
+        columns = {src_col: metric for metric, (src, src_col) in SUMMARY_METRICS.items() if src == source}
+        if df.empty or not set(week_cols).issubset(df.columns):
+            continue
+        part = (
+            df.drop_duplicates(week_cols)  # first row wins, same as the per-week lookups
+            .set_index(week_cols)
+            .reindex(columns=list(columns))
+            .rename(columns=columns)
+        )
+        parts.append(part)
+
+    summary = pd.concat(parts, axis=1, join="outer").reset_index() if parts else pd.DataFrame(columns=week_cols)
+    summary = summary.reindex(columns=week_cols + list(SUMMARY_METRICS))
+    summary = summary.sort_values("week_start", kind="stable").drop_duplicates("week_start").reset_index(drop=True)
+
+    for metric in SUMMARY_METRICS:
+        summary[metric] = pd.to_numeric(summary[metric], errors="coerce")
+        summary[metric] = summary[metric].astype("Int64" if metric in SUMMARY_COUNT_METRICS else "float64")
+
+    # Prior values are looked up by calendar week, so gaps in the history stay gaps
+    by_start = summary.set_index("week_start")[list(SUMMARY_METRICS)]
+    for label, weeks_back in SUMMARY_LAGS.items():
+        prior_starts = [ws - timedelta(weeks=weeks_back) for ws in by_start.index]
+        prior = by_start.reindex(prior_starts)
+        for metric in SUMMARY_METRICS:
+            summary[prior_column(metric, label)] = prior[metric].array
+
+    return summary
+
+
+def write_weekly_summary(calls_df: pd.DataFrame, roi_df: pd.DataFrame, master_data_dir: Path = MASTER_DATA_DIR) -> pd.DataFrame:
+    """Rebuild and save weekly_summary.parquet. Call after calls/ROI are saved."""
+    summary = build_weekly_summary(calls_df, roi_df)
+    write_parquet(summary, Path(master_data_dir) / SUMMARY_FILE)
+    return summary
@@ -0,0 +1,161 @@
+# master_history.py
+"""
+Saved versions of Master_Data (instead of hand-copied *_backup_* parquet files).
+
+Every dataset file is stored once, by content hash, in the chunk store:
+    Master_Data/history/chunks/<sha[:2]>/<sha256>.parquet
+In the partitioned layout a file is one week, so saving a version only adds
+the weeks that changed since the last save (compacted.parquet and not yet
+partitioned datasets are one chunk per file). A saved version is a small JSON
+file - the manifest at that point plus an id and a note:
+    Master_Data/history/versions/<YYYYMMDD-HHMMSS>-<data version>.json
+Restoring a version hard-links the files that differ back into place from the
+chunk store and rewrites manifest.json, so a rollback moves no data.
+Chunks are never modified: every Master_Data write replaces files atomically
+(new inode), so a hard-linked chunk can't be changed through the live file.
+"""
+import json
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+from master_data import (
+    DATASET_FILES, MANIFEST_FILE, MASTER_DATA_DIR, _replace_atomically, dataset_dir, dataset_files,
+    file_sha256, read_manifest, write_manifest,
+)
+
+HISTORY_DIR = "history"
+CHUNKS_DIR = "chunks"
+VERSIONS_DIR = "versions"
+
+
+def history_dir(master_data_dir: Path = MASTER_DATA_DIR) -> Path:
+    return Path(master_data_dir) / HISTORY_DIR
+
+
+def chunk_path(sha256: str, master_data_dir: Path = MASTER_DATA_DIR) -> Path:
+    return history_dir(master_data_dir) / CHUNKS_DIR / sha256[:2] / f"{sha256}.parquet"
+
+
+def _place(source: Path, path: Path):
+    """Put `source`'s bytes at `path` (hard link, or a copy across filesystems), swapped in atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    def link(tmp_path):
+        tmp_path.unlink(missing_ok=True)
+        try:
+            os.link(source, tmp_path)
+        except OSError:
+            shutil.copy2(source, tmp_path)
+
+    _replace_atomically(path, link)
+
+
+def list_versions(master_data_dir: Path = MASTER_DATA_DIR) -> list:
+    """Every saved version, oldest first."""
+    versions_dir = history_dir(master_data_dir) / VERSIONS_DIR
+    return [json.loads(path.read_text()) for path in sorted(versions_dir.glob("*.json"))]
+
+
+def find_version(ref: str, master_data_dir: Path = MASTER_DATA_DIR) -> dict:
+    """
+    The saved version whose id (or data version hash) is `ref` or starts with it;
+    "latest" is the newest. Raises KeyError if there is no single match.
+    """
+    versions = list_versions(master_data_dir)
+    if ref == "latest" and versions:
+        return versions[-1]
+    matches = [v for v in versions if v["id"].startswith(ref) or v["version"].startswith(ref)]
+    # The same data can be saved more than once (e.g. before and after a rollback)
+    if len({v["version"] for v in matches}) != 1:
+        raise KeyError(f"{len(matches)} saved versions match {ref!r}")
+    return matches[-1]
+
+
+def save_version(master_data_dir: Path = MASTER_DATA_DIR, note: str = "") -> dict:
+    """
+    Save the current Master_Data (as listed in manifest.json, which is written
+    first if it's missing) as a version. Only files whose content isn't in the
+    chunk store yet are added. If the data is unchanged since the newest saved
+    version, that version is returned and nothing is written.
+    The returned record has "new_chunks": the number of files stored this time.
+    """
+    master_data_dir = Path(master_data_dir)
+    manifest = read_manifest(master_data_dir) or write_manifest(master_data_dir)
+
+    versions = list_versions(master_data_dir)
+    if versions and versions[-1]["version"] == manifest["version"]:
+        return {**versions[-1], "new_chunks": 0}
+
+    new_chunks = 0
+    for filename, info in manifest["files"].items():
+        chunk = chunk_path(info["sha256"], master_data_dir)
+        if chunk.exists():
+            continue
+        path = master_data_dir / filename
+        if file_sha256(path.read_bytes()) != info["sha256"]:
+            raise ValueError(f"{filename} does not match manifest.json - write the manifest before saving")
+        _place(path, chunk)
+        new_chunks += 1
+
+    saved_at = datetime.now()
+    record = {
+        "id": f"{saved_at:%Y%m%d-%H%M%S}-{manifest['version']}",
+        "saved_at": saved_at.isoformat(timespec="seconds"),
+        "note": note,
+        **manifest,
+    }
+    path = history_dir(master_data_dir) / VERSIONS_DIR / f"{record['id']}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _replace_atomically(path, lambda tmp_path: tmp_path.write_text(json.dumps(record, indent=2)))
+    return {**record, "new_chunks": new_chunks}
+
+
+def restore_version(ref: str, master_data_dir: Path = MASTER_DATA_DIR) -> dict:
+    """
+    Make Master_Data match a saved version (see find_version): files that differ
+    are linked back from the chunk store, files the version doesn't have are
+    removed, and manifest.json is rewritten last. The current data is saved
+    first, so a restore can itself be undone.
+    Returns {"restored": version record, "saved": record of the data replaced, "changed": files}.
+    """
+    master_data_dir = Path(master_data_dir)
+    record = find_version(ref, master_data_dir)
+    saved = save_version(master_data_dir, note=f"before restoring {record['id']}")
+    current = read_manifest(master_data_dir)["files"]
+
+    wanted = record["files"]
+    missing = [f for f, info in wanted.items() if not chunk_path(info["sha256"], master_data_dir).exists()]
+    if missing:
+        raise FileNotFoundError(f"{len(missing)} file(s) of {record['id']} are not in the chunk store: {missing[:3]}")
+
+    changed = []
+    for filename, info in wanted.items():
+        if current.get(filename, {}).get("sha256") == info["sha256"] and (master_data_dir / filename).exists():
+            continue
+        _place(chunk_path(info["sha256"], master_data_dir), master_data_dir / filename)
+        changed.append(filename)
+
+    # Files the saved version doesn't have (and partition directories it didn't use)
+    for name in DATASET_FILES:
+        directory = dataset_dir(name, master_data_dir)
+        legacy_path = master_data_dir / DATASET_FILES[name]
+        for path in dataset_files(name, master_data_dir) + [legacy_path]:
+            filename = path.relative_to(master_data_dir).as_posix()
+            if path.exists() and filename not in wanted:
+                path.unlink()
+                changed.append(filename)
+                if path.parent != master_data_dir and not any(path.parent.iterdir()):
+                    path.parent.rmdir()
+        if directory.is_dir() and not any(f.startswith(f"{directory.name}/") for f in wanted):
+            shutil.rmtree(directory)
+
+    manifest = {
+        "version": record["version"],
+        "written_at": datetime.now().isoformat(timespec="seconds"),
+        "files": wanted,
+    }
+    path = master_data_dir / MANIFEST_FILE
+    _replace_atomically(path, lambda tmp_path: tmp_path.write_text(json.dumps(manifest, indent=2)))
+    return {"restored": record, "saved": saved, "changed": changed}
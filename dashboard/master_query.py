@@ -0,0 +1,108 @@
+# master_query.py
+"""
+SQL over Master_Data with an in-process DuckDB engine.
+
+Each dataset is a view over its memory-mapped Arrow snapshot (see master_data),
+so queries see the same typed columns as the dashboard (date week_start /
+week_end, numeric ROI columns) whatever the storage layout, and DuckDB only
+scans the columns and rows a query needs instead of loading pandas frames:
+
+    from master_query import query
+    query('SELECT week_start, sum("Inbound Lead Count") AS leads FROM calls GROUP BY 1 ORDER BY 1')
+
+Views: calls, roi, jobs, rpa, sales, appointments, weekly_summary, plus
+appointment_versions (one row per appointment version with valid_from /
+valid_to, see master_appointments) for "as of week X" pipeline queries.
+Command line: python3 query_master_data.py "SELECT ..."
+"""
+import threading
+from pathlib import Path
+
+import duckdb
+import pandas as pd
+
+from master_appointments import appointment_versions
+from master_data import (
+    MASTER_DATA_DIR, build_weekly_summary, read_dataset, read_manifest, snapshot_source,
+    snapshot_table, to_arrow, write_snapshot,
+)
+
+# SQL view name per dataset
+QUERY_VIEWS = {
+    "jobs": "jobs",
+    "calls": "calls",
+    "roi": "roi",
+    "rpa": "rpa",
+    "sales": "sales",
+    "appts": "appointments",
+    "summary": "weekly_summary",
+}
+# Built from the appointments change log
+VERSIONS_VIEW = "appointment_versions"
+
+# Open connection per Master_Data directory: (data key, connection)
+_connections = {}
+_lock = threading.Lock()
+
+
+def _data_key(master_data_dir: Path) -> tuple:
+    """Changes whenever any dataset's files change (manifest hashes, else size + mtime)."""
+    manifest = read_manifest(master_data_dir)
+    return tuple(snapshot_source(name, master_data_dir, manifest) for name in QUERY_VIEWS)
+
+
+def _dataset_table(name: str, master_data_dir: Path, manifest: dict):
+    """Arrow table for one view; None if the dataset has no files."""
+    if name == "summary" and manifest is None:
+        # Same rule as the dashboard: without a manifest the summary file may not
+        # match the calls/ROI files, so build it from them (it's small)
+        return to_arrow(build_weekly_summary(read_dataset("calls", master_data_dir), read_dataset("roi", master_data_dir)))
+
+    source = snapshot_source(name, master_data_dir, manifest)
+    if source is None:
+        return None
+    table = snapshot_table(name, source, master_data_dir)
+    if table is None:
+        write_snapshot(read_dataset(name, master_data_dir), name, source, master_data_dir)
+        table = snapshot_table(name, source, master_data_dir)
+    return table
+
+
+def connect(master_data_dir: Path = MASTER_DATA_DIR) -> duckdb.DuckDBPyConnection:
+    """A new DuckDB connection with one view per dataset (see QUERY_VIEWS)."""
+    master_data_dir = Path(master_data_dir)
+    manifest = read_manifest(master_data_dir)
+
+    con = duckdb.connect()
+    for name, view in QUERY_VIEWS.items():
+        table = _dataset_table(name, master_data_dir, manifest)
+        if table is not None:
+            con.register(view, table)
+            if name == "appts":
+                con.register(VERSIONS_VIEW, to_arrow(appointment_versions(read_dataset(name, master_data_dir))))
+    return con
+
+
+def query(sql: str, params=None, master_data_dir: Path = MASTER_DATA_DIR) -> pd.DataFrame:
+    """
+    Run `sql` (with `params` for its ? placeholders) and return the result as a DataFrame
+    (DATE columns come back as `date` objects, like the Master_Data loaders).
+    The connection is reused until the data changes.
+    """
+    master_data_dir = Path(master_data_dir)
+    key = _data_key(master_data_dir)
+    with _lock:
+        cached = _connections.get(master_data_dir)
+        if cached is None or cached[0] != key:
+            cached = _connections[master_data_dir] = (key, connect(master_data_dir))
+        return cached[1].execute(sql, params or []).fetch_arrow_table().to_pandas()
+
+
+def describe(master_data_dir: Path = MASTER_DATA_DIR) -> dict:
+    """{view: DataFrame of column names and types} for every dataset with data."""
+    views = query("SELECT table_name FROM information_schema.tables ORDER BY table_name", master_data_dir=master_data_dir)
+    return {
+        view: query(f'DESCRIBE "{view}"', master_data_dir=master_data_dir)
+        for view in views["table_name"]
+        if view in QUERY_VIEWS.values() or view == VERSIONS_VIEW
+    }
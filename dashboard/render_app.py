@@ -9,7 +9,8 @@ from datetime import timedelta
 import math
 import os
 from dash import Dash, dcc, html, dash_table
-from dash.dependencies import Input, Output
+from dash.dependencies import Input, Output, State
+from dash.exceptions import PreventUpdate
 from dashboard_utils import *
 from datetime import datetime
 from pathlib import Path
@@ -32,10 +33,9 @@ MASTER_APPTS_PARQUET = MASTERDATA_DIR / "projections_appointments_data.parquet"
 def get_last_updated():
     """Get the most recent modification time of the parquet files"""
     try:
-        times = []
-        for f in [MASTER_CALLS_PARQUET, MASTER_ROI_PARQUET]:
-            if f.exists():
-                times.append(f.stat().st_mtime)
+        # Each dataset is a single file or a directory of week partitions
+        times = [dataset_mtime(name, MASTERDATA_DIR) for name in ("calls", "roi")]
+        times = [t for t in times if t]
         if times:
             latest = max(times)
             dt = datetime.fromtimestamp(latest)
@@ -49,8 +49,13 @@ last_updated = get_last_updated()
 
 # ─── 1. Instantiate Dash App & Layout ─────────────────────────────────────
 # Load initial data to generate week options (will reload dynamically in callbacks)
-_, calls_df_temp, _ = load_master_data()
-week_options = generate_week_options_from_parquet(calls_df_temp)
+# (only the week columns of the calls file - jobs isn't read at all)
+# (or the pre-rendered weeks, when the payloads match the data - no parquet read)
+# _, calls_df_temp, _ = load_master_data()
+week_options = static_week_options()
+if week_options is None:
+    calls_df_temp = load_view("week_options")["calls"]
+    week_options = generate_week_options_from_parquet(calls_df_temp)
 
 app = Dash(__name__, suppress_callback_exceptions=True)
 
@@ -138,102 +143,157 @@ app.layout = html.Div(
 )
 def _update_dashboard_wrapper(selected_week):
     # Always pass "All" for selected_franchisee (not used anymore)
-    return update_dashboard(selected_week, selected_franchisee="All")
+    # Rendered once per week and data version, shared by every server process
+    return render_dashboard(selected_week)
+
+
+# The chart toggles and metric switches run in the browser (clientside callbacks),
+# so opening / hiding a chart or switching its metric never calls the server.
+# The server is asked once per chart, when its toggle opens it with nothing loaded
+# yet: the line charts get every metric's figure in their dcc.Store, the forecast
+# charts their figure.
+def _toggle_js(label):
+    """Clientside toggle: odd clicks show the chart container, even clicks hide it."""
+    return f"""
+    function(n_clicks) {{
+        var shown = n_clicks % 2 === 1;
+        return [
+            {{"display": shown ? "block" : "none", "marginBottom": "30px"}},
+            shown ? "📉 Hide {label}" : "📈 Show {label}"
+        ];
+    }}
+    """
+
+
+def _lazy_chart_callback(target, toggle_id, load):
+    """
+    Server callback filling `target` ((component id, property)) with load() when its
+    toggle shows the chart and nothing is loaded there yet - so a load that failed or
+    timed out is tried again the next time the chart is opened.
+    """
+    @app.callback(Output(*target), Input(toggle_id, "n_clicks"), State(*target))
+    def load_chart(n_clicks, current):
+        shown = bool(n_clicks) and n_clicks % 2 == 1
+        # An empty dcc.Graph holds nothing or {"data": [], "layout": {}}
+        loaded = bool(current) and bool(current.get("layout", True))
+        if not shown or loaded:
+            raise PreventUpdate
+        return load()
+
+    return load_chart
+
+
+# Shows the selected metric's figure from the chart's dcc.Store
+SWITCH_METRIC_JS = """
+function(selected_metric, figures) {
+    if (!figures || !figures[selected_metric]) {
+        return window.dash_clientside.no_update;
+    }
+    return figures[selected_metric];
+}
+"""
 
 
 # Call Center Chart Toggle Callback
-@app.callback(
+app.clientside_callback(
+    _toggle_js("Trend Chart"),
     [Output("cc-chart-container", "style"),
      Output("cc-chart-toggle", "children")],
     Input("cc-chart-toggle", "n_clicks")
 )
-def toggle_cc_chart(n_clicks):
-    if n_clicks % 2 == 1:  # Odd clicks = show chart
-        return {"display": "block", "marginBottom": "30px"}, "📉 Hide Trend Chart"
-    else:  # Even clicks = hide chart
-        return {"display": "none", "marginBottom": "30px"}, "📈 Show Trend Chart"
+
+
+# Call Center Chart Figures (every metric, when first shown)
+load_cc_chart = _lazy_chart_callback(
+    ("cc-chart-store", "data"), "cc-chart-toggle", lambda: load_trend_figures("cc")
+)
 
 
 # Call Center Metric Selector Callback
-@app.callback(
+app.clientside_callback(
+    SWITCH_METRIC_JS,
     Output("cc-line-chart", "figure"),
-    Input("cc-metric-selector", "value")
+    Input("cc-metric-selector", "value"),
+    Input("cc-chart-store", "data"),
 )
-def update_cc_chart(selected_metric):
-    _, calls_df, _ = load_master_data()
-    return build_call_center_line_chart(calls_df, selected_metric)
 
 
 # Marketing Chart Toggle Callback
-@app.callback(
+app.clientside_callback(
+    _toggle_js("Trend Chart"),
     [Output("mkt-chart-container", "style"),
      Output("mkt-chart-toggle", "children")],
     Input("mkt-chart-toggle", "n_clicks")
 )
-def toggle_mkt_chart(n_clicks):
-    if n_clicks % 2 == 1:  # Odd clicks = show chart
-        return {"display": "block", "marginBottom": "30px"}, "📉 Hide Trend Chart"
-    else:  # Even clicks = hide chart
-        return {"display": "none", "marginBottom": "30px"}, "📈 Show Trend Chart"
+
+
+# Marketing Chart Figures (every metric, when first shown)
+load_mkt_chart = _lazy_chart_callback(
+    ("mkt-chart-store", "data"), "mkt-chart-toggle", lambda: load_trend_figures("mkt")
+)
 
 
 # Marketing Metric Selector Callback
-@app.callback(
+app.clientside_callback(
+    SWITCH_METRIC_JS,
     Output("mkt-line-chart", "figure"),
-    Input("mkt-metric-selector", "value")
+    Input("mkt-metric-selector", "value"),
+    Input("mkt-chart-store", "data"),
 )
-def update_mkt_chart(selected_metric):
-    _, _, roi_df = load_master_data()
-    return build_marketing_line_chart(roi_df, selected_metric)
 
 
 # Finance Chart Toggle Callback
-@app.callback(
+app.clientside_callback(
+    _toggle_js("Trend Chart"),
     [Output("fin-chart-container", "style"),
      Output("fin-chart-toggle", "children")],
     Input("fin-chart-toggle", "n_clicks")
 )
-def toggle_fin_chart(n_clicks):
-    if n_clicks % 2 == 1:  # Odd clicks = show chart
-        return {"display": "block", "marginBottom": "30px"}, "📉 Hide Trend Chart"
-    else:  # Even clicks = hide chart
-        return {"display": "none", "marginBottom": "30px"}, "📈 Show Trend Chart"
+
+
+# Finance Chart Figures (every metric, when first shown)
+load_fin_chart = _lazy_chart_callback(
+    ("fin-chart-store", "data"), "fin-chart-toggle", lambda: load_trend_figures("fin")
+)
 
 
 # Finance Metric Selector Callback
-@app.callback(
+app.clientside_callback(
+    SWITCH_METRIC_JS,
     Output("fin-line-chart", "figure"),
-    Input("fin-metric-selector", "value")
+    Input("fin-metric-selector", "value"),
+    Input("fin-chart-store", "data"),
 )
-def update_fin_chart(selected_metric):
-    _, _, roi_df = load_master_data()
-    return build_finance_line_chart(roi_df, selected_metric)
 
 
 # Appointments Forecast Chart Toggle Callback
-@app.callback(
+app.clientside_callback(
+    _toggle_js("Forecast Chart"),
     [Output("appts-forecast-container", "style"),
      Output("appts-forecast-toggle", "children")],
     Input("appts-forecast-toggle", "n_clicks")
 )
-def toggle_appts_forecast(n_clicks):
-    if n_clicks % 2 == 1:  # Odd clicks = show chart
-        return {"display": "block", "marginBottom": "30px"}, "📉 Hide Forecast Chart"
-    else:  # Even clicks = hide chart
-        return {"display": "none", "marginBottom": "30px"}, "📈 Show Forecast Chart"
+
+
+# Appointments Forecast Chart (built when first shown)
+update_appts_forecast = _lazy_chart_callback(
+    ("appts-forecast-chart", "figure"), "appts-forecast-toggle", lambda: load_trend_chart("appts-forecast")
+)
 
 
 # Revenue Projection Chart Toggle Callback
-@app.callback(
+app.clientside_callback(
+    _toggle_js("Revenue Projection"),
     [Output("revenue-projection-container", "style"),
      Output("revenue-projection-toggle", "children")],
     Input("revenue-projection-toggle", "n_clicks")
 )
-def toggle_revenue_projection(n_clicks):
-    if n_clicks % 2 == 1:  # Odd clicks = show chart
-        return {"display": "block", "marginBottom": "30px"}, "📉 Hide Revenue Projection"
-    else:  # Even clicks = hide chart
-        return {"display": "none", "marginBottom": "30px"}, "📈 Show Revenue Projection"
+
+
+# Revenue Projection Chart (built when first shown)
+update_revenue_projection = _lazy_chart_callback(
+    ("revenue-projection-chart", "figure"), "revenue-projection-toggle", lambda: load_trend_chart("revenue-projection")
+)
 
 
 # ─── 3. Run ─────────────────────────────────────────────────────────────────
@@ -243,5 +303,10 @@ def toggle_revenue_projection(n_clicks):
 
 # UNCOMMENT IF IT IS FOR RENDER
 if __name__ == "__main__":
+    # Have the week the page opens on rendered before the first visitor asks for it
+    # (at server start, not on import; already done when the pre-rendered payloads are served)
+    if load_static_index() is None:
+        prewarm_dashboard(week_options[0]["value"])
+
     port = int(os.environ.get("PORT", 8050))  # Render sets PORT dynamically
     app.run(host="0.0.0.0", port=port, debug=True)
\ No newline at end of file
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Saved versions of Master_Data (see dashboard/master_history.py).
+
+The updater saves a version after every run; each one only stores the week
+files that changed. Restoring one is a rollback of every dataset at once.
+
+Usage: python3 history_master_data.py [list]                 saved versions, oldest first
+       python3 history_master_data.py save [note]            save the current data
+       python3 history_master_data.py restore <id|latest>    roll back (id prefix or data version is enough)
+"""
+import sys
+from pathlib import Path
+
+# Add the dashboard directory to the path (shared Master_Data storage helpers)
+sys.path.insert(0, str(Path(__file__).parent / "dashboard"))
+
+from master_data import MASTER_DATA_DIR, read_manifest
+from master_history import list_versions, restore_version, save_version
+
+
+def print_versions(master_data_dir):
+    versions = list_versions(master_data_dir)
+    if not versions:
+        print("   (no saved versions yet - run: python3 history_master_data.py save)")
+        return
+    manifest = read_manifest(master_data_dir)
+    current = manifest["version"] if manifest else None
+    for record in versions:
+        marker = "👉" if record["version"] == current else "  "
+        weeks = max((info["week_end_max"] or "" for info in record["files"].values()), default="")
+        print(f" {marker} {record['id']}  {len(record['files']):>4} file(s)  last week {weeks or '-':<10}  {record['note']}")
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else "list"
+    master_data_dir = MASTER_DATA_DIR
+
+    print("=" * 60)
+    print("MASTER_DATA HISTORY")
+    print("=" * 60)
+    print(f"📁 {master_data_dir}")
+
+    if command == "list":
+        print_versions(master_data_dir)
+    elif command == "save":
+        note = " ".join(sys.argv[2:]) or "saved by hand"
+        record = save_version(master_data_dir, note)
+        print(f"   💾 {record['id']}: {record['new_chunks']} new file(s) stored")
+    elif command == "restore" and len(sys.argv) > 2:
+        try:
+            result = restore_version(sys.argv[2], master_data_dir)
+        except KeyError as exc:
+            print(f"❌ {exc.args[0]}")
+            sys.exit(1)
+        print(f"   💾 Current data saved as {result['saved']['id']}")
+        print(f"   ⏪ Restored {result['restored']['id']}: {len(result['changed'])} file(s) changed")
+        print("   💡 Push dashboard/Master_Data to GitHub to roll back the live dashboard")
+    else:
+        print(__doc__)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Migrate the Master_Data parquet files to the current storage format.
+
+Safe to run more than once - files that are already migrated are left alone.
+  • week_start / week_end: "MM/DD/YYYY" strings → date32
+  • ROI money/count columns: "$1,234.56" strings → float64
+  • RPA / sales rankings: float64 "<col> Value" companions, integer Rank
+  • mode / Call Center Rep / Location / fetched_at: Arrow dictionary (pandas category)
+  • rows sorted by week_start, one row group per week (for week-range reads)
+  • week-based datasets split into Master_Data/<dataset>/week_start=YYYY-MM-DD/ partitions
+    (the data as it was is saved to Master_Data/history/ first - see history_master_data.py)
+  • future appointments: full weekly copies of the pipeline → changes between fetches
+  • weekly_summary.parquet: (re)built from the call center + ROI data
+  • manifest.json: rewritten for the migrated files
+"""
+import sys
+import pandas as pd
+from pathlib import Path
+
+# Add the dashboard directory to the path (shared Master_Data storage helpers)
+sys.path.insert(0, str(Path(__file__).parent / "dashboard"))
+
+from master_appointments import migrate_appointments
+from master_data import (
+    MASTER_DATA_DIR, PARTITIONED_DATASETS, SUMMARY_FILE, WEEK_COLUMNS, is_date_column, dataset_dir,
+    dataset_for, has_week_row_groups, normalize, partition_dataset, read_dataset, write_parquet,
+    write_weekly_summary, write_manifest,
+)
+
+
+def stored_dtypes(df):
+    """Column dtypes as they round-trip through parquet (week categories come back as plain dates)"""
+    return {col: "object" if col in WEEK_COLUMNS else str(dtype) for col, dtype in df.dtypes.items()}
+
+
+def needs_migration(df, path):
+    """True if normalizing the file would change any column (or its type)"""
+    if any(col in df.columns and not is_date_column(df[col]) for col in WEEK_COLUMNS):
+        return True
+    if not has_week_row_groups(path):
+        return True
+    migrated = normalize(df, dataset_for(path))
+    return list(migrated.columns) != list(df.columns) or stored_dtypes(migrated) != stored_dtypes(df)
+
+
+def migrate_file(path, verbose=True):
+    """Rewrite a single parquet file if it is still in the old format"""
+    df = pd.read_parquet(path)
+
+    if not needs_migration(df, path):
+        if verbose:
+            print(f"   ✅ {path.name}: already up to date")
+        return False
+
+    write_parquet(df, path)
+    if verbose:
+        print(f"   🔄 {path.name}: migrated ({len(df)} rows)")
+    return True
+
+
+def main():
+    master_data_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else MASTER_DATA_DIR
+
+    if not master_data_dir.exists():
+        print(f"❌ Master_Data directory not found at: {master_data_dir}")
+        sys.exit(1)
+
+    print("=" * 60)
+    print("MIGRATE MASTER_DATA PARQUET FILES")
+    print("=" * 60)
+    print(f"📁 {master_data_dir}")
+
+    migrated = 0
+    for path in sorted(master_data_dir.glob("*.parquet")):
+        # Backups stay byte-for-byte as they were
+        if path.name == SUMMARY_FILE or "_backup_" in path.name:
+            continue
+        if migrate_file(path):
+            migrated += 1
+
+    # Week partitions (already written in the current format, but re-check older ones)
+    for name in PARTITIONED_DATASETS:
+        weeks = partition_dataset(name, master_data_dir)
+        if weeks:
+            print(f"   🗂️  {dataset_dir(name, master_data_dir).name}/: split into {weeks} week partition(s)")
+            continue
+        paths = sorted(dataset_dir(name, master_data_dir).glob("**/*.parquet"))
+        if not paths:
+            continue
+        changed = sum(migrate_file(path, verbose=False) for path in paths)
+        migrated += changed
+        print(f"   ✅ {dataset_dir(name, master_data_dir).name}/: {len(paths)} file(s), {changed} migrated")
+
+    # Appointments: one copy of the whole pipeline per week → only what changed
+    snapshots = migrate_appointments(master_data_dir)
+    if snapshots:
+        print(f"   🔁 appointments: {snapshots} weekly fetch(es) stored as changes")
+
+    # The summary is derived data, so always rebuild it from the migrated files
+    calls_df = read_dataset("calls", master_data_dir)
+    roi_df = read_dataset("roi", master_data_dir)
+    if not calls_df.empty and not roi_df.empty:
+        summary_df = write_weekly_summary(calls_df, roi_df, master_data_dir)
+        print(f"   📋 {SUMMARY_FILE}: rebuilt ({len(summary_df)} weeks)")
+
+    manifest = write_manifest(master_data_dir)
+    print(f"   📋 manifest.json: data version {manifest['version']}")
+
+    print(f"\n🎉 Done! {migrated} file(s) migrated.")
+
+
+if __name__ == "__main__":
+    main()
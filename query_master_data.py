@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Run SQL against Master_Data (DuckDB, see dashboard/master_query.py).
+
+Views: calls, roi, jobs, rpa, sales, appointments, weekly_summary - with the
+same typed columns the dashboard uses, whatever the storage layout.
+appointments is the change log between weekly fetches; appointment_versions
+has one row per appointment version with the weeks it was valid for.
+
+Usage: python3 query_master_data.py ["SQL" | file.sql] [master_data_dir] [--csv out.csv]
+  no SQL: list the views and their columns
+
+Example:
+  python3 query_master_data.py "SELECT week_start, sum(\"Inbound Lead Count\") AS leads
+                                FROM calls WHERE mode = 'inbound' GROUP BY 1 ORDER BY 1"
+  python3 query_master_data.py "SELECT Location, count(*) FROM appointment_versions
+                                WHERE valid_from <= DATE '2026-02-01'
+                                  AND (valid_to IS NULL OR valid_to > DATE '2026-02-01')
+                                GROUP BY 1 ORDER BY 2 DESC"
+"""
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Add the dashboard directory to the path (shared Master_Data storage helpers)
+sys.path.insert(0, str(Path(__file__).parent / "dashboard"))
+
+from master_data import MASTER_DATA_DIR
+from master_query import describe, query
+
+# Rows printed to the terminal (use --csv for the full result)
+MAX_ROWS = 200
+
+
+def main():
+    args = sys.argv[1:]
+    csv_path = None
+    if "--csv" in args:
+        i = args.index("--csv")
+        csv_path = Path(args[i + 1])
+        del args[i:i + 2]
+
+    sql = args[0] if args else None
+    master_data_dir = Path(args[1]) if len(args) > 1 else MASTER_DATA_DIR
+
+    if not master_data_dir.exists():
+        print(f"❌ Master_Data directory not found at: {master_data_dir}")
+        sys.exit(1)
+
+    if sql is None:
+        for view, columns in describe(master_data_dir).items():
+            print(f"📋 {view}")
+            for name, column_type in zip(columns["column_name"], columns["column_type"]):
+                print(f"   {name:<40}{column_type}")
+        return
+
+    if sql.endswith(".sql") and Path(sql).exists():
+        sql = Path(sql).read_text()
+
+    result = query(sql, master_data_dir=master_data_dir)
+
+    if csv_path is not None:
+        result.to_csv(csv_path, index=False)
+        print(f"💾 Saved {len(result)} row(s) to {csv_path}")
+        return
+
+    with pd.option_context("display.max_columns", None, "display.width", None):
+        print(result.head(MAX_ROWS).to_string(index=False))
+    if len(result) > MAX_ROWS:
+        print(f"... {len(result) - MAX_ROWS} more row(s) (use --csv to save them all)")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,34 +6,39 @@ import sys
 import pandas as pd
 from pathlib import Path
 
+# Add the dashboard directory to the path (shared Master_Data storage helpers)
+sys.path.insert(0, str(Path(__file__).parent / "dashboard"))
+
+from master_data import (
+    dataset_files, delete_week, read_dataset, write_weekly_summary, write_manifest, to_week_date,
+)
+from master_history import save_version
+
 def remove_week(week_start, week_end):
     """Remove a specific week from both ROI and Call Center data"""
     master_data_dir = Path(__file__).parent / "dashboard" / "Master_Data"
-    roi_path = master_data_dir / "all_roi_data.parquet"
-    calls_path = master_data_dir / "all_call_center_data.parquet"
 
-    if not roi_path.exists():
-        print(f"❌ ROI data file not found at: {roi_path}")
+    if not dataset_files("roi", master_data_dir):
+        print(f"❌ ROI data not found in: {master_data_dir}")
         return False
 
-    if not calls_path.exists():
-        print(f"❌ Call Center data file not found at: {calls_path}")
+    if not dataset_files("calls", master_data_dir):
+        print(f"❌ Call Center data not found in: {master_data_dir}")
         return False
 
-    # Load ROI data
-    roi_df = pd.read_parquet(roi_path)
-    print(f"📊 Current ROI data: {len(roi_df)} rows")
+    # Week columns are stored as dates
+    ws, we = to_week_date(week_start), to_week_date(week_end)
 
-    # Load Call Center data
-    calls_df = pd.read_parquet(calls_path)
-    print(f"📞 Current Call Center data: {len(calls_df)} rows")
+    # Only this week is read (its partition file, or its row group in a single file)
+    roi_df = read_dataset("roi", master_data_dir, weeks=(ws, ws))
+    calls_df = read_dataset("calls", master_data_dir, weeks=(ws, ws))
 
     # Find the week to remove in ROI data
-    roi_mask = (roi_df['week_start'] == week_start) & (roi_df['week_end'] == week_end)
+    roi_mask = (roi_df['week_start'] == ws) & (roi_df['week_end'] == we)
     roi_matching = roi_df[roi_mask]
 
     # Find the week to remove in Call Center data
-    calls_mask = (calls_df['week_start'] == week_start) & (calls_df['week_end'] == week_end)
+    calls_mask = (calls_df['week_start'] == ws) & (calls_df['week_end'] == we)
     calls_matching = calls_df[calls_mask]
 
     if len(roi_matching) == 0 and len(calls_matching) == 0:
@@ -63,29 +68,28 @@ def remove_week(week_start, week_end):
         print("❌ Cancelled - no changes made")
         return False
 
-    # Remove the week from both datasets
-    roi_df_cleaned = roi_df[~roi_mask]
-    calls_df_cleaned = calls_df[~calls_mask]
-
     print(f"\n✅ Removing week {week_start} - {week_end}")
-    print(f"   ROI: {len(roi_df)} → {len(roi_df_cleaned)} rows")
-    print(f"   Calls: {len(calls_df)} → {len(calls_df_cleaned)} rows")
-
-    # Create backups
-    timestamp = week_start.replace('/', '-')
-    roi_backup_path = master_data_dir / f"all_roi_data_backup_{timestamp}.parquet"
-    calls_backup_path = master_data_dir / f"all_call_center_data_backup_{timestamp}.parquet"
-
-    roi_df.to_parquet(roi_backup_path, index=False)
-    calls_df.to_parquet(calls_backup_path, index=False)
-    print(f"\n💾 Backups saved:")
-    print(f"   ROI: {roi_backup_path}")
-    print(f"   Calls: {calls_backup_path}")
-
-    # Save cleaned data
-    roi_df_cleaned.to_parquet(roi_path, index=False)
-    calls_df_cleaned.to_parquet(calls_path, index=False)
-    print(f"\n✅ Cleaned data saved!")
+    print(f"   ROI: {len(roi_matching)} row(s)")
+    print(f"   Calls: {len(calls_matching)} row(s)")
+
+    # Save the current data as a version instead of copying backup files
+    # (only files the history doesn't have yet are stored)
+    # timestamp = week_start.replace('/', '-')
+    # roi_backup_path = master_data_dir / f"all_roi_data_backup_{timestamp}.parquet"
+    # calls_backup_path = master_data_dir / f"all_call_center_data_backup_{timestamp}.parquet"
+    before = save_version(master_data_dir, note=f"before removing week {week_start} - {week_end}")
+    print(f"\n💾 Saved version {before['id']} ({before['new_chunks']} new file(s))")
+
+    # Drop the week's partition from both datasets - no other week is rewritten
+    delete_week("roi", ws, master_data_dir)
+    delete_week("calls", ws, master_data_dir)
+
+    # The summary needs the whole history
+    write_weekly_summary(read_dataset("calls", master_data_dir), read_dataset("roi", master_data_dir), master_data_dir)
+    write_manifest(master_data_dir)
+    after = save_version(master_data_dir, note=f"removed week {week_start} - {week_end}")
+    print(f"\n✅ Cleaned data saved! (version {after['id']})")
+    print(f"⏪ To undo: python3 history_master_data.py restore {before['id']}")
     print(f"🎉 Week {week_start} - {week_end} has been removed from all data sources!")
 
     return True
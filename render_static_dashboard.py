@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Pre-render the dashboard for the data in dashboard/Master_Data (see
+dashboard_utils.write_static_payloads).
+
+Render runs this in the build step (render.yaml), so every deploy serves the
+pages of the data it ships with; the payloads aren't committed. If it can't
+render (no manifest.json yet, or an error), the build still goes ahead and the
+dashboard renders pages live, as it did before.
+
+Usage: python3 render_static_dashboard.py
+"""
+import sys
+from pathlib import Path
+
+# Add the dashboard directory to the path (dashboard builders + Master_Data helpers)
+sys.path.insert(0, str(Path(__file__).parent / "dashboard"))
+
+from dashboard_utils import STATIC_PAYLOAD_DIR, write_static_payloads
+
+
+def main():
+    print("=" * 60)
+    print("PRE-RENDER DASHBOARD")
+    print("=" * 60)
+    print(f"📁 {STATIC_PAYLOAD_DIR}")
+
+    try:
+        index = write_static_payloads()
+    except Exception as exc:
+        print(f"⚠️  Could not pre-render the dashboard: {exc}")
+        index = None
+    if index is None:
+        print("   💡 The dashboard will render pages live")
+        return
+    print(f"   ✅ {index['dashboards']} week(s) + {index['charts']} chart(s) for data version {index['version']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,10 +7,12 @@ from pathlib import Path
 import pandas as pd
 from datetime import datetime, timedelta
 
-# Add the updater directory to the path
+# Add the updater and dashboard directories to the path
 sys.path.insert(0, str(Path(__file__).parent / "updater"))
+sys.path.insert(0, str(Path(__file__).parent / "dashboard"))
 
-from data_fetcher import fetch_roi, get_session_with_canvas_cookie
+from data_fetcher import fetch_roi, get_canvas_client
+from master_data import read_parquet, format_week_date
 
 def get_next_week_dates(last_end_str):
     """
@@ -43,9 +45,9 @@ def main():
         print(f"❌ ROI data file not found at: {roi_path}")
         return
 
-    roi_df = pd.read_parquet(roi_path)
-    last_week_end = roi_df['week_end'].max()
-    last_week_start = roi_df['week_start'].max()
+    roi_df = read_parquet(roi_path)
+    last_week_end = format_week_date(roi_df['week_end'].max())
+    last_week_start = format_week_date(roi_df['week_start'].max())
 
     print(f"\n📊 Current ROI data:")
     print(f"   Total weeks: {len(roi_df)}")
@@ -61,7 +63,8 @@ def main():
 
     # Create a session
     print(f"\n🔐 Loading Canvas session...")
-    session = get_session_with_canvas_cookie()
+    session = get_canvas_client()
+    run_mark = session.mark()
 
     # Call fetch_roi with debug output
     print(f"\n🚀 Calling fetch_roi...")
@@ -77,6 +80,8 @@ def main():
         print(f"   ✅ Data returned:")
         print(result_df.to_string())
 
+    print(f"\n🌐 {session.timing_summary(run_mark)}")
+
     print(f"\n" + "=" * 80)
     print(f"Check the debug HTML file to see what Canvas actually returned!")
     print(f"=" * 80)
@@ -8,11 +8,18 @@ import re
 from io import StringIO
 from pathlib import Path
 from typing import Optional, Tuple
-from urllib.parse import quote_plus
+from urllib.parse import quote_plus, urlparse
 
 import requests
+import threading
+import time
 import pandas as pd
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from fetch_pool import FETCH_WORKERS, canvas_rate_limit
+from response_cache import ResponseCache, cache_ttl, canvas_cache, date_range_ttl, request_key
 
 
 # ─── 0. Cookie Loader ─────────────────────────────────────────────────────────
@@ -91,8 +98,13 @@ def get_session_with_canvas_cookie():
     """
     Load cookies from COOKIE_PATH and return a requests.Session
     that only sets name, value, domain, path, secure, and expires.
+    (The fetchers use the shared get_canvas_client() instead.)
     """
-    with open(str(COOKIE_PATH), "r") as f:
+    return _session_from_cookies(COOKIE_PATH)
+
+
+def _session_from_cookies(cookie_path) -> requests.Session:
+    with open(str(cookie_path), "r") as f:
         raw_cookies = json.load(f)
 
     session = requests.Session()
@@ -118,6 +130,156 @@ def get_session_with_canvas_cookie():
     return session
 
 
+# Seconds to wait for Canvas to connect / to answer (reports can take a while to build)
+CANVAS_TIMEOUT = (10, 120)
+# Attempts after the first on a 5xx, dropped connection or timeout, waiting 1s, 2s, 4s, ...
+CANVAS_RETRIES = 3
+CANVAS_BACKOFF = 1.0
+
+
+class CanvasClient:
+    """
+    The one HTTP client for a whole updater run: cookies loaded once, pooled
+    keep-alive connections (enough for every fetch_pool worker), retries with
+    backoff on 5xx responses / connection errors / timeouts, the per-host rate
+    limit, and a timing record for every request. Reports that can be reused
+    come from the response cache (see response_cache.py) instead of Canvas.
+
+    Drop-in for the requests.Session the fetchers used to take (get / post / cookies).
+    """
+
+    def __init__(self, cookie_path=None, timeout=CANVAS_TIMEOUT, retries: int = CANVAS_RETRIES,
+                 cache: ResponseCache = canvas_cache):
+        self.cookie_path = Path(cookie_path or COOKIE_PATH)
+        self.session = _session_from_cookies(self.cookie_path)
+        self.timeout = timeout
+        self.cache = cache  # None = always ask Canvas
+        # Responses differ per Canvas user, so the cache is keyed by account too
+        self.account = next((c.value for c in self.session.cookies if c.name == "username"), "")
+
+        retry = Retry(
+            total=retries, connect=retries, read=retries, status=retries,
+            backoff_factor=CANVAS_BACKOFF,
+            status_forcelist=(500, 502, 503, 504),
+            # The report form POST only stores the form, so it's safe to repeat
+            allowed_methods=frozenset({"GET", "POST"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(FETCH_WORKERS, 4), max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.timings = []  # (method, path, status, seconds) per request
+        self.cache_lookups = []  # (path, hit) per cacheable request
+        self._lock = threading.Lock()
+
+    @property
+    def cookies(self):
+        return self.session.cookies
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        canvas_rate_limit.wait(url)
+        kwargs.setdefault("timeout", self.timeout)
+        start = time.perf_counter()
+        status = None
+        try:
+            response = self.session.request(method, url, **kwargs)
+            status = response.status_code
+            return response
+        finally:
+            with self._lock:
+                self.timings.append((method, urlparse(url).path, status, time.perf_counter() - start))
+
+    def cached(self, method: str, url: str, params, fetch) -> str:
+        """
+        The response text for a request to url with params: from the cache if it
+        holds a usable copy, else fetch() (which returns the text, or None for a
+        failed request) and save it when cache_ttl allows.
+        """
+        ttl = cache_ttl(url, params) if self.cache is not None else None
+        if ttl is None:
+            return fetch()
+        path = urlparse(url).path
+        key = request_key(method, url, params, self.account)
+        text = self.cache.get(key)
+        with self._lock:
+            self.cache_lookups.append((path, text is not None))
+        if text is not None:
+            return text
+        text = fetch()
+        # Never keep a login page (expired cookies) in place of the report
+        if text is not None and "login required" not in text.lower():
+            self.cache.put(key, text, ttl, label=f"{method} {path}")
+        return text
+
+    def get(self, url: str, params=None, **kwargs) -> requests.Response:
+        fetched = []
+
+        def fetch():
+            fetched.append(self.request("GET", url, params=params, **kwargs))
+            return fetched[0].text if fetched[0].status_code == 200 else None
+
+        text = self.cached("GET", url, params, fetch)
+        return fetched[0] if fetched else _cached_response(url, text)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def mark(self) -> tuple:
+        """Where this run's records start; pass it to timing_summary at the end of the run."""
+        with self._lock:
+            return len(self.timings), len(self.cache_lookups)
+
+    def timing_summary(self, since: tuple = (0, 0)) -> str:
+        """
+        One line for the requests since mark(): count, total / slowest time,
+        failures, and how many cacheable requests the cache answered.
+        """
+        with self._lock:
+            timings = self.timings[since[0]:]
+            lookups = self.cache_lookups[since[1]:]
+        hits = sum(1 for _, hit in lookups if hit)
+        cache_note = f"cache {hits}/{len(lookups)} hit ({hits / len(lookups):.0%})" if lookups else "cache not used"
+        if not timings:
+            return f"no Canvas requests, {cache_note}"
+        total = sum(t[3] for t in timings)
+        slowest = max(timings, key=lambda t: t[3])
+        failed = sum(1 for t in timings if t[2] is None or t[2] >= 400)
+        return (
+            f"{len(timings)} Canvas request(s), {total:.1f}s total, "
+            f"slowest {slowest[3]:.1f}s ({Path(slowest[1]).name}), {failed} failed, {cache_note}"
+        )
+
+
+def _cached_response(url: str, text: str) -> requests.Response:
+    """A 200 response carrying a cached body, for callers expecting session.get()'s result."""
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.encoding = "utf-8"
+    response._content = text.encode("utf-8")
+    response.headers["X-Canvas-Cache"] = "hit"
+    return response
+
+
+_client = {"key": None, "client": None}
+_client_lock = threading.Lock()
+
+
+def get_canvas_client(cookie_path=None) -> CanvasClient:
+    """
+    The shared CanvasClient. A new one is made only when the cookie file changes
+    (the updater app outlives a cookie upload).
+    """
+    path = Path(cookie_path or COOKIE_PATH)
+    key = (str(path), path.stat().st_mtime_ns if path.exists() else None)
+    with _client_lock:
+        if _client["key"] != key:
+            _client["client"] = CanvasClient(path)
+            _client["key"] = key
+        return _client["client"]
+
+
 # ─── 1. JOBS-STATUS SCRAPER ─────────────────────────────────────────────────── (COMMENTED OUT - REMOVED)
 
 # STATUS_FILTERS = {
@@ -234,11 +396,145 @@ CSV_URL = (
     BASE
     + "/scripts/report_as_spreadsheet.html?report=report_lead_to_appointment_conversion"
 )
+ROI_URL = BASE + "/scripts/marketing_roi.html"
+
+# Canvas keeps the last submitted report form in the login's PHP session, and the
+# spreadsheet GET returns whatever that is - so one report's POST + GET must not
+# interleave with another's when weeks are fetched concurrently
+_report_lock = threading.Lock()
+
+
+# ─── Local report CSVs ────────────────────────────────────────────────────────
+# Every conversion report downloaded is kept as Data/<MMDDYYYY>_<MMDDYYYY>_ccNoHs.csv
+# (inbound) or _ccYesHs.csv (outbound, with home shows) and reused the next time
+# the same week is asked for - for good once the week is over, for an hour
+# (RECENT_TTL_SECONDS) while it isn't. Data/index.json lists the files, so a lookup
+# is one dict access; past REPORT_CACHE_MAX_FILES the least recently used go.
+# This is the only cache of the reports (the response cache leaves them alone).
+
+REPORT_DATA_DIR = Path(__file__).parent / "Data"
+REPORT_INDEX_FILE = "index.json"
+# About a year of weeks, inbound + outbound
+REPORT_CACHE_MAX_FILES = 104
+_REPORT_NAME = re.compile(r"^(\d{8})_(\d{8})_(ccNoHs|ccYesHs)\.csv$")
+_report_index_lock = threading.Lock()
+# When reports were last read ({path: time}), kept here and written with the next
+# index save (a new report or an eviction) instead of rewriting index.json per hit
+_report_hits = {}
+
+
+def report_csv_path(start_date: str, end_date: str, include_homeshow: bool = False, data_dir: Path = None) -> Path:
+    """Where the conversion report for a week is kept locally."""
+    a = start_date.replace("/", "")
+    b = end_date.replace("/", "")
+    suf = "ccYesHs" if include_homeshow else "ccNoHs"
+    return Path(data_dir or REPORT_DATA_DIR) / f"{a}_{b}_{suf}.csv"
+
+
+def _report_expires(end_date: str, saved_at: float):
+    ttl = date_range_ttl({"end_date": end_date})
+    return saved_at + ttl if ttl else None
 
 
-def download_conversion_report(start_date: str, end_date: str, include_homeshow: bool = False, out_path: str = None, session: requests.Session = None):
+def _load_report_index(data_dir: Path) -> dict:
+    """
+    Data/index.json (with the reads not saved yet), built once from the report
+    CSVs already there if it's missing.
+    """
+    try:
+        index = json.loads((data_dir / REPORT_INDEX_FILE).read_text())
+        scanned = False
+    except (OSError, ValueError):
+        index, scanned = _scan_report_dir(data_dir), True
+    for name, entry in index.items():
+        entry["last_used"] = max(entry["last_used"], _report_hits.get(data_dir / name, 0))
+    if scanned and index:
+        _save_report_index(index, data_dir)
+    return index
+
+
+def _scan_report_dir(data_dir: Path) -> dict:
+    index = {}
+    for path in data_dir.glob("*.csv") if data_dir.exists() else []:
+        match = _REPORT_NAME.match(path.name)
+        if match:
+            end = match.group(2)
+            saved_at = path.stat().st_mtime
+            index[path.name] = {
+                "saved_at": saved_at,
+                "last_used": saved_at,
+                "expires": _report_expires(f"{end[:2]}/{end[2:4]}/{end[4:]}", saved_at),
+            }
+    return index
+
+
+def _save_report_index(index: dict, data_dir: Path):
+    data_dir.mkdir(parents=True, exist_ok=True)
+    path = data_dir / REPORT_INDEX_FILE
+    tmp_path = path.with_name(f".{REPORT_INDEX_FILE}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(index, indent=1))
+    os.replace(tmp_path, path)
+    for hit in [hit for hit in _report_hits if hit.parent == data_dir]:
+        del _report_hits[hit]
+
+
+def cached_report(start_date: str, end_date: str, include_homeshow: bool = False, data_dir: Path = None):
+    """The locally kept conversion report for a week, or None if there isn't a usable one."""
+    path = report_csv_path(start_date, end_date, include_homeshow, data_dir)
+    with _report_index_lock:
+        index = _load_report_index(path.parent)
+        entry = index.get(path.name)
+        if entry is None:
+            return None
+        now = time.time()
+        if (entry["expires"] and entry["expires"] < now) or not path.exists():
+            index.pop(path.name)
+            path.unlink(missing_ok=True)
+            _save_report_index(index, path.parent)
+            return None
+        _report_hits[path] = now
+        return pd.read_csv(path)
+
+
+def save_report(df: pd.DataFrame, start_date: str, end_date: str, include_homeshow: bool = False, data_dir: Path = None) -> Path:
+    """Keep a downloaded conversion report locally, dropping the least recently used past the limit."""
+    path = report_csv_path(start_date, end_date, include_homeshow, data_dir)
+    with _report_index_lock:
+        index = _load_report_index(path.parent)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_csv(path, index=False)
+        now = time.time()
+        index[path.name] = {"saved_at": now, "last_used": now, "expires": _report_expires(end_date, now)}
+
+        expired = [name for name, entry in index.items() if entry["expires"] and entry["expires"] < now]
+        by_use = sorted((name for name in index if name not in expired), key=lambda name: index[name]["last_used"])
+        for name in expired + by_use[:max(len(by_use) - REPORT_CACHE_MAX_FILES, 0)]:
+            index.pop(name)
+            (path.parent / name).unlink(missing_ok=True)
+        _save_report_index(index, path.parent)
+    return path
+
+
+def _rep_options(df: pd.DataFrame) -> list:
+    return [{"label": "All", "value": "All"}] + [
+        {"label": r, "value": r} for r in df["Call Center Rep"].unique()
+    ]
+
+
+def download_conversion_report(start_date: str, end_date: str, include_homeshow: bool = False, out_path: str = None, session: CanvasClient = None, data_dir: Path = None):
+    """
+    The conversion report for a week: the local copy (see cached_report) if there
+    is one, else downloaded from Canvas and kept locally. With out_path, always
+    downloads and saves the CSV there instead.
+    Returns: (df, dropdown_options)
+    """
+    if out_path is None:
+        cached = cached_report(start_date, end_date, include_homeshow, data_dir)
+        if cached is not None:
+            return cached, _rep_options(cached)
+
     if session is None:
-        session = get_session_with_canvas_cookie()
+        session = get_canvas_client()
 
     payload = {
         "start_date": start_date,
@@ -249,11 +545,12 @@ def download_conversion_report(start_date: str, end_date: str, include_homeshow:
         "submit": "Show Report",
     }
 
-    r1 = session.post(FORM_URL, data=payload, headers={"Referer": FORM_URL})
-    r1.raise_for_status()
+    with _report_lock:
+        r1 = session.post(FORM_URL, data=payload, headers={"Referer": FORM_URL})
+        r1.raise_for_status()
 
-    r2 = session.get(CSV_URL, headers={"Referer": FORM_URL})
-    r2.raise_for_status()
+        r2 = session.get(CSV_URL, headers={"Referer": FORM_URL})
+        r2.raise_for_status()
 
     df = pd.read_csv(StringIO(r2.text))
     df["Inbound Rate Value"] = df["Inbound Help Rate"].str.rstrip("%").astype(float)
@@ -265,72 +562,59 @@ def download_conversion_report(start_date: str, end_date: str, include_homeshow:
 
     rep_reps = df.copy()
 
-    rep_options = [{"label": "All", "value": "All"}] + [
-        {"label": r, "value": r} for r in rep_reps["Call Center Rep"].unique()
-    ]
+    rep_options = _rep_options(rep_reps)
 
-    a = start_date.replace("/", "")
-    b = end_date.replace("/", "")
-    suf = "ccYesHs" if include_homeshow else "ccNoHs"
     if out_path is None:
-        out_path = Path("Data") / f"{a}_{b}_{suf}.csv"
+        save_report(rep_reps, start_date, end_date, include_homeshow, data_dir)
     else:
         out_path = Path(out_path)
-
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-
-    rep_reps.to_csv(out_path, index=False)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        rep_reps.to_csv(out_path, index=False)
     # print(f"✅ Saved report to {out_path}")
 
     return rep_reps, rep_options
 
 
-def load_conversion_data(start_date: str, end_date: str, include_homeshow: bool = False, data_dir: Path = Path("Data")) -> tuple[pd.DataFrame, list]:
+def load_conversion_data(start_date: str, end_date: str, include_homeshow: bool = False, data_dir: Path = None) -> tuple[pd.DataFrame, list]:
     """
-    Builds the file path for inbound/outbound CSV,
+    Looks up the inbound/outbound report in the local report CSVs,
     prints a friendly message, and either loads or downloads it.
     Returns: (df, dropdown_options)
     """
-    token_start = start_date.replace("/", "")
-    token_end = end_date.replace("/", "")
-    mode = "outbound" if include_homeshow else "inbound"
-    fname = f"{token_start}_{token_end}_{mode}.csv"
-    fp = data_dir / fname
-
+    # The file names used to be {start}_{end}_inbound/outbound.csv here, which
+    # download_conversion_report never wrote - both now use report_csv_path()
     if include_homeshow:
         print("→ Looking locally for Outbound Call Center Data…")
     else:
         print("→ Looking locally for Inbound Call Center Data…")
 
-    if not fp.exists():
+    df = cached_report(start_date, end_date, include_homeshow, data_dir)
+    if df is None:
         what = "Outbound" if include_homeshow else "Inbound"
         print(f"   • Downloading {what} Call Center Data from Canvas…")
         df, opts = download_conversion_report(
-            start_date, end_date, include_homeshow=include_homeshow, out_path=str(fp)
+            start_date, end_date, include_homeshow=include_homeshow, data_dir=data_dir
         )
     else:
         print("   • Found it. Loading it in from your computer…\n")
-        df = pd.read_csv(fp)
-        opts = [{"label": "All", "value": "All"}] + [
-            {"label": r, "value": r} for r in df["Call Center Rep"].unique()
-        ]
+        opts = _rep_options(df)
 
     return df, opts
 
 
 # Marekting Pull
-def fetch_roi(start: str, end: str, session: requests.Session) -> pd.DataFrame:
+def fetch_roi(start: str, end: str, session: CanvasClient = None) -> pd.DataFrame:
     print(f"\n{'='*60}")
     print(f"🔍 DEBUG: fetch_roi called with:")
     print(f"   Start date: {start}")
     print(f"   End date: {end}")
     print(f"   Session provided: {session is not None}")
 
-    session = get_session_with_canvas_cookie()
-    print(f"   Session recreated (overwrites passed session)")
+    if session is None:
+        session = get_canvas_client()
     print(f"   Cookies loaded: {len(session.cookies)} cookies")
 
-    url = "https://canvas.artofdrawers.com/scripts/marketing_roi.html"
+    url = ROI_URL
     # hard-coded campaigns; change if you want dynamic
     campaign_ids = [62,59,21,63,64,60,61]
     params = [("campaign_ids[]", cid) for cid in campaign_ids] + [
@@ -481,7 +765,7 @@ def _parse_canvas_tables(html_text: str, debug_label: str = "") -> list:
     return results
 
 
-def fetch_location_rpa(session: requests.Session = None, start_date: str = None, end_date: str = None) -> pd.DataFrame:
+def fetch_location_rpa(session: CanvasClient = None, start_date: str = None, end_date: str = None) -> pd.DataFrame:
     """
     Fetch location Revenue Per Appointment rankings from Canvas.
 
@@ -496,7 +780,7 @@ def fetch_location_rpa(session: requests.Session = None, start_date: str = None,
     print(f"📊 Fetching Location RPA Rankings...")
 
     if session is None:
-        session = get_session_with_canvas_cookie()
+        session = get_canvas_client()
 
     url = "https://canvas.artofdrawers.com/scripts/location_revenue_per_appointment_rankings.html"
 
@@ -574,7 +858,7 @@ def fetch_location_rpa(session: requests.Session = None, start_date: str = None,
     return best_df
 
 
-def fetch_location_sales(session: requests.Session = None, start_date: str = None, end_date: str = None) -> pd.DataFrame:
+def fetch_location_sales(session: CanvasClient = None, start_date: str = None, end_date: str = None) -> pd.DataFrame:
     """
     Fetch location sales rankings from Canvas.
 
@@ -589,7 +873,7 @@ def fetch_location_sales(session: requests.Session = None, start_date: str = Non
     print(f"💰 Fetching Location Sales Rankings...")
 
     if session is None:
-        session = get_session_with_canvas_cookie()
+        session = get_canvas_client()
 
     url = "https://canvas.artofdrawers.com/scripts/location_sales_rankings.html"
 
@@ -669,7 +953,7 @@ def fetch_location_sales(session: requests.Session = None, start_date: str = Non
     return best_df
 
 
-def fetch_future_appointments(session: requests.Session = None) -> pd.DataFrame:
+def fetch_future_appointments(session: CanvasClient = None) -> pd.DataFrame:
     """
     Fetch future design appointments from Canvas.
     Returns DataFrame with one row per future appointment.
@@ -678,7 +962,7 @@ def fetch_future_appointments(session: requests.Session = None) -> pd.DataFrame:
     print(f"📅 Fetching Future Design Appointments...")
 
     if session is None:
-        session = get_session_with_canvas_cookie()
+        session = get_canvas_client()
 
     url = "https://canvas.artofdrawers.com/listappointments.html"
     params = {
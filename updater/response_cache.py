@@ -0,0 +1,171 @@
+# response_cache.py
+"""
+Disk cache for Canvas responses.
+
+A report for a week that has already ended never changes, yet every updater
+run, backfill or test_roi_debug.py download fetched it again. CanvasClient
+looks each cacheable request up here first (keyed by the Canvas account, the
+page and its sorted parameters) and saves what Canvas answered:
+  • reports for a closed date range (end date before today) are kept for good
+  • rolling / open-ended ones (presetdates=l6m, future appointments, the week
+    in progress) expire after RECENT_TTL_SECONDS
+  • only the pages in CACHED_PAGES are cached - other requests always go to
+    Canvas (the conversion reports are kept as CSVs instead, see
+    data_fetcher.cached_report)
+The cache is capped at CACHE_MAX_BYTES; the least recently used responses are
+dropped first. index.json lists every entry so lookups never scan the folder;
+a hit only updates the in-memory index, which the next save writes out.
+
+Delete updater/canvas_cache/ to start over.
+"""
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import date, datetime
+from pathlib import Path
+from urllib.parse import urlencode, urlsplit
+
+CACHE_DIR = Path(__file__).parent / "canvas_cache"
+INDEX_FILE = "index.json"
+# Total size of the cached responses (gzipped) before the least recently used go
+CACHE_MAX_BYTES = 200 * 1024 * 1024
+# How long a response for a rolling or still-open date range is reused
+RECENT_TTL_SECONDS = 60 * 60
+
+# Canvas pages whose response depends only on the request parameters
+CACHED_PAGES = (
+    "/scripts/marketing_roi.html",
+    "/scripts/location_revenue_per_appointment_rankings.html",
+    "/scripts/location_sales_rankings.html",
+    "/listappointments.html",
+)
+# Parameters holding the end of the requested date range (MM/DD/YYYY)
+END_DATE_PARAMS = ("ed", "end_date")
+
+
+def _items(params) -> list:
+    """Request parameters (dict or list of pairs) as sorted (name, value) text pairs."""
+    if not params:
+        return []
+    pairs = params.items() if isinstance(params, dict) else params
+    return sorted((str(name), str(value)) for name, value in pairs)
+
+
+def request_key(method: str, url: str, params=None, account: str = "") -> str:
+    """Cache key for one request: account + method + page + sorted parameters."""
+    parts = urlsplit(url)
+    text = f"{account}|{method.upper()}|{parts.netloc}{parts.path}|{parts.query}|{urlencode(_items(params))}"
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def cache_ttl(url: str, params=None, today: date = None):
+    """
+    How long a response may be reused: None = don't cache, 0 = for good
+    (a closed date range), otherwise seconds.
+    """
+    if urlsplit(url).path not in CACHED_PAGES:
+        return None
+    return date_range_ttl(params, today)
+
+
+def date_range_ttl(params, today: date = None) -> int:
+    """0 (keep for good) if params end before today, else RECENT_TTL_SECONDS."""
+    today = today or date.today()
+    for name, value in _items(params):
+        if name in END_DATE_PARAMS:
+            try:
+                end = datetime.strptime(value, "%m/%d/%Y").date()
+            except ValueError:
+                break
+            return 0 if end < today else RECENT_TTL_SECONDS
+    return RECENT_TTL_SECONDS
+
+
+class ResponseCache:
+    """Gzipped response bodies in `directory`, with an LRU-ordered index; safe across threads."""
+
+    def __init__(self, directory: Path = CACHE_DIR, max_bytes: int = CACHE_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index = None
+
+    def _load_index(self) -> dict:
+        if self._index is None:
+            try:
+                self._index = json.loads((self.directory / INDEX_FILE).read_text())
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def _save_index(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / INDEX_FILE
+        tmp_path = path.with_name(f".{INDEX_FILE}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self._index, indent=1))
+        os.replace(tmp_path, path)
+
+    def _drop(self, key: str):
+        self._index.pop(key, None)
+        (self.directory / f"{key}.gz").unlink(missing_ok=True)
+
+    def get(self, key: str):
+        """The cached text for key, or None if there is none (or it has expired)."""
+        with self._lock:
+            entry = self._load_index().get(key)
+            if entry is None:
+                return None
+            now = time.time()
+            if entry["expires"] and entry["expires"] < now:
+                self._drop(key)
+                self._save_index()
+                return None
+            try:
+                text = gzip.decompress((self.directory / f"{key}.gz").read_bytes()).decode()
+            except OSError:
+                self._drop(key)
+                self._save_index()
+                return None
+            # Kept in memory only; the next put writes it with the index
+            entry["last_used"] = now
+            return text
+
+    def put(self, key: str, text: str, ttl: int, label: str = ""):
+        """Save text under key for ttl seconds (0 = for good), then evict down to max_bytes."""
+        data = gzip.compress(text.encode())
+        with self._lock:
+            index = self._load_index()
+            self.directory.mkdir(parents=True, exist_ok=True)
+            (self.directory / f"{key}.gz").write_bytes(data)
+            now = time.time()
+            index[key] = {
+                "label": label,
+                "bytes": len(data),
+                "stored_at": now,
+                "last_used": now,
+                "expires": now + ttl if ttl else None,
+            }
+            self._evict(now)
+            self._save_index()
+
+    def _evict(self, now: float):
+        for key in [k for k, e in self._index.items() if e["expires"] and e["expires"] < now]:
+            self._drop(key)
+        total = sum(e["bytes"] for e in self._index.values())
+        for key in sorted(self._index, key=lambda k: self._index[k]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            total -= self._index[key]["bytes"]
+            self._drop(key)
+
+    def size(self) -> tuple:
+        """(entries, bytes) currently cached."""
+        with self._lock:
+            index = self._load_index()
+            return len(index), sum(e["bytes"] for e in index.values())
+
+
+canvas_cache = ResponseCache()
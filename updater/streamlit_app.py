@@ -8,6 +8,8 @@ from pathlib import Path
 from datetime import date
 
 from updater_utils import load_master_data, fetch_and_append_week_if_needed, get_last_full_week, append_projections_if_needed
+from master_data import DATASET_FILES, PARTITIONED_DATASETS, dataset_dir, dataset_mtime
+from master_history import history_dir, list_versions
 
 # --- PAGE CONFIG ---
 st.set_page_config(
@@ -130,11 +132,10 @@ def get_last_data_update():
     from datetime import datetime
 
     master_data_dir = Path(__file__).resolve().parent.parent / "dashboard" / "Master_Data"
-    roi_file = master_data_dir / "all_roi_data.parquet"
 
     try:
-        if roi_file.exists():
-            mtime = roi_file.stat().st_mtime
+        mtime = dataset_mtime("roi", master_data_dir)
+        if mtime:
             dt = datetime.fromtimestamp(mtime)
             return dt.strftime("%B %d, %Y at %I:%M %p")
         return "Unknown"
@@ -330,8 +331,8 @@ if valid_cookies:
                 st.write("📊 Current data status:")
                 if not calls_df.empty:
                     import pandas as pd
-                    earliest = pd.to_datetime(calls_df["week_start"]).min().strftime("%m/%d/%Y")
-                    latest_end = calls_df['week_end'].max()
+                    earliest = calls_df["week_start"].min().strftime("%m/%d/%Y")
+                    latest_end = calls_df['week_end'].max().strftime("%m/%d/%Y")
                     st.write(f"• Data range: {earliest} to {latest_end}")
 
                     # Count unique weeks
@@ -342,9 +343,18 @@ if valid_cookies:
                 st.write(f"• Last full week available: {get_last_full_week(date.today())[1]}")
 
                 # Check for missing weeks BEFORE fetching
-                from updater_utils import get_all_missing_weeks
+                from updater_utils import build_coverage_index, missing_weeks_by_dataset, week_strings
                 status.update(label="🔍 Checking for ALL missing weeks (including historical gaps)...")
-                missing_weeks = get_all_missing_weeks(calls_df)
+                # Which weeks each report already has, computed once and shared by both fetch steps
+                coverage = build_coverage_index()
+                missing_by_dataset = missing_weeks_by_dataset(coverage)
+                missing_weeks = [
+                    week_strings(week)
+                    for week in sorted(set().union(*(missing_by_dataset[key] for key in ("calls_inbound", "calls_outbound", "roi"))))
+                ]
+                for key, weeks in missing_by_dataset.items():
+                    if weeks:
+                        st.write(f"• Missing {key}: {len(weeks)} week(s)")
 
                 if missing_weeks:
                     st.warning(f"⚠️ Found **{len(missing_weeks)}** missing week(s) that will be backfilled:")
@@ -358,13 +368,13 @@ if valid_cookies:
                         st.write(f"  ... ({len(missing_weeks) - 10} more weeks) ...")
                         for start, end in missing_weeks[-5:]:
                             st.write(f"  • {start} – {end}")
-                    st.write(f"\n🔄 This will fetch Call Center and ROI data for all {len(missing_weeks)} weeks...")
+                    st.write(f"\n🔄 This will fetch the missing Call Center and ROI reports for these {len(missing_weeks)} weeks...")
                 else:
                     st.success("✅ No missing weeks detected! All historical data is complete.")
 
                 # Fetch and append new data if needed
                 status.update(label=f"📦 Fetching {len(missing_weeks)} missing week(s)..." if missing_weeks else "✅ Data up to date")
-                jobs_df_updated, calls_df_updated, roi_df_updated = fetch_and_append_week_if_needed(jobs_df, calls_df, roi_df)
+                jobs_df_updated, calls_df_updated, roi_df_updated = fetch_and_append_week_if_needed(jobs_df, calls_df, roi_df, coverage)
 
                 # Show what was done
                 if missing_weeks:
@@ -388,7 +398,7 @@ if valid_cookies:
                 st.write("📍 **Fetching Location Performance Data...**")
 
                 try:
-                    rpa_df, sales_df, appts_df = append_projections_if_needed()
+                    rpa_df, sales_df, appts_df = append_projections_if_needed(coverage)
 
                     if not rpa_df.empty or not sales_df.empty or not appts_df.empty:
                         st.markdown(f"""
@@ -427,16 +437,49 @@ if valid_cookies:
                     master_data_dir = Path(__file__).resolve().parent.parent / "dashboard" / "Master_Data"
 
                     # Debug: Show which files are being copied
-                    parquet_files = list(master_data_dir.glob("*.parquet"))
+                    # (not hand-made *_backup_* copies - saved versions live in history/)
+                    parquet_files = [f for f in master_data_dir.glob("*.parquet") if "_backup_" not in f.name]
                     st.write(f"📁 Copying {len(parquet_files)} parquet file(s) from {master_data_dir}")
                     for f in parquet_files:
                         st.write(f"  • {f.name}")
                         shutil.copy(f, dest / f.name)
+
+                    # Week-partitioned datasets are directories: mirror them, so weeks that were
+                    # removed or compacted locally disappear from the repo too
+                    for name in PARTITIONED_DATASETS:
+                        src_dir = dataset_dir(name, master_data_dir)
+                        if not src_dir.is_dir():
+                            # Single file locally (e.g. an older version was restored)
+                            shutil.rmtree(dest / src_dir.name, ignore_errors=True)
+                            continue
+                        st.write(f"  • {src_dir.name}/ ({len(list(src_dir.glob('*/*.parquet')))} week file(s))")
+                        shutil.rmtree(dest / src_dir.name, ignore_errors=True)
+                        shutil.copytree(src_dir, dest / src_dir.name)
+                        # The single-file copy is replaced by the directory
+                        (dest / DATASET_FILES[name]).unlink(missing_ok=True)
+
+                    # Saved versions (history/): chunks never change, so only new ones are copied
+                    history_src = history_dir(master_data_dir)
+                    if history_src.is_dir():
+                        st.write(f"  • {history_src.name}/ ({len(list_versions(master_data_dir))} saved version(s))")
+                        shutil.copytree(
+                            history_src, dest / history_src.name, dirs_exist_ok=True,
+                            copy_function=lambda src, dst: Path(dst).exists() or shutil.copy2(src, dst),
+                        )
+
+                    # Manifest last, so it always describes the files that were copied
+                    manifest_file = master_data_dir / "manifest.json"
+                    if manifest_file.exists():
+                        st.write(f"  • {manifest_file.name}")
+                        shutil.copy(manifest_file, dest / manifest_file.name)
             
                     subprocess.run(["git", "config", "--global", "user.name", "AoD Updater Bot"], check=True)
                     subprocess.run(["git", "config", "--global", "user.email", "updater@app.aod"], check=True)
             
-                    subprocess.run(["git", "add", "dashboard/Master_Data/*.parquet"], cwd=tmp_path, check=True)
+                    # -A so deleted week partitions / replaced single files are committed too
+                    subprocess.run(["git", "add", "-A", "dashboard/Master_Data"], cwd=tmp_path, check=True)
+                    if (dest / "manifest.json").exists():
+                        subprocess.run(["git", "add", "dashboard/Master_Data/manifest.json"], cwd=tmp_path, check=True)
                     
                     # CHECK if there's anything to commit
                     result = subprocess.run(
@@ -1,6 +1,7 @@
 import data_fetcher
 import math
 import re
+import sys
 from datetime import datetime, date, timedelta
 from pathlib import Path
 
@@ -10,6 +11,16 @@ from dash import dash_table, dcc, html
 from functools import lru_cache
 
 from data_fetcher import download_conversion_report, fetch_roi  # removed: load_jobs_data
+from fetch_pool import FETCH_WORKERS, map_in_order
+
+# Storage helpers are shared with the dashboard (dashboard/master_data.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "dashboard"))
+from master_data import (  # noqa: E402
+    DATASET_FILES, read_dataset, write_week, write_weekly_summary, write_manifest, write_snapshots,
+    to_week_date, dataset_for, normalize_numeric_columns, dataset_weeks,
+)
+from master_history import save_version  # noqa: E402
+from master_appointments import appointment_versions, appointments_as_of, write_appointments  # noqa: E402
 
 
 # Helpers
@@ -36,14 +47,11 @@ def load_master_data():
     # master_data_dir = base_dir / "Master_Data"
 
     master_data_dir = Path(__file__).resolve().parent.parent / "dashboard" / "Master_Data"
-    
-    jobs_path  = master_data_dir / "all_jobs_data.parquet"
-    calls_path = master_data_dir / "all_call_center_data.parquet"
-    roi_path   = master_data_dir / "all_roi_data.parquet"
 
-    jobs_df  = pd.read_parquet(jobs_path)
-    calls_df = pd.read_parquet(calls_path)
-    roi_df   = pd.read_parquet(roi_path)
+    # Each dataset is a directory of week partitions (or a single .parquet file before the first update)
+    jobs_df  = read_dataset("jobs", master_data_dir)
+    calls_df = read_dataset("calls", master_data_dir)
+    roi_df   = read_dataset("roi", master_data_dir)
 
     return jobs_df, calls_df, roi_df
     
@@ -71,101 +79,103 @@ def get_last_full_week(for_date: date = None) -> tuple[str, str]:
     return last_sunday.strftime("%m/%d/%Y"), last_saturday.strftime("%m/%d/%Y")
 
 
-def parquet_has_week(df: pd.DataFrame, start: str, end: str) -> bool:
-    return ((df["week_start"] == start) & (df["week_end"] == end)).any()
+# Week coverage the updater keeps complete: {key: (dataset, mode)}
+COVERAGE_DATASETS = {
+    "calls_inbound": ("calls", "inbound"),
+    "calls_outbound": ("calls", "outbound"),
+    "roi": ("roi", None),
+    "rpa": ("rpa", None),
+    "sales": ("sales", None),
+    "appts": ("appts", None),
+}
+# Canvas only returns the future appointments as of today, so past weeks can't be backfilled
+CURRENT_WEEK_ONLY = ("appts",)
+PROJECTION_KEYS = ("rpa", "sales", "appts")
 
 
-def get_all_missing_weeks(df: pd.DataFrame) -> list[tuple[str, str]]:
+def build_coverage_index(master_data_dir: Path = None) -> dict[str, set]:
     """
-    Get ALL missing weeks from the earliest week in the DataFrame to today.
-    This includes any gaps in the historical data, not just recent missing weeks.
-    Returns a list of (start_date, end_date) tuples in chronological order.
+    {key: set of week_start dates} for every entry in COVERAGE_DATASETS, built once
+    from the partition directory names (calls reads only its week_start + mode columns).
     """
-    # Determine the starting point for checking
-    if df.empty or "week_start" not in df.columns:
-        # If no data exists, start from 3 months ago
-        start_from = date.today() - timedelta(weeks=12)
-    else:
-        # Start from the EARLIEST week in the data, not the latest
-        earliest_week_start = pd.to_datetime(df["week_start"]).min()
-        start_from = earliest_week_start.date()
+    if master_data_dir is None:
+        master_data_dir = Path(__file__).resolve().parent.parent / "dashboard" / "Master_Data"
 
-    # Get the most recent complete week
-    current_week_start, current_week_end = get_last_full_week(date.today())
-    current_week_start_date = datetime.strptime(current_week_start, "%m/%d/%Y").date()
+    calls_by_mode = dataset_weeks("calls", master_data_dir, by="mode")
+    coverage = {}
+    for key, (name, mode) in COVERAGE_DATASETS.items():
+        coverage[key] = calls_by_mode.get(mode, set()) if mode else dataset_weeks(name, master_data_dir)
+    return coverage
 
-    # Generate all weeks from start_from to current and check which ones are missing
-    missing_weeks = []
-    week_cursor = start_from
 
-    # Align to Sunday
-    days_since_sunday = (week_cursor.weekday() + 1) % 7
-    if days_since_sunday > 0:
-        week_cursor = week_cursor - timedelta(days=days_since_sunday)
+def week_calendar(first: date, last: date) -> list[date]:
+    """Every Sunday week_start from the week containing `first` through `last`."""
+    first = first - timedelta(days=(first.weekday() + 1) % 7)
+    return [first + timedelta(weeks=i) for i in range((last - first).days // 7 + 1)]
 
-    while week_cursor <= current_week_start_date:
-        week_start = week_cursor
-        week_end = week_cursor + timedelta(days=6)
 
-        start_str = week_start.strftime("%m/%d/%Y")
-        end_str = week_end.strftime("%m/%d/%Y")
-
-        # Check if this week exists in the dataframe
-        if not parquet_has_week(df, start_str, end_str):
-            missing_weeks.append((start_str, end_str))
+def missing_weeks_by_dataset(coverage: dict, today: date = None) -> dict[str, list[date]]:
+    """
+    {key: sorted week_start dates missing} - the expected weekly calendar minus the
+    coverage index. The calendar runs from the dataset's earliest week (12 weeks
+    back if it has none) to the last full week; CURRENT_WEEK_ONLY keys only expect
+    the last full week.
+    """
+    last = to_week_date(get_last_full_week(today or date.today())[0])
+
+    # Both call center modes start from the earliest week of either
+    earliest = {}
+    for key, weeks in coverage.items():
+        name = COVERAGE_DATASETS[key][0]
+        if weeks:
+            earliest[name] = min(min(weeks), earliest.get(name, date.max))
+
+    missing = {}
+    for key, weeks in coverage.items():
+        if key in CURRENT_WEEK_ONLY:
+            first = last
+        else:
+            first = earliest.get(COVERAGE_DATASETS[key][0], last - timedelta(weeks=12))
+        missing[key] = sorted(set(week_calendar(first, last)) - weeks)
+    return missing
 
-        week_cursor = week_cursor + timedelta(days=7)
 
-    return missing_weeks
+def week_strings(week_start: date) -> tuple[str, str]:
+    """(MM/DD/YYYY start, MM/DD/YYYY end) of the week starting on `week_start`, as Canvas takes them."""
+    return week_start.strftime("%m/%d/%Y"), (week_start + timedelta(days=6)).strftime("%m/%d/%Y")
 
 
 def load_projections_data():
     """Load projections parquet files. Returns empty DataFrames if files don't exist yet."""
     master_data_dir = Path(__file__).resolve().parent.parent / "dashboard" / "Master_Data"
-    rpa_path = master_data_dir / "projections_rpa_data.parquet"
-    sales_path = master_data_dir / "projections_sales_data.parquet"
-    appts_path = master_data_dir / "projections_appointments_data.parquet"
 
-    rpa_df = pd.read_parquet(rpa_path) if rpa_path.exists() else pd.DataFrame()
-    sales_df = pd.read_parquet(sales_path) if sales_path.exists() else pd.DataFrame()
-    appts_df = pd.read_parquet(appts_path) if appts_path.exists() else pd.DataFrame()
+    rpa_df = read_dataset("rpa", master_data_dir)
+    sales_df = read_dataset("sales", master_data_dir)
+    appts_df = read_dataset("appts", master_data_dir)
 
     return rpa_df, sales_df, appts_df
 
 
-def fetch_and_save_projections(week_start: str, week_end: str):
+def save_projections_week(session, week_start: str, week_end: str, datasets, master_data_dir: Path, fetched_at: str):
     """
-    Fetch all projections data (RPA rankings, sales rankings, future appointments),
-    merge and save to parquet. Appends to existing data for time-series tracking.
+    Fetch one week's projections data (RPA rankings, sales rankings, future
+    appointments) and write its week partitions. The manifest, snapshots and
+    saved version are left to the caller (see fetch_and_save_projections).
 
     Args:
+        session: Canvas client (data_fetcher.get_canvas_client)
         week_start: Week start date in MM/DD/YYYY format
         week_end: Week end date in MM/DD/YYYY format
-
-    Returns: (rpa_df, sales_df, appointments_df)
+        datasets: which of "rpa", "sales", "appts" to fetch
     """
-    from datetime import datetime as dt
-
-    master_data_dir = Path(__file__).resolve().parent.parent / "dashboard" / "Master_Data"
-    rpa_path = master_data_dir / "projections_rpa_data.parquet"
-    sales_path = master_data_dir / "projections_sales_data.parquet"
-    appts_path = master_data_dir / "projections_appointments_data.parquet"
-
-    print(f"\n🔐 Validating Canvas authentication cookies...")
-    is_valid, message = data_fetcher.validate_canvas_cookies()
-    if not is_valid:
-        print(f"❌ COOKIE VALIDATION FAILED: {message}")
-        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
-    print(f"✅ {message}")
-
-    session = data_fetcher.get_session_with_canvas_cookie()
-    fetched_at = dt.now().strftime("%B %d, %Y at %I:%M %p")
+    # Canvas takes MM/DD/YYYY strings; the parquet files store the week as dates
+    ws, we = to_week_date(week_start), to_week_date(week_end)
 
     # Fetch RPA rankings with date range
-    rpa_df = data_fetcher.fetch_location_rpa(session, week_start, week_end)
+    rpa_df = data_fetcher.fetch_location_rpa(session, week_start, week_end) if "rpa" in datasets else pd.DataFrame()
     if not rpa_df.empty:
-        rpa_df["week_start"] = week_start
-        rpa_df["week_end"] = week_end
+        rpa_df["week_start"] = ws
+        rpa_df["week_end"] = we
         rpa_df["fetched_at"] = fetched_at
         # Normalize location names
         for col in rpa_df.columns:
@@ -174,10 +184,10 @@ def fetch_and_save_projections(week_start: str, week_end: str):
                 break
 
     # Fetch sales rankings with date range
-    sales_df = data_fetcher.fetch_location_sales(session, week_start, week_end)
+    sales_df = data_fetcher.fetch_location_sales(session, week_start, week_end) if "sales" in datasets else pd.DataFrame()
     if not sales_df.empty:
-        sales_df["week_start"] = week_start
-        sales_df["week_end"] = week_end
+        sales_df["week_start"] = ws
+        sales_df["week_end"] = we
         sales_df["fetched_at"] = fetched_at
         # Normalize location names
         for col in sales_df.columns:
@@ -186,10 +196,10 @@ def fetch_and_save_projections(week_start: str, week_end: str):
                 break
 
     # Fetch future appointments
-    appts_df = data_fetcher.fetch_future_appointments(session)
+    appts_df = data_fetcher.fetch_future_appointments(session) if "appts" in datasets else pd.DataFrame()
     if not appts_df.empty:
-        appts_df["week_start"] = week_start
-        appts_df["week_end"] = week_end
+        appts_df["week_start"] = ws
+        appts_df["week_end"] = we
         appts_df["fetched_at"] = fetched_at
         # Normalize location names
         for col in appts_df.columns:
@@ -197,106 +207,170 @@ def fetch_and_save_projections(week_start: str, week_end: str):
                 appts_df[col] = appts_df[col].apply(data_fetcher._normalize_location)
                 break
 
-    # Load existing data and append (time-series mode)
-    existing_rpa = pd.read_parquet(rpa_path) if rpa_path.exists() else pd.DataFrame()
-    existing_sales = pd.read_parquet(sales_path) if sales_path.exists() else pd.DataFrame()
-    existing_appts = pd.read_parquet(appts_path) if appts_path.exists() else pd.DataFrame()
-
-    # Remove any existing data for this week (deduplication) before appending
-    if not existing_rpa.empty and "week_start" in existing_rpa.columns:
-        existing_rpa = existing_rpa[~((existing_rpa["week_start"] == week_start) & (existing_rpa["week_end"] == week_end))]
-    if not existing_sales.empty and "week_start" in existing_sales.columns:
-        existing_sales = existing_sales[~((existing_sales["week_start"] == week_start) & (existing_sales["week_end"] == week_end))]
-    if not existing_appts.empty and "week_start" in existing_appts.columns:
-        existing_appts = existing_appts[~((existing_appts["week_start"] == week_start) & (existing_appts["week_end"] == week_end))]
+    # Parse "$1,234" / "79%" text into float64 "<col> Value" columns once, at ingest
+    if not rpa_df.empty:
+        rpa_df = normalize_numeric_columns(rpa_df, dataset_for(DATASET_FILES["rpa"]))
+    if not sales_df.empty:
+        sales_df = normalize_numeric_columns(sales_df, dataset_for(DATASET_FILES["sales"]))
 
-    # Append new data
+    # Save this week (time-series mode). Each week is its own partition file, so
+    # re-fetching a week just overwrites that file - nothing else is read or rewritten
     if not rpa_df.empty:
-        combined_rpa = pd.concat([existing_rpa, rpa_df], ignore_index=True)
-        combined_rpa.to_parquet(rpa_path, index=False)
-        print(f"\n💾 Saved RPA data: {rpa_path} ({len(rpa_df)} new rows, {len(combined_rpa)} total)")
-    else:
+        rpa_path, = write_week(rpa_df, "rpa", master_data_dir)
+        print(f"\n💾 Saved RPA data: {rpa_path} ({len(rpa_df)} rows)")
+    elif "rpa" in datasets:
         print(f"\n⚠️  RPA data was empty, not saved")
 
     if not sales_df.empty:
-        combined_sales = pd.concat([existing_sales, sales_df], ignore_index=True)
-        combined_sales.to_parquet(sales_path, index=False)
-        print(f"💾 Saved sales data: {sales_path} ({len(sales_df)} new rows, {len(combined_sales)} total)")
-    else:
+        sales_path, = write_week(sales_df, "sales", master_data_dir)
+        print(f"💾 Saved sales data: {sales_path} ({len(sales_df)} rows)")
+    elif "sales" in datasets:
         print(f"⚠️  Sales data was empty, not saved")
 
+    # Appointments are stored as changes since the last fetch (see master_appointments.py),
+    # not as another full copy of the pipeline
     if not appts_df.empty:
-        combined_appts = pd.concat([existing_appts, appts_df], ignore_index=True)
-        combined_appts.to_parquet(appts_path, index=False)
-        print(f"💾 Saved appointments data: {appts_path} ({len(appts_df)} new rows, {len(combined_appts)} total)")
-    else:
+        appts_paths = write_appointments(appts_df, master_data_dir)
+        print(f"💾 Saved appointments data: {len(appts_df)} appointments ({len(appts_paths)} week file(s) written)")
+    elif "appts" in datasets:
         print(f"⚠️  Appointments data was empty, not saved")
 
-    return rpa_df, sales_df, appts_df
 
+def fetch_and_save_projections(weeks: dict):
+    """
+    Fetch the projections data for every week in `weeks` ({week_start date:
+    ["rpa", "sales", "appts"] to fetch}) and append it to Master_Data for
+    time-series tracking. Cookies are checked, and the manifest, snapshots and
+    saved version written, once for the whole run.
 
-def append_projections_if_needed():
+    Returns: the manifest written, or None if the Canvas cookies are invalid
+    """
+    from datetime import datetime as dt
+
+    master_data_dir = Path(__file__).resolve().parent.parent / "dashboard" / "Master_Data"
+
+    print(f"\n🔐 Validating Canvas authentication cookies...")
+    is_valid, message = data_fetcher.validate_canvas_cookies()
+    if not is_valid:
+        print(f"❌ COOKIE VALIDATION FAILED: {message}")
+        return None
+    print(f"✅ {message}")
+
+    session = data_fetcher.get_canvas_client()
+    run_mark = session.mark()
+    fetched_at = dt.now().strftime("%B %d, %Y at %I:%M %p")
+
+    # Oldest week first, the current week last
+    for week, keys in sorted(weeks.items()):
+        week_start, week_end = week_strings(week)
+        print(f"\n📊 Fetching projections data for week {week_start} – {week_end} ({', '.join(keys)})...")
+        save_projections_week(session, week_start, week_end, keys, master_data_dir, fetched_at)
+
+    # Manifest goes last: the dashboard only switches to the new files once it sees this
+    manifest = write_manifest(master_data_dir)
+    print(f"📋 Manifest written: data version {manifest['version']}")
+
+    # Memory-mapped copies for the dashboard (derived - rebuilt there too if missing)
+    snapshots = write_snapshots(master_data_dir, manifest)
+    print(f"🗺️  Arrow snapshots rebuilt: {len(snapshots)} dataset(s)")
+
+    # Saved version for rollbacks (history_master_data.py) - stores only the changed weeks
+    saved = save_version(master_data_dir, note=f"projections update ({len(weeks)} week(s))")
+    print(f"🕓 Saved version {saved['id']} ({saved['new_chunks']} new file(s))")
+    print(f"🌐 {session.timing_summary(run_mark)}")
+
+    return manifest
+
+
+def append_projections_if_needed(coverage: dict = None):
     """
     Check if current week's projections data exists. If not, fetch and append.
-    Returns: (rpa_df, sales_df, appts_df) for the current week
+    Rankings weeks missing since the first fetch are backfilled too; only the
+    missing dataset/week pairs are fetched (see build_coverage_index).
+    Returns: (rpa_df, sales_df, appts_df) saved for the current week
     """
-    # Load existing projections data
-    rpa_df, sales_df, appts_df = load_projections_data()
-
     # Get current week
     current_week_start, current_week_end = get_last_full_week()
 
-    # Check if current week already exists in projections data
-    has_rpa = parquet_has_week(rpa_df, current_week_start, current_week_end) if not rpa_df.empty else False
-    has_sales = parquet_has_week(sales_df, current_week_start, current_week_end) if not sales_df.empty else False
-    has_appts = parquet_has_week(appts_df, current_week_start, current_week_end) if not appts_df.empty else False
+    # Which projection weeks are missing (the current one, plus any rankings gaps)
+    missing = missing_weeks_by_dataset(coverage or build_coverage_index())
+    to_fetch = {}
+    for key in PROJECTION_KEYS:
+        for week in missing[key]:
+            to_fetch.setdefault(week, []).append(key)
 
-    if has_rpa and has_sales and has_appts:
+    if not to_fetch:
         print(f"\n✅ Projections data for week {current_week_start} – {current_week_end} already exists!")
         # Return current week's data
-        current_rpa = rpa_df[(rpa_df["week_start"] == current_week_start) & (rpa_df["week_end"] == current_week_end)]
-        current_sales = sales_df[(sales_df["week_start"] == current_week_start) & (sales_df["week_end"] == current_week_end)]
-        current_appts = appts_df[(appts_df["week_start"] == current_week_start) & (appts_df["week_end"] == current_week_end)]
-        return current_rpa, current_sales, current_appts
+        return load_current_projections(current_week_start, current_week_end)
 
-    print(f"\n📊 Fetching projections data for week {current_week_start} – {current_week_end}...")
+    # Fetch and save the new data (one manifest and saved version for the whole run)
+    fetch_and_save_projections(to_fetch)
 
-    # Fetch and save new data
-    new_rpa, new_sales, new_appts = fetch_and_save_projections(current_week_start, current_week_end)
+    # Whatever was (or already had been) saved for the current week
+    return load_current_projections(current_week_start, current_week_end)
 
-    return new_rpa, new_sales, new_appts
 
+def load_current_projections(week_start: str, week_end: str):
+    """(rpa_df, sales_df, appts_df) saved for one week (appointments: the pipeline as of that week)."""
+    rpa_df, sales_df, appts_df = load_projections_data()
+    ws, we = to_week_date(week_start), to_week_date(week_end)
+    current_rpa = rpa_df[(rpa_df["week_start"] == ws) & (rpa_df["week_end"] == we)] if not rpa_df.empty else rpa_df
+    current_sales = sales_df[(sales_df["week_start"] == ws) & (sales_df["week_end"] == we)] if not sales_df.empty else sales_df
+    current_appts = appointments_as_of(appointment_versions(appts_df), ws)
+    return current_rpa, current_sales, current_appts
+
+
+def fetch_week_reports(start: str, end: str, reports: list, session=None) -> dict:
+    """
+    Download one week's missing reports ("calls_inbound", "calls_outbound", "roi").
+    Returns {"inbound": df, "outbound": df, "roi": df} for the ones asked for.
+    Call reports already kept in updater/Data/ aren't downloaded again (see
+    data_fetcher.cached_report). Safe to run for several weeks at once (see
+    fetch_pool.map_in_order).
+    """
+    week_data = {}
+    for mode, include_homeshow in (("inbound", False), ("outbound", True)):
+        if f"calls_{mode}" in reports:
+            week_data[mode], _ = data_fetcher.download_conversion_report(
+                start, end, include_homeshow=include_homeshow, session=session
+            )
+    if "roi" in reports:
+        week_data["roi"] = data_fetcher.fetch_roi(start, end, session)
+    return week_data
 
-def fetch_and_append_week_if_needed(jobs_df: pd.DataFrame, calls_df: pd.DataFrame, roi_df: pd.DataFrame):
+
+def fetch_and_append_week_if_needed(jobs_df: pd.DataFrame, calls_df: pd.DataFrame, roi_df: pd.DataFrame, coverage: dict = None):
     """
     Fetch and append ALL missing weeks from the earliest data to today.
     This ensures all gaps in the historical data are filled, including:
     - Missing weeks between the earliest and latest data (e.g., Sept-Nov gaps)
     - Missing weeks from the latest data to today
+    Gaps are tracked per report (inbound calls, outbound calls, ROI - see
+    build_coverage_index), and only the missing report/week pairs are fetched.
     """
     # Robust path pointing to top-level Master_Data directory
     base_dir = Path(__file__).resolve().parent.parent / "dashboard" / "Master_Data"
 
-    jobs_path = base_dir / "all_jobs_data.parquet"
-    calls_path = base_dir / "all_call_center_data.parquet"
-    roi_path = base_dir / "all_roi_data.parquet"
-
-    session = data_fetcher.get_session_with_canvas_cookie()
+    session = data_fetcher.get_canvas_client()
+    run_mark = session.mark()
 
     # JOBS DATA FETCHING COMMENTED OUT - REMOVED FROM DASHBOARD
     print(f"⏭️  Skipping Jobs data (feature removed from dashboard)")
 
     # Show current data range
     if not calls_df.empty:
-        earliest = pd.to_datetime(calls_df["week_start"]).min().strftime("%m/%d/%Y")
-        latest = pd.to_datetime(calls_df["week_end"]).max().strftime("%m/%d/%Y")
+        earliest = calls_df["week_start"].min().strftime("%m/%d/%Y")
+        latest = calls_df["week_end"].max().strftime("%m/%d/%Y")
         print(f"\n📊 Current data range: {earliest} to {latest}")
     else:
         print(f"\n📊 No existing data found")
 
     # Get all missing weeks for Call Center data (use calls_df as reference)
     print(f"🔍 Checking for missing weeks from earliest date to today...")
-    missing_weeks = get_all_missing_weeks(calls_df)
+    missing = missing_weeks_by_dataset(coverage or build_coverage_index(base_dir))
+    missing = {key: set(missing[key]) for key in ("calls_inbound", "calls_outbound", "roi")}
+    missing_weeks = [week_strings(week) for week in sorted(set().union(*missing.values()))]
 
     if not missing_weeks:
         print(f"✅ All data is up to date! No missing weeks found.")
@@ -304,7 +378,8 @@ def fetch_and_append_week_if_needed(jobs_df: pd.DataFrame, calls_df: pd.DataFram
 
     print(f"\n📅 Found {len(missing_weeks)} missing week(s) to fetch:")
     for start, end in missing_weeks:
-        print(f"   • {start} – {end}")
+        reports = [key for key, weeks in missing.items() if to_week_date(start) in weeks]
+        print(f"   • {start} – {end} ({', '.join(reports)})")
 
     # VALIDATE COOKIES BEFORE FETCHING
     print(f"\n🔐 Validating Canvas authentication cookies...")
@@ -318,26 +393,40 @@ def fetch_and_append_week_if_needed(jobs_df: pd.DataFrame, calls_df: pd.DataFram
     else:
         print(f"✅ {message}")
 
-    # Fetch each missing week
-    for week_num, (start, end) in enumerate(missing_weeks, 1):
-        print(f"\n📦 Fetching week {week_num}/{len(missing_weeks)}: {start} – {end}")
+    # Only the fetched weeks get written (one partition file per week)
+    new_calls, new_rois = [], []
 
-        # Fetch Call Center data
-        print(f"  📞 Fetching Call Center data...")
-        inbound, _ = data_fetcher.download_conversion_report(start, end, include_homeshow=False)
-        outbound, _ = data_fetcher.download_conversion_report(start, end, include_homeshow=True)
+    # Fetch the weeks concurrently (bounded pool, rate-limited per host - see fetch_pool.py);
+    # the results come back in week order, so everything below runs as it did one week at a time
+    tasks = [
+        (start, end, [key for key, weeks in missing.items() if to_week_date(start) in weeks])
+        for start, end in missing_weeks
+    ]
+    print(f"\n⚡ Fetching {len(tasks)} week(s), up to {FETCH_WORKERS} at a time...")
+    fetched = map_in_order(lambda task: fetch_week_reports(*task, session), tasks)
+
+    for week_num, ((start, end, reports), week_data) in enumerate(zip(tasks, fetched), 1):
+        print(f"\n📦 Week {week_num}/{len(missing_weeks)}: {start} – {end}")
 
-        inbound["mode"] = "inbound"
-        outbound["mode"] = "outbound"
-        for df in [inbound, outbound]:
-            df["week_start"] = start
-            df["week_end"] = end
+        # Call Center data (only the report(s) this week was missing)
+        for mode in ("inbound", "outbound"):
+            if mode not in week_data:
+                continue
+            print(f"  📞 Call Center data ({mode}): {len(week_data[mode])} row(s)")
+            calls = week_data[mode]
+            calls["mode"] = mode
+            calls["week_start"] = to_week_date(start)
+            calls["week_end"] = to_week_date(end)
 
-        calls_df = pd.concat([calls_df, inbound, outbound], ignore_index=True)
+            calls_df = pd.concat([calls_df, calls], ignore_index=True)
+            new_calls.append(calls)
 
-        # Fetch ROI data
-        print(f"  💰 Fetching ROI data...")
-        new_roi = data_fetcher.fetch_roi(start, end, session)
+        if "roi" not in week_data:
+            print(f"  ✅ Week {start} – {end} fetched successfully!")
+            continue
+
+        # ROI data
+        new_roi = week_data["roi"]
 
         # VALIDATION: Check if ROI data is empty or invalid
         if new_roi.empty:
@@ -369,28 +458,37 @@ def fetch_and_append_week_if_needed(jobs_df: pd.DataFrame, calls_df: pd.DataFram
                     except:
                         pass
 
-        new_roi["week_start"] = start
-        new_roi["week_end"] = end
+        # Parse "$1,234.56" text into float64 once, at ingest (the dashboard reads numbers directly)
+        new_roi = normalize_numeric_columns(new_roi, dataset_for(DATASET_FILES["roi"]))
+        new_roi["week_start"] = to_week_date(start)
+        new_roi["week_end"] = to_week_date(end)
 
         roi_df = pd.concat([roi_df, new_roi], ignore_index=True)
+        new_rois.append(new_roi)
 
         print(f"  ✅ Week {start} – {end} fetched successfully!")
 
-    # Save all updated data at once
-    print(f"\n💾 Saving updated data to Parquet files...")
-    print(f"  • Saving Call Center data to: {calls_path}")
-    calls_df.to_parquet(calls_path, index=False)
-    print(f"  • Saving ROI data to: {roi_path}")
+    # Save all new weeks at once (existing weeks are left untouched on disk)
+    print(f"\n💾 Saving new weeks to Parquet partitions...")
+    if new_calls:
+        # A week missing only one mode keeps its other mode's rows
+        new_calls_df = pd.concat(new_calls, ignore_index=True)
+        existing = calls_df.iloc[:len(calls_df) - len(new_calls_df)]
+        week_rows = existing[existing["week_start"].isin(set(new_calls_df["week_start"]))]
+        calls_paths = write_week(pd.concat([week_rows, new_calls_df], ignore_index=True), "calls", base_dir)
+        print(f"  • Saved Call Center data: {len(calls_paths)} week partition(s)")
 
     # FINAL VALIDATION: Check the ROI data we're about to save
     print(f"\n🔍 Final ROI Data Validation:")
     print(f"  Total ROI rows: {len(roi_df)}")
 
     # Check how many rows for the newly added weeks
-    new_roi_rows = roi_df[roi_df['week_start'].isin([w[0] for w in missing_weeks])]
+    new_roi_rows = roi_df[roi_df['week_start'].isin(missing["roi"])]
     print(f"  New ROI rows added: {len(new_roi_rows)}")
 
-    if len(new_roi_rows) == 0:
+    if not missing["roi"]:
+        print(f"  ✅ No ROI weeks were missing")
+    elif len(new_roi_rows) == 0:
         print(f"  ⚠️  WARNING: No new ROI data was added for the missing weeks!")
         print(f"     This likely means all fetch_roi calls returned empty DataFrames.")
         print(f"     Check authentication and Canvas access.")
@@ -402,7 +500,27 @@ def fetch_and_append_week_if_needed(jobs_df: pd.DataFrame, calls_df: pd.DataFram
             sample_data = {col: row[col] for col in sample_cols}
             print(f"     Week {row['week_start']}-{row['week_end']}: {sample_data}")
 
-    roi_df.to_parquet(roi_path, index=False)
+    if new_rois:
+        roi_paths = write_week(pd.concat(new_rois, ignore_index=True), "roi", base_dir)
+        print(f"  • Saved ROI data: {len(roi_paths)} week partition(s)")
+
+    # Rebuild the per-week headline numbers the dashboard reads (weekly_summary.parquet)
+    summary_df = write_weekly_summary(calls_df, roi_df, base_dir)
+    print(f"  • Weekly summary rebuilt: {len(summary_df)} week(s)")
+
+    # Manifest goes last: the dashboard only switches to the new files once it sees this
+    manifest = write_manifest(base_dir)
+    print(f"  • Manifest written: data version {manifest['version']}")
+
+    # Memory-mapped copies for the dashboard (derived - rebuilt there too if missing)
+    snapshots = write_snapshots(base_dir, manifest)
+    print(f"  • Arrow snapshots rebuilt: {len(snapshots)} dataset(s)")
+
+    # Saved version for rollbacks (history_master_data.py) - stores only the changed weeks
+    saved = save_version(base_dir, note=f"weekly update ({len(missing_weeks)} week(s))")
+    print(f"  • Saved version {saved['id']} ({saved['new_chunks']} new file(s))")
+    print(f"  • {session.timing_summary(run_mark)}")
+
     print(f"✅ All {len(missing_weeks)} week(s) saved successfully to Master_Data!")
 
     return jobs_df, calls_df, roi_df